@@ -0,0 +1,24 @@
+"""Click command class that applies the CLI error policy."""
+import click
+
+from CelebiChrono.celebi_cli._result import handle_error
+
+
+class CelebiCommand(click.Command):
+    """Command that reports callback failures the same way for every command.
+
+    Click's own exceptions (usage errors, aborts, exits) pass through
+    unchanged; anything else raised by the callback is printed as
+    ``Error: ...`` on stderr and exits with status 1.
+    """
+
+    def invoke(self, ctx):
+        try:
+            return super().invoke(ctx)
+        except (click.exceptions.ClickException, click.exceptions.Abort,
+                click.exceptions.Exit):
+            raise
+        except ImportError as e:
+            return handle_error(f"Failed to import shell function: {e}")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return handle_error(f"Command failed: {e}")
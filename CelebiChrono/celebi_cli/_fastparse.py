@@ -0,0 +1,140 @@
+"""Click-free dispatch for fixed-shape Celebi CLI commands.
+
+Most commands take a fixed number of positional string arguments and only
+forward them to a function in ``CelebiChrono.interface.shell``. For those,
+building Click contexts and parsing is pure overhead, so ``dispatch`` calls
+the shell function directly. Anything it does not recognise exactly (help,
+options, a wrong argument count, commands not listed in ``SPEC``) is left
+to the Click group, which stays the reference implementation. Commands
+invoked without arguments are covered too, including those whose optional
+arguments then take their defaults (``NO_ARGS``), as are commands that pass
+any number of arguments through (``VARIADIC``).
+"""
+import sys
+
+# Argument count for commands that accept any number of positional args
+VARIADIC = -1
+
+# Command name -> (function in interface.shell, number of positional args)
+SPEC = {
+    # File operations commands
+    "ls": ("ls", VARIADIC),
+    "mv": ("mv", 2),
+    "cp": ("cp", 2),
+    "rm": ("rm", 1),
+    "rmfile": ("rm_file", 1),
+    "mvfile": ("mv_file", 2),
+    "import": ("import_file", 1),
+    "send": ("send", 1),
+    "add-input": ("add_input", 2),
+    "add-source": ("add_source", 1),
+
+    # Object creation commands
+    "create-algorithm": ("mkalgorithm", 1),
+    "create-task": ("mktask", 1),
+    "create-data": ("mkdata", 1),
+    "create-data-list": ("mkdatalist", 1),
+    "mkdir": ("mkdir", 1),
+
+    # Task configuration commands
+    "remove-input": ("remove_input", 1),
+    "add-algorithm": ("add_algorithm", 1),
+    "add-parameter": ("add_parameter", 2),
+    "rm-parameter": ("rm_parameter", 1),
+    "add-parameter-subtask": ("add_parameter_subtask", 3),
+    "set-env": ("set_environment", 1),
+    "set-mem": ("set_memory_limit", 1),
+    "set-descriptor": ("set_descriptor", 1),
+    "add-host": ("add_host", 2),
+    "hosts": ("hosts", 0),
+
+    # Execution management commands
+    "runners": ("runners", 0),
+    "register-runner": ("register_runner", 4),
+    "remove-runner": ("remove_runner", 1),
+    "submit": ("submit", 1),
+    "collect": ("collect", 1),
+    "test": ("test", 0),
+    "purge": ("purge", 0),
+    "purge-old-impressions": ("purge_old_impressions", 0),
+    "collect-outputs": ("collect_outputs", 0),
+    "collect-logs": ("collect_logs", 0),
+    "engine-logs": ("engine_logs", 0),
+
+    # Communication commands
+    "config": ("config", 0),
+    "danger": ("danger_call", 1),
+    "trace": ("trace", 1),
+    "history": ("history", 0),
+    "changes": ("changes", 0),
+    "preshell": ("workaround_preshell", 0),
+    "postshell": ("workaround_postshell", 1),
+    "impress": ("impress", 0),
+    "dite": ("dite", 0),
+    "set-dite": ("set_dite", 1),
+    "request-runner": ("request_runner", 1),
+    "search-impression": ("search_impression", 1),
+
+    # Utility commands
+    "watermark": ("watermark", 0),
+    "doctor": ("doctor", 0),
+    "bookkeep": ("bookkeep", 0),
+    "bookkeep-url": ("bookkeep_url", 0),
+    "successors": ("successors", 0),
+    "predecessors": ("predecessors", 0),
+    "stats-impressions": ("stats_impressions", 0),
+
+    # Visualization commands
+    "view": ("view", 1),
+    "viewurl": ("viewurl", 0),
+}
+
+# Command name -> (function in interface.shell, arguments) for commands whose
+# bare form (no arguments given) calls the shell with fixed values
+NO_ARGS = {
+    # Navigation commands
+    "tree": ("tree", ()),
+    "status": ("status", ()),
+    "navigate": ("navigate", ()),
+    "short-ls": ("short_ls", ("",)),
+    "jobs": ("jobs", ("",)),
+
+    # Execution management commands
+    "submit": ("submit", ("local",)),
+    "collect": ("collect", ("all",)),
+    "log": ("error_log", (0,)),
+
+    # Visualization commands
+    "view": ("view", ("open",)),
+}
+
+# argv strings are never interned; interning both sides lets the dict lookup
+# for a matching command succeed on the identity check.
+SPEC = {sys.intern(name): entry for name, entry in SPEC.items()}
+NO_ARGS = {sys.intern(name): entry for name, entry in NO_ARGS.items()}
+
+
+def dispatch(argv):
+    """Run ``argv`` (without the program name) if it matches ``SPEC``/``NO_ARGS``.
+
+    Returns True when the command was handled here and False when the
+    caller should fall back to the Click group.
+    """
+    if not argv:
+        return False
+    name = sys.intern(argv[0])
+    if len(argv) == 1 and name in NO_ARGS:
+        fn_name, args = NO_ARGS[name]
+    elif name in SPEC:
+        fn_name, argc = SPEC[name]
+        args = argv[1:]
+        if argc not in (len(args), VARIADIC) or any(arg.startswith("-") for arg in args):
+            return False
+    else:
+        return False
+
+    from CelebiChrono.utils.debug_logging import setup_debug_logging
+    from CelebiChrono.celebi_cli.utils import call_shell
+    setup_debug_logging()
+    call_shell(fn_name, args)
+    return True
@@ -0,0 +1,176 @@
+"""Celebi CLI command registry.
+
+Generated by scripts/gen_cli_registry.py -- do not edit by hand.
+"""
+# pylint: disable=line-too-long
+
+# Command name -> (command module, attribute name)
+COMMANDS = {
+    # booking
+    "booking-server": ("CelebiChrono.celebi_cli.commands.booking", "booking_server_command"),
+    "register-booking-server": ("CelebiChrono.celebi_cli.commands.booking", "register_booking_server_command"),
+    "book-reana": ("CelebiChrono.celebi_cli.commands.booking", "book_reana_command"),
+    # communication
+    "config": ("CelebiChrono.celebi_cli.commands.communication", "config_command"),
+    "danger": ("CelebiChrono.celebi_cli.commands.communication", "danger_command"),
+    "history": ("CelebiChrono.celebi_cli.commands.communication", "history_command"),
+    "changes": ("CelebiChrono.celebi_cli.commands.communication", "changes_command"),
+    "preshell": ("CelebiChrono.celebi_cli.commands.communication", "preshell_command"),
+    "postshell": ("CelebiChrono.celebi_cli.commands.communication", "postshell_command"),
+    "impress": ("CelebiChrono.celebi_cli.commands.communication", "impress_command"),
+    "dite": ("CelebiChrono.celebi_cli.commands.communication", "dite_command"),
+    "set-dite": ("CelebiChrono.celebi_cli.commands.communication", "set_dite_command"),
+    "request-runner": ("CelebiChrono.celebi_cli.commands.communication", "request_runner_command"),
+    "search-impression": ("CelebiChrono.celebi_cli.commands.communication", "search_impression_command"),
+    "config-cache-invalidation-mode": ("CelebiChrono.celebi_cli.commands.communication", "config_cache_invalidation_mode_command"),
+    "trace": ("CelebiChrono.celebi_cli.commands.communication", "trace_command"),
+    # execution_management
+    "test": ("CelebiChrono.celebi_cli.commands.execution_management", "test_command"),
+    "runners": ("CelebiChrono.celebi_cli.commands.execution_management", "runners_command"),
+    "register-runner": ("CelebiChrono.celebi_cli.commands.execution_management", "register_runner_command"),
+    "remove-runner": ("CelebiChrono.celebi_cli.commands.execution_management", "remove_runner_command"),
+    "submit": ("CelebiChrono.celebi_cli.commands.execution_management", "submit_command"),
+    "collect": ("CelebiChrono.celebi_cli.commands.execution_management", "collect_command"),
+    "log": ("CelebiChrono.celebi_cli.commands.execution_management", "log_command"),
+    "edit": ("CelebiChrono.celebi_cli.commands.execution_management", "edit_command"),
+    "purge": ("CelebiChrono.celebi_cli.commands.execution_management", "purge_command"),
+    "purge-old-impressions": ("CelebiChrono.celebi_cli.commands.execution_management", "purge_old_impressions_command"),
+    "collect-outputs": ("CelebiChrono.celebi_cli.commands.execution_management", "collect_outputs_command"),
+    "collect-logs": ("CelebiChrono.celebi_cli.commands.execution_management", "collect_logs_command"),
+    "engine-logs": ("CelebiChrono.celebi_cli.commands.execution_management", "engine_logs_command"),
+    # file_operations
+    "ls": ("CelebiChrono.celebi_cli.commands.file_operations", "ls_command"),
+    "mv": ("CelebiChrono.celebi_cli.commands.file_operations", "mv_command"),
+    "cp": ("CelebiChrono.celebi_cli.commands.file_operations", "cp_command"),
+    "rm": ("CelebiChrono.celebi_cli.commands.file_operations", "rm_command"),
+    "rmfile": ("CelebiChrono.celebi_cli.commands.file_operations", "rmfile_command"),
+    "mvfile": ("CelebiChrono.celebi_cli.commands.file_operations", "mvfile_command"),
+    "import": ("CelebiChrono.celebi_cli.commands.file_operations", "import_command"),
+    "send": ("CelebiChrono.celebi_cli.commands.file_operations", "send_command"),
+    "add-input": ("CelebiChrono.celebi_cli.commands.file_operations", "add_input_command"),
+    "add-source": ("CelebiChrono.celebi_cli.commands.file_operations", "add_source_command"),
+    # navigation
+    "cd": ("CelebiChrono.celebi_cli.commands.navigation", "cd_command"),
+    "tree": ("CelebiChrono.celebi_cli.commands.navigation", "tree_command"),
+    "status": ("CelebiChrono.celebi_cli.commands.navigation", "status_command"),
+    "navigate": ("CelebiChrono.celebi_cli.commands.navigation", "navigate_command"),
+    "cdproject": ("CelebiChrono.celebi_cli.commands.navigation", "cdproject_command"),
+    "short-ls": ("CelebiChrono.celebi_cli.commands.navigation", "short_ls_command"),
+    "jobs": ("CelebiChrono.celebi_cli.commands.navigation", "jobs_command"),
+    "project-uuid": ("CelebiChrono.celebi_cli.commands.navigation", "project_uuid_command"),
+    # object_creation
+    "create-algorithm": ("CelebiChrono.celebi_cli.commands.object_creation", "create_algorithm_command"),
+    "create-task": ("CelebiChrono.celebi_cli.commands.object_creation", "create_task_command"),
+    "create-data": ("CelebiChrono.celebi_cli.commands.object_creation", "create_data_command"),
+    "create-data-list": ("CelebiChrono.celebi_cli.commands.object_creation", "create_data_list_command"),
+    "mkdir": ("CelebiChrono.celebi_cli.commands.object_creation", "mkdir_command"),
+    "use-data": ("CelebiChrono.celebi_cli.commands.object_creation", "use_data_command"),
+    # task_configuration
+    "remove-input": ("CelebiChrono.celebi_cli.commands.task_configuration", "remove_input_command"),
+    "add-algorithm": ("CelebiChrono.celebi_cli.commands.task_configuration", "add_algorithm_command"),
+    "add-parameter": ("CelebiChrono.celebi_cli.commands.task_configuration", "add_parameter_command"),
+    "rm-parameter": ("CelebiChrono.celebi_cli.commands.task_configuration", "rm_parameter_command"),
+    "add-parameter-subtask": ("CelebiChrono.celebi_cli.commands.task_configuration", "add_parameter_subtask_command"),
+    "set-env": ("CelebiChrono.celebi_cli.commands.task_configuration", "set_env_command"),
+    "set-mem": ("CelebiChrono.celebi_cli.commands.task_configuration", "set_mem_command"),
+    "set-descriptor": ("CelebiChrono.celebi_cli.commands.task_configuration", "set_descriptor_command"),
+    "add-host": ("CelebiChrono.celebi_cli.commands.task_configuration", "add_host_command"),
+    "hosts": ("CelebiChrono.celebi_cli.commands.task_configuration", "hosts_command"),
+    # utilities
+    "watermark": ("CelebiChrono.celebi_cli.commands.utilities", "watermark_command"),
+    "doctor": ("CelebiChrono.celebi_cli.commands.utilities", "doctor_command"),
+    "bookkeep": ("CelebiChrono.celebi_cli.commands.utilities", "bookkeep_command"),
+    "bookkeep-url": ("CelebiChrono.celebi_cli.commands.utilities", "bookkeep_url_command"),
+    "successors": ("CelebiChrono.celebi_cli.commands.utilities", "successors_command"),
+    "predecessors": ("CelebiChrono.celebi_cli.commands.utilities", "predecessors_command"),
+    "stats-impressions": ("CelebiChrono.celebi_cli.commands.utilities", "stats_impressions_command"),
+    "gc-impressions": ("CelebiChrono.celebi_cli.commands.utilities", "gc_impressions_command"),
+    "pack-impressions": ("CelebiChrono.celebi_cli.commands.utilities", "pack_impressions_command"),
+    "migrate-impressions": ("CelebiChrono.celebi_cli.commands.utilities", "migrate_impressions_command"),
+    # visualization
+    "view": ("CelebiChrono.celebi_cli.commands.visualization", "view_command"),
+    "viewurl": ("CelebiChrono.celebi_cli.commands.visualization", "viewurl_command"),
+    "imgcat": ("CelebiChrono.celebi_cli.commands.visualization", "imgcat_command"),
+    "draw-dag": ("CelebiChrono.celebi_cli.commands.visualization", "draw_dag_command"),
+}
+
+# Command name -> summary shown in the command list
+SHORT_HELP = {
+    "booking-server": "Check the registered booking server URL and status.",
+    "register-booking-server": "Register REANA server and token with Yuki for booking.",
+    "book-reana": "Book the current project to REANA as a file catalog via Yuki.",
+    "config": "Configure settings.",
+    "danger": "Execute dangerous operation.",
+    "history": "Show history.",
+    "changes": "Show changes.",
+    "preshell": "Pre-shell workaround.",
+    "postshell": "Post-shell workaround.",
+    "impress": "Show impression.",
+    "dite": "Show DITE information.",
+    "set-dite": "Set DITE connection URL.",
+    "request-runner": "Request a runner for current task.",
+    "search-impression": "Search impressions by partial UUID.",
+    "config-cache-invalidation-mode": "Show or set the local cache invalidation mode for the current project.",
+    "trace": "Trace object to its source impression and show DAG differences.",
+    "test": "Test execution management functions.",
+    "runners": "Display all available runners.",
+    "register-runner": "Register a new runner with DITE.",
+    "remove-runner": "Remove a runner from DITE.",
+    "submit": "Submit current task for execution.",
+    "collect": "Collect task execution results.",
+    "log": "View error log for the current task.",
+    "edit": "Edit a script file.",
+    "purge": "Purge temporary files and cleanup current object.",
+    "purge-old-impressions": "Purge old impression data from current object.",
+    "collect-outputs": "Collect only task outputs.",
+    "collect-logs": "Collect only task logs.",
+    "engine-logs": "Fetch and display engine logs for the current task.",
+    "ls": "List directory contents.",
+    "mv": "Move file or directory.",
+    "cp": "Copy file or directory.",
+    "rm": "Remove file or directory.",
+    "rmfile": "Remove file.",
+    "mvfile": "Move file.",
+    "import": "Import file.",
+    "send": "Send file.",
+    "add-input": "Add input to task.",
+    "add-source": "Add a source file or directory to current object.",
+    "cd": "Change directory within project.",
+    "tree": "Show tree view.",
+    "status": "Show status.",
+    "navigate": "Change to current project directory.",
+    "cdproject": "Change to project directory.",
+    "short-ls": "Short listing.",
+    "jobs": "Show jobs.",
+    "project-uuid": "Print the current project's UUID.",
+    "create-algorithm": "Create algorithm.",
+    "create-task": "Create task.",
+    "create-data": "Create data.",
+    "create-data-list": "Create data list.",
+    "mkdir": "Create directory.",
+    "use-data": "Adopt a Yuki impression as a rawdata task in the current project.",
+    "remove-input": "Remove input from task.",
+    "add-algorithm": "Add algorithm to task.",
+    "add-parameter": "Add parameter to task.",
+    "rm-parameter": "Remove parameter from task.",
+    "add-parameter-subtask": "Add parameter subtask to task.",
+    "set-env": "Set environment for task.",
+    "set-mem": "Set memory limit for task.",
+    "set-descriptor": "Set descriptor for task or algorithm.",
+    "add-host": "Add host for task execution.",
+    "hosts": "List available hosts.",
+    "watermark": "Show watermark of current object.",
+    "doctor": "Run diagnostics on current object.",
+    "bookkeep": "Perform project-wide impression bookkeeping.",
+    "bookkeep-url": "Get the bookkeeping URL.",
+    "successors": "List successors of current object.",
+    "predecessors": "List predecessors of current object.",
+    "stats-impressions": "Show impression storage stats and dedup indicators.",
+    "gc-impressions": "Garbage collect unreachable CAS impression objects.",
+    "pack-impressions": "Evaluate packing thresholds for CAS impression objects.",
+    "migrate-impressions": "Migrate legacy impressions into CAS-backed refs.",
+    "view": "View impressions for current task in browser.",
+    "viewurl": "Get the impression URL for current task.",
+    "imgcat": "Display image file inline in terminal from dite.",
+    "draw-dag": "Draw project dependency DAG using Graphviz.",
+}
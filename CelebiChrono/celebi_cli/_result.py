@@ -0,0 +1,49 @@
+"""Result and error reporting shared by the Celebi CLI command modules."""
+import sys
+
+
+def _write_chunks(chunks):
+    """Write the strings in ``chunks`` and a closing newline to stdout.
+
+    Results can be large, so this skips ``print``'s per-call text layer and
+    hands each encoded chunk straight to the binary buffer as it is
+    produced, instead of joining the whole output first. Nothing, not even
+    the newline, is written if every chunk is empty. ``sys.stdout`` is
+    looked up on every call because test runners and callers may replace
+    it; streams without a binary buffer get the text through their own
+    ``write``.
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    wrote = False
+    if buffer is None:
+        for chunk in chunks:
+            if chunk:
+                stream.write(chunk)
+                wrote = True
+        if wrote:
+            stream.write("\n")
+        return
+    stream.flush()
+    encoding = stream.encoding or "utf-8"
+    errors = stream.errors or "strict"
+    for chunk in chunks:
+        if chunk:
+            buffer.write(chunk.encode(encoding, errors))
+            wrote = True
+    if wrote:
+        buffer.write(b"\n")
+        if stream.line_buffering:
+            buffer.flush()
+
+
+def handle_result(result):
+    """Print the formatted result of a shell function, if any."""
+    from CelebiChrono.celebi_cli.utils import format_chunks
+    _write_chunks(format_chunks(result))
+
+
+def handle_error(error):
+    """Report a command error on stderr and exit with status 1."""
+    print(f"Error: {error}", file=sys.stderr)
+    sys.exit(1)
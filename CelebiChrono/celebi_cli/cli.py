@@ -1,13 +1,146 @@
-"""Celebi CLI main entry point for command grouping."""
+"""Celebi CLI main entry point for command grouping.
+
+Commands are registered by name in ``COMMANDS`` (generated into
+``_registry`` by ``scripts/gen_cli_registry.py``) and their modules are only
+imported when Click resolves them, so ``celebi-cli <subcommand>`` loads a
+single command module instead of all of them; ``--help`` lists commands
+from the summaries stored alongside the registry. The ``main`` entry point
+goes one step further and runs fixed-shape commands without Click at all
+(see ``_fastparse``).
+"""
+import importlib
 import os
+import sys
+import threading
+from collections.abc import MutableMapping
 import click
 from CelebiChrono.utils.debug_logging import setup_debug_logging
-from .commands import (
-    navigation, file_operations, object_creation, task_configuration,
-    execution_management, communication, visualization, utilities, booking
-)
+from CelebiChrono.celebi_cli._registry import COMMANDS, SHORT_HELP
+from CelebiChrono.celebi_cli.utils import shell_module
+
+
+class LazyCommands(MutableMapping):
+    """Command mapping for a Click group that imports modules on lookup.
+
+    Membership tests and iteration only consult the registry; the command
+    module is imported the first time a command object is requested.
+    """
+
+    def __init__(self, registry):
+        self._registry = registry
+        self._loaded = {}
+
+    def __getitem__(self, name):
+        command = self._loaded.get(name)
+        if command is None:
+            module_name, attr_name = self._registry[name]
+            module = importlib.import_module(module_name)
+            command = getattr(module, attr_name)
+            self._loaded[name] = command
+        return command
+
+    def __setitem__(self, name, command):
+        self._loaded[name] = command
+
+    def __delitem__(self, name):
+        del self._loaded[name]
+
+    def __contains__(self, name):
+        return name in self._loaded or name in self._registry
+
+    def __iter__(self):
+        yield from self._registry
+        for name in self._loaded:
+            if name not in self._registry:
+                yield name
+
+    def __len__(self):
+        return len(self._registry) + sum(
+            1 for name in self._loaded if name not in self._registry
+        )
+
+
+def _shorten(text, limit):
+    """Fit a one-line summary into ``limit`` columns the way Click does."""
+    if len(text) <= limit:
+        return text
+    words = text.split()
+    length = -1
+    kept = 0
+    for word in words:
+        if length + 1 + len(word) + len("...") > limit:
+            break
+        length += 1 + len(word)
+        kept += 1
+    return " ".join(words[:kept]) + "..."
+
+
+class LazyGroup(click.Group):
+    """Click group that lists registered commands without importing them."""
+
+    def resolve_command(self, ctx, args):
+        # Overlap the shell import with importing and parsing the command,
+        # unless the command is only asked for its help text
+        if _needs_shell(args[0]) and not any(
+                arg in ctx.help_option_names for arg in args[1:]):
+            _warm_shell()
+        return super().resolve_command(ctx, args)
 
-@click.group()
+    def format_commands(self, ctx, formatter):
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in SHORT_HELP:
+                rows.append((name, SHORT_HELP[name]))
+                continue
+            command = self.get_command(ctx, name)
+            if command is not None and not command.hidden:
+                rows.append((name, command))
+        if not rows:
+            return
+        limit = formatter.width - 6 - max(len(name) for name, _ in rows)
+        rows = [
+            (name, _shorten(text, limit) if isinstance(text, str)
+             else text.get_short_help_str(limit))
+            for name, text in rows
+        ]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+# Command modules that never touch CelebiChrono.interface.shell
+_SHELL_FREE_MODULES = frozenset({"CelebiChrono.celebi_cli.commands.booking"})
+
+
+_warmup_started = threading.Event()
+
+
+def _warm_shell():
+    """Start importing ``interface.shell`` on a daemon thread (once).
+
+    The import then overlaps with resolving and parsing the subcommand; the
+    command's own ``shell_module()`` call waits on the import lock if it is
+    still running. Failures are ignored here and surface again, with the
+    usual error reporting, when the command imports the module itself.
+    """
+    if _warmup_started.is_set():
+        return
+    _warmup_started.set()
+
+    def target():
+        try:
+            shell_module()
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+    threading.Thread(target=target, name="celebi-shell-warmup", daemon=True).start()
+
+
+def _needs_shell(name):
+    """Return True if the registered command ``name`` imports the shell."""
+    entry = COMMANDS.get(name)
+    return entry is not None and entry[0] not in _SHELL_FREE_MODULES
+
+
+@click.group(cls=LazyGroup, commands=LazyCommands(COMMANDS))
 @click.option("--debug", is_flag=True, default=False,
               help="Enable debug logging to ~/.celebi/logs/celebi.log")
 def cli(debug):
@@ -16,97 +149,17 @@ def cli(debug):
         os.environ["CELEBI_DEBUG"] = "1"
     setup_debug_logging()
 
-# Commands will be registered here
-cli.add_command(navigation.cd_command)
-cli.add_command(navigation.tree_command)
-cli.add_command(navigation.status_command)
-cli.add_command(navigation.navigate_command)
-cli.add_command(navigation.cdproject_command)
-cli.add_command(navigation.short_ls_command)
-cli.add_command(navigation.jobs_command)
-cli.add_command(navigation.project_uuid_command)
-
-# File operations commands (9 commands)
-cli.add_command(file_operations.ls_command)
-cli.add_command(file_operations.mv_command)
-cli.add_command(file_operations.cp_command)
-cli.add_command(file_operations.rm_command)
-cli.add_command(file_operations.rmfile_command)
-cli.add_command(file_operations.mvfile_command)
-cli.add_command(file_operations.import_command)
-cli.add_command(file_operations.send_command)
-cli.add_command(file_operations.add_input_command)
-cli.add_command(file_operations.add_source_command)
-
-# Object creation commands (6 commands)
-cli.add_command(object_creation.create_algorithm_command)
-cli.add_command(object_creation.create_task_command)
-cli.add_command(object_creation.create_data_command)
-cli.add_command(object_creation.create_data_list_command)
-cli.add_command(object_creation.mkdir_command)
-cli.add_command(object_creation.use_data_command)
-
-# Task configuration commands (9 commands)
-cli.add_command(task_configuration.remove_input_command)
-cli.add_command(task_configuration.add_algorithm_command)
-cli.add_command(task_configuration.add_parameter_command)
-cli.add_command(task_configuration.rm_parameter_command)
-cli.add_command(task_configuration.add_parameter_subtask_command)
-cli.add_command(task_configuration.set_env_command)
-cli.add_command(task_configuration.set_mem_command)
-cli.add_command(task_configuration.set_descriptor_command)
-cli.add_command(task_configuration.add_host_command)
-cli.add_command(task_configuration.hosts_command)
-
-# Execution management commands
-cli.add_command(execution_management.runners_command)
-cli.add_command(execution_management.register_runner_command)
-cli.add_command(execution_management.remove_runner_command)
-cli.add_command(execution_management.submit_command)
-cli.add_command(execution_management.collect_command)
-cli.add_command(execution_management.log_command)
-cli.add_command(execution_management.edit_command)
-cli.add_command(execution_management.test_command)
-cli.add_command(execution_management.purge_command)
-cli.add_command(execution_management.purge_old_impressions_command)
-cli.add_command(execution_management.collect_outputs_command)
-cli.add_command(execution_management.collect_logs_command)
-cli.add_command(execution_management.engine_logs_command)
-
-# Communication commands
-cli.add_command(communication.config_command)
-cli.add_command(communication.config_cache_invalidation_mode_command)
-cli.add_command(communication.danger_command)
-cli.add_command(communication.trace_command)
-cli.add_command(communication.history_command)
-cli.add_command(communication.changes_command)
-cli.add_command(communication.preshell_command)
-cli.add_command(communication.postshell_command)
-cli.add_command(communication.impress_command)
-cli.add_command(communication.dite_command)
-cli.add_command(communication.set_dite_command)
-cli.add_command(communication.request_runner_command)
-cli.add_command(communication.search_impression_command)
-
-# Visualization commands
-cli.add_command(visualization.view_command)
-cli.add_command(visualization.viewurl_command)
-cli.add_command(visualization.imgcat_command)
-cli.add_command(visualization.draw_dag_command)
-
-# Utility commands
-cli.add_command(utilities.watermark_command)
-cli.add_command(utilities.doctor_command)
-cli.add_command(utilities.bookkeep_command)
-cli.add_command(utilities.bookkeep_url_command)
-cli.add_command(utilities.predecessors_command)
-cli.add_command(utilities.successors_command)
-cli.add_command(utilities.gc_impressions_command)
-cli.add_command(utilities.pack_impressions_command)
-cli.add_command(utilities.migrate_impressions_command)
-cli.add_command(utilities.stats_impressions_command)
-
-# Booking commands
-cli.add_command(booking.booking_server_command)
-cli.add_command(booking.register_booking_server_command)
-cli.add_command(booking.book_reana_command)
+
+# Stripped under -O; guards against commands being registered on top of the
+# generated registry (e.g. a stray cli.add_command) at import time.
+if __debug__:
+    assert len(cli.commands) == len(COMMANDS), "duplicate CLI command registration"
+
+
+def main():
+    """Entry point for ``celebi-cli``: fast path first, Click otherwise."""
+    from CelebiChrono.celebi_cli._fastparse import dispatch
+    argv = sys.argv[1:]
+    if dispatch(argv):
+        return
+    cli()  # pylint: disable=no-value-for-parameter
@@ -1 +1,19 @@
-"""Celebi CLI commands package."""
+"""Celebi CLI commands package.
+
+The helpers shared by the command modules are re-exported here, so each
+module pulls them from its own package with a single import statement.
+"""
+from CelebiChrono.celebi_cli._command import CelebiCommand
+from CelebiChrono.celebi_cli._result import handle_error, handle_result
+from CelebiChrono.celebi_cli.utils import (
+    format_output, shell, shell_command,
+)
+
+__all__ = [
+    "CelebiCommand",
+    "format_output",
+    "handle_error",
+    "handle_result",
+    "shell",
+    "shell_command",
+]
@@ -1,17 +1,12 @@
 """Booking commands for celebi-cli."""
 import click
 
-from CelebiChrono.interface.shell_modules.reana_booking import (
-    register_booking_server,
-    book_reana,
-    check_booking_server,
-)
-
 
 @click.command(name="booking-server")
 def booking_server_command():
     """Check the registered booking server URL and status."""
     try:
+        from CelebiChrono.interface.shell_modules.reana_booking import check_booking_server
         result = check_booking_server()
         if result.messages:
             print(result.colored())
@@ -31,6 +26,7 @@ def register_booking_server_command(server_url, access_token):
     can be run without specifying --server and --token.
     """
     try:
+        from CelebiChrono.interface.shell_modules.reana_booking import register_booking_server
         result = register_booking_server(
             server_url=server_url,
             access_token=access_token,
@@ -61,6 +57,7 @@ def book_reana_command(server_url, access_token, project_path, insecure, stageou
     previously registered via 'register-booking-server'.
     """
     try:
+        from CelebiChrono.interface.shell_modules.reana_booking import book_reana
         result = book_reana(
             server_url=server_url,
             access_token=access_token,
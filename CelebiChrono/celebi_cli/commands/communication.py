@@ -1,35 +1,33 @@
 """Communication commands for Celebi CLI."""
+from __future__ import annotations
+
 import os
-import sys
-from typing import Optional, Any
 import click
-from CelebiChrono.celebi_cli.utils import format_output
-from CelebiChrono.utils import csys, metadata
-
-
-def _handle_result(result: Optional[Any]) -> None:
-    """Handle result from shell function."""
-    output = format_output(result)
-    if output:
-        print(output)
-
-
-def _handle_error(error: str) -> None:
-    """Handle error from shell function."""
-    print(f"Error: {error}", file=sys.stderr)
-    sys.exit(1)
-
+from CelebiChrono.celebi_cli.commands import (
+    handle_error as _handle_error, shell_command,
+)
 
-@click.command(name="config")
-def config_command() -> None:
-    """Configure settings."""
-    try:
-        from CelebiChrono.interface.shell import config
-        _handle_result(config())
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
+# Commands that only forward their positional arguments to interface.shell:
+# shell_command(command name, shell function, help text, *argument names)
+config_command = shell_command("config", "config", "Configure settings.")
+danger_command = shell_command(
+    "danger", "danger_call", "Execute dangerous operation.", "operation")
+history_command = shell_command("history", "history", "Show history.")
+changes_command = shell_command("changes", "changes", "Show changes.")
+preshell_command = shell_command(
+    "preshell", "workaround_preshell", "Pre-shell workaround.")
+postshell_command = shell_command(
+    "postshell", "workaround_postshell", "Post-shell workaround.", "command")
+impress_command = shell_command("impress", "impress", "Show impression.")
+dite_command = shell_command("dite", "dite", "Show DITE information.")
+set_dite_command = shell_command(
+    "set-dite", "set_dite", "Set DITE connection URL.", "url")
+request_runner_command = shell_command(
+    "request-runner", "request_runner", "Request a runner for current task.",
+    "runner")
+search_impression_command = shell_command(
+    "search-impression", "search_impression",
+    "Search impressions by partial UUID.", "partial_uuid")
 
 
 @click.command(name="config-cache-invalidation-mode")
@@ -38,8 +36,10 @@ def config_command() -> None:
     required=False,
     type=click.Choice(["auto", "mtime", "off"], case_sensitive=False),
 )
-def config_cache_invalidation_mode_command(mode: Optional[str]) -> None:
+def config_cache_invalidation_mode_command(mode: str | None) -> None:
     """Show or set the local cache invalidation mode for the current project."""
+    from CelebiChrono.utils import csys, metadata
+
     project_root = csys.project_path(os.getcwd())
     if not project_root:
         _handle_error("Not inside a Celebi project")
@@ -68,22 +68,8 @@ def config_cache_invalidation_mode_command(mode: Optional[str]) -> None:
     )
 
 
-@click.command(name="danger")
-@click.argument("operation", type=str)
-def danger_command(operation: str) -> None:
-    """Execute dangerous operation."""
-    try:
-        from CelebiChrono.interface.shell import danger_call
-        _handle_result(danger_call(operation))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="trace")
-@click.argument("obj", type=str)
-def trace_command(obj: str) -> None:
+trace_command = shell_command(
+    "trace", "trace",
     """Trace object to its source impression and show DAG differences.
 
     Compares the current dependency DAG with the DAG stored in the impression
@@ -100,130 +86,5 @@ def trace_command(obj: str) -> None:
     Examples:
         celebi trace abc123-def456-ghi789
         celebi trace impression_2024_01_15
-    """
-    try:
-        from CelebiChrono.interface.shell import trace
-        _handle_result(trace(obj))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="history")
-def history_command() -> None:
-    """Show history."""
-    try:
-        from CelebiChrono.interface.shell import history
-        _handle_result(history())
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="changes")
-def changes_command() -> None:
-    """Show changes."""
-    try:
-        from CelebiChrono.interface.shell import changes
-        result = changes()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="preshell")
-def preshell_command() -> None:
-    """Pre-shell workaround."""
-    try:
-        from CelebiChrono.interface.shell import workaround_preshell
-        result = workaround_preshell()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="postshell")
-@click.argument("command", type=str)
-def postshell_command(command: str) -> None:
-    """Post-shell workaround."""
-    try:
-        from CelebiChrono.interface.shell import workaround_postshell
-        _handle_result(workaround_postshell(command))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="impress")
-def impress_command() -> None:
-    """Show impression."""
-    try:
-        from CelebiChrono.interface.shell import impress
-        result = impress()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="dite")
-def dite_command() -> None:
-    """Show DITE information."""
-    try:
-        from CelebiChrono.interface.shell import dite
-        result = dite()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="set-dite")
-@click.argument("url", type=str)
-def set_dite_command(url: str) -> None:
-    """Set DITE connection URL."""
-    try:
-        from CelebiChrono.interface.shell import set_dite
-        result = set_dite(url)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="request-runner")
-@click.argument("runner", type=str)
-def request_runner_command(runner: str) -> None:
-    """Request a runner for current task."""
-    try:
-        from CelebiChrono.interface.shell import request_runner
-        result = request_runner(runner)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="search-impression")
-@click.argument("partial_uuid", type=str)
-def search_impression_command(partial_uuid: str) -> None:
-    """Search impressions by partial UUID."""
-    try:
-        from CelebiChrono.interface.shell import search_impression
-        result = search_impression(partial_uuid)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
+    """,
+    "obj")
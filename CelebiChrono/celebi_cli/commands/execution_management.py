@@ -1,27 +1,15 @@
 """Execution management commands for Celebi CLI."""
 import os
-import sys
-import subprocess
-from typing import Optional, Any
 import click
-from CelebiChrono.celebi_cli.utils import format_output
+from CelebiChrono.celebi_cli.commands import (
+    CelebiCommand, handle_error as _handle_error, shell, shell_command,
+)
 
 
-def _handle_result(result: Optional[Any]) -> None:
-    """Handle result from shell function."""
-    output = format_output(result)
-    if output:
-        print(output)
-
-
-def _handle_error(error: str) -> None:
-    """Handle error from shell function."""
-    print(f"Error: {error}", file=sys.stderr)
-    sys.exit(1)
-
-
-@click.command(name="test")
-def test_command() -> None:
+# Commands that only forward their positional arguments to interface.shell:
+# shell_command(command name, shell function, help text, *arguments)
+test_command = shell_command(
+    "test", "test",
     """Test execution management functions.
 
     Run a specified command inside a Docker container using the given Docker image.
@@ -31,19 +19,10 @@ def test_command() -> None:
 
     Note:
         This is a placeholder function for testing purposes and may not be fully implemented.
-    """
-    try:
-        from CelebiChrono.interface.shell import test
-        result = test()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="runners")
-def runners_command() -> None:
+    """)
+
+runners_command = shell_command(
+    "runners", "runners",
     """Display all available runners.
 
     Retrieves and displays information about all task execution runners
@@ -55,23 +34,10 @@ def runners_command() -> None:
 
     Note:
         Requires DITE connection to be established.
-    """
-    try:
-        from CelebiChrono.interface.shell import runners
-        result = runners()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="register-runner")
-@click.argument("name", type=str)
-@click.argument("url", type=str)
-@click.argument("secret", type=str)
-@click.argument("backend_type", type=str)
-def register_runner_command(name: str, url: str, secret: str, backend_type: str) -> None:
+    """)
+
+register_runner_command = shell_command(
+    "register-runner", "register_runner",
     """Register a new runner with DITE.
 
     Registers a task execution runner with the Distributed Task Execution
@@ -88,19 +54,11 @@ def register_runner_command(name: str, url: str, secret: str, backend_type: str)
         - URL must be accessible from DITE server
         - Secret is used for secure communication
         - Backend type determines execution environment
-    """
-    try:
-        from CelebiChrono.interface.shell import register_runner
-        _handle_result(register_runner(name, url, secret, backend_type))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="remove-runner")
-@click.argument("runner", type=str)
-def remove_runner_command(runner: str) -> None:
+    """,
+    "name", "url", "secret", "backend_type")
+
+remove_runner_command = shell_command(
+    "remove-runner", "remove_runner",
     """Remove a runner from DITE.
 
     Unregisters a task execution runner from the Distributed Task Execution
@@ -114,78 +72,45 @@ def remove_runner_command(runner: str) -> None:
         - Removal affects future task submissions
         - Currently executing tasks may be affected
         - Requires appropriate permissions in DITE
-    """
-    try:
-        from CelebiChrono.interface.shell import remove_runner
-        _handle_result(remove_runner(runner))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="submit")
-@click.argument("runner", type=str, default="local", required=False)
-def submit_command(runner: str) -> None:
+    """,
+    "runner")
+
+submit_command = shell_command(
+    "submit", "submit",
     """Submit current task for execution.
 
     Sends the current task to a runner for processing. The runner executes
     the task's algorithm with the specified inputs and parameters.
 
     RUNNER is the name of the execution environment to use (defaults to "local").
-    """
-    try:
-        from CelebiChrono.interface.shell import submit
-        result = submit(runner)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="collect")
-@click.argument("contents", type=str, default="all", required=False)
-def collect_command(contents: str) -> None:
+    """,
+    click.Argument(["runner"], default="local", required=False))
+
+collect_command = shell_command(
+    "collect", "collect",
     """Collect task execution results.
 
     Retrieves outputs, logs, or both from a completed task execution.
     Results are gathered from the runner and made available locally.
 
     CONTENTS specifies what to collect: "all", "outputs", or "logs" (default: "all").
-    """
-    try:
-        from CelebiChrono.interface.shell import collect
-        result = collect(contents)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="log")
-@click.argument("index", type=int, default=0, required=False)
-def log_command(index: int) -> None:
+    """,
+    click.Argument(["contents"], default="all", required=False))
+
+log_command = shell_command(
+    "log", "error_log",
     """View error log for the current task.
 
     Retrieves error log entries for the current object. Error logs
     capture execution failures, warnings, and diagnostic information.
 
     INDEX specifies which log entry to retrieve (default: 0 for most recent).
-    """
-    try:
-        from CelebiChrono.interface.shell import error_log
-        result = error_log(index)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="edit")
-@click.argument("script", type=str)
+    """,
+    click.Argument(["index"], type=int, default=0, required=False))
+
+
+@click.command(name="edit", cls=CelebiCommand)
+@click.argument("script")
 def edit_command(script: str) -> None:
     """Edit a script file.
 
@@ -194,28 +119,22 @@ def edit_command(script: str) -> None:
 
     SCRIPT is the name of the script file to edit.
     """
-    try:
-        from CelebiChrono.interface.shell import get_script_path
-        from CelebiChrono.utils import metadata
-
-        result = get_script_path(script)
-        if not result.success:
-            _handle_error(result.messages[0][0] if result.messages else "Script not found")
-            return
-
-        file_path = result.data["path"]
-        config_path = os.path.join(os.environ["HOME"], ".celebi", "config.yaml")
-        yaml_file = metadata.YamlFile(config_path)
-        editor = yaml_file.read_variable("editor", "vi")
-        subprocess.call([editor, file_path])
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="purge")
-def purge_command() -> None:
+    import subprocess
+    from CelebiChrono.utils import metadata
+
+    result = shell.get_script_path(script)
+    if not result.success:
+        _handle_error(result.messages[0][0] if result.messages else "Script not found")
+
+    file_path = result.data["path"]
+    config_path = os.path.join(os.environ["HOME"], ".celebi", "config.yaml")
+    yaml_file = metadata.YamlFile(config_path)
+    editor = yaml_file.read_variable("editor", "vi")
+    subprocess.call([editor, file_path])
+
+
+purge_command = shell_command(
+    "purge", "purge",
     """Purge temporary files and cleanup current object.
 
     Removes temporary files, cache data, and other non-essential artifacts
@@ -226,19 +145,10 @@ def purge_command() -> None:
         The exact behavior depends on the object type.
         Some objects may have protected data that cannot be purged.
         Use with caution as purged data cannot be recovered.
-    """
-    try:
-        from CelebiChrono.interface.shell import purge
-        result = purge()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="purge-old-impressions")
-def purge_old_impressions_command() -> None:
+    """)
+
+purge_old_impressions_command = shell_command(
+    "purge-old-impressions", "purge_old_impressions",
     """Purge old impression data from current object.
 
     Removes historical impression data that is no longer needed, preserving
@@ -249,19 +159,10 @@ def purge_old_impressions_command() -> None:
         The age threshold for 'old' impressions is configurable.
         Some impression data may be protected from deletion.
         Helps manage storage usage for long-running projects.
-    """
-    try:
-        from CelebiChrono.interface.shell import purge_old_impressions
-        result = purge_old_impressions()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="collect-outputs")
-def collect_outputs_command() -> None:
+    """)
+
+collect_outputs_command = shell_command(
+    "collect-outputs", "collect_outputs",
     """Collect only task outputs.
 
     Retrieves output files and data from a completed task execution,
@@ -271,19 +172,10 @@ def collect_outputs_command() -> None:
         - The current object must be a task
         - Task must have been submitted and completed
         - Output files are downloaded from the runner to local storage
-    """
-    try:
-        from CelebiChrono.interface.shell import collect_outputs
-        result = collect_outputs()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="collect-logs")
-def collect_logs_command() -> None:
+    """)
+
+collect_logs_command = shell_command(
+    "collect-logs", "collect_logs",
     """Collect only task logs.
 
     Retrieves log files from a completed task execution,
@@ -293,19 +185,10 @@ def collect_logs_command() -> None:
         - The current object must be a task
         - Task must have been submitted and completed
         - Log files are downloaded from the runner to local storage
-    """
-    try:
-        from CelebiChrono.interface.shell import collect_logs
-        result = collect_logs()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="engine-logs")
-def engine_logs_command() -> None:
+    """)
+
+engine_logs_command = shell_command(
+    "engine-logs", "engine_logs",
     """Fetch and display engine logs for the current task.
 
     Retrieves documented engine logs from the DITE server for the current
@@ -313,12 +196,4 @@ def engine_logs_command() -> None:
     execution environment, workflow engine operations, and runtime events.
 
     Must be used within a task context and requires connection to DITE server.
-    """
-    try:
-        from CelebiChrono.interface.shell import engine_logs
-        result = engine_logs()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
+    """)
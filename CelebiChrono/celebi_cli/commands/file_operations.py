@@ -1,154 +1,30 @@
 """File operations commands for Celebi CLI."""
-import sys
-from typing import Optional, Any, Tuple
-import click
-from CelebiChrono.celebi_cli.utils import format_output
-
-
-def _handle_result(result: Optional[Any]) -> None:
-    """Handle result from shell function."""
-    output = format_output(result)
-    if output:
-        print(output)
+from __future__ import annotations
 
-
-def _handle_error(error: str) -> None:
-    """Handle error from shell function."""
-    print(f"Error: {error}", file=sys.stderr)
-    sys.exit(1)
+import click
+from CelebiChrono.celebi_cli.commands import (
+    CelebiCommand, handle_result as _handle_result, shell, shell_command,
+)
 
 
-@click.command(name="ls")
-@click.argument("args", nargs=-1, type=str)
-def ls_command(args: Tuple[str, ...]) -> None:
+@click.command(name="ls", cls=CelebiCommand)
+@click.argument("args", nargs=-1)
+def ls_command(args: tuple[str, ...]) -> None:
     """List directory contents."""
-    try:
-        from CelebiChrono.interface.shell import ls
-        result = ls(*args)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="mv")
-@click.argument("src", type=str)
-@click.argument("dst", type=str)
-def mv_command(src: str, dst: str) -> None:
-    """Move file or directory."""
-    try:
-        from CelebiChrono.interface.shell import mv
-        _handle_result(mv(src, dst))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="cp")
-@click.argument("src", type=str)
-@click.argument("dst", type=str)
-def cp_command(src: str, dst: str) -> None:
-    """Copy file or directory."""
-    try:
-        from CelebiChrono.interface.shell import cp
-        _handle_result(cp(src, dst))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="rm")
-@click.argument("path", type=str)
-def rm_command(path: str) -> None:
-    """Remove file or directory."""
-    try:
-        from CelebiChrono.interface.shell import rm
-        _handle_result(rm(path))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="rmfile")
-@click.argument("path", type=str)
-def rmfile_command(path: str) -> None:
-    """Remove file."""
-    try:
-        from CelebiChrono.interface.shell import rm_file
-        _handle_result(rm_file(path))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="mvfile")
-@click.argument("src", type=str)
-@click.argument("dst", type=str)
-def mvfile_command(src: str, dst: str) -> None:
-    """Move file."""
-    try:
-        from CelebiChrono.interface.shell import mv_file
-        _handle_result(mv_file(src, dst))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="import")
-@click.argument("path", type=str)
-def import_command(path: str) -> None:
-    """Import file."""
-    try:
-        from CelebiChrono.interface.shell import import_file
-        _handle_result(import_file(path))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="send")
-@click.argument("path", type=str)
-def send_command(path: str) -> None:
-    """Send file."""
-    try:
-        from CelebiChrono.interface.shell import send
-        _handle_result(send(path))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="add-input")
-@click.argument("task", type=str)
-@click.argument("input_file", type=str)
-def add_input_command(task: str, input_file: str) -> None:
-    """Add input to task."""
-    try:
-        from CelebiChrono.interface.shell import add_input
-        _handle_result(add_input(task, input_file))
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="add-source")
-@click.argument("path", type=str)
-def add_source_command(path: str) -> None:
-    """Add a source file or directory to current object."""
-    try:
-        from CelebiChrono.interface.shell import add_source
-        result = add_source(path)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
+    _handle_result(shell.ls(*args))
+
+
+# Commands that only forward their positional arguments to interface.shell:
+# shell_command(command name, shell function, help text, *argument names)
+mv_command = shell_command("mv", "mv", "Move file or directory.", "src", "dst")
+cp_command = shell_command("cp", "cp", "Copy file or directory.", "src", "dst")
+rm_command = shell_command("rm", "rm", "Remove file or directory.", "path")
+rmfile_command = shell_command("rmfile", "rm_file", "Remove file.", "path")
+mvfile_command = shell_command("mvfile", "mv_file", "Move file.", "src", "dst")
+import_command = shell_command("import", "import_file", "Import file.", "path")
+send_command = shell_command("send", "send", "Send file.", "path")
+add_input_command = shell_command(
+    "add-input", "add_input", "Add input to task.", "task", "input_file")
+add_source_command = shell_command(
+    "add-source", "add_source",
+    "Add a source file or directory to current object.", "path")
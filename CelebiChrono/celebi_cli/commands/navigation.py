@@ -1,81 +1,55 @@
 """Navigation commands for Celebi CLI."""
 import click
-from CelebiChrono.celebi_cli.utils import format_output
+from CelebiChrono.celebi_cli.commands import (
+    CelebiCommand, handle_result as _handle_result, shell,
+)
 
 
-@click.command(name="cd")
-@click.argument("path", type=str)
+@click.command(name="cd", cls=CelebiCommand)
+@click.argument("path")
 def cd_command(path):
     """Change directory within project."""
-    from CelebiChrono.interface.shell import cd
-    result = cd(path)
-    output = format_output(result)
-    if output:
-        print(output)
+    _handle_result(shell.cd(path))
 
 
-@click.command(name="tree")
+@click.command(name="tree", cls=CelebiCommand)
 def tree_command():
     """Show tree view."""
-    from CelebiChrono.interface.shell import tree
-    result = tree()
-    output = format_output(result)
-    if output:
-        print(output)
+    _handle_result(shell.tree())
 
 
-@click.command(name="status")
+@click.command(name="status", cls=CelebiCommand)
 def status_command():
     """Show status."""
-    from CelebiChrono.interface.shell import status
-    result = status()
-    output = format_output(result)
-    if output:
-        print(output)
+    _handle_result(shell.status())
 
 
-@click.command(name="navigate")
+@click.command(name="navigate", cls=CelebiCommand)
 def navigate_command():
     """Change to current project directory."""
-    from CelebiChrono.interface.shell import navigate
-    result = navigate()
-    output = format_output(result)
-    if output:
-        print(output)
+    _handle_result(shell.navigate())
 
 
-@click.command(name="cdproject")
-@click.argument("project", type=str)
+@click.command(name="cdproject", cls=CelebiCommand)
+@click.argument("project")
 def cdproject_command(project):
     """Change to project directory."""
-    from CelebiChrono.interface.shell import shell_cd_project
-    result = shell_cd_project(project)
-    output = format_output(result)
-    if output:
-        print(output)
+    _handle_result(shell.shell_cd_project(project))
 
 
-@click.command(name="short-ls")
+@click.command(name="short-ls", cls=CelebiCommand)
 def short_ls_command():
     """Short listing."""
-    from CelebiChrono.interface.shell import short_ls
-    result = short_ls("")
-    output = format_output(result)
-    if output:
-        print(output)
+    _handle_result(shell.short_ls(""))
 
 
-@click.command(name="jobs")
+@click.command(name="jobs", cls=CelebiCommand)
 def jobs_command():
     """Show jobs."""
-    from CelebiChrono.interface.shell import jobs
-    result = jobs("")
-    output = format_output(result)
-    if output:
-        print(output)
+    _handle_result(shell.jobs(""))
 
 
-@click.command(name="project-uuid")
+@click.command(name="project-uuid", cls=CelebiCommand)
 def project_uuid_command():
     """Print the current project's UUID."""
     import os
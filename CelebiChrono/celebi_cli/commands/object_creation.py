@@ -1,97 +1,28 @@
 """Object Creation commands for Celebi CLI."""
 
-import sys
 import click
 
-from CelebiChrono.celebi_cli.utils import format_output
+from CelebiChrono.celebi_cli.commands import (
+    CelebiCommand, handle_result as _handle_result, shell, shell_command,
+)
 
-def _handle_result(result):
-    """Handle result from shell function."""
-    output = format_output(result)
-    if output:
-        print(output)
 
-def _handle_error(error):
-    """Handle error from shell function."""
-    print(f"Error: {error}", file=sys.stderr)
-    sys.exit(1)
+# Commands that only forward their positional arguments to interface.shell:
+# shell_command(command name, shell function, help text, *argument names)
+create_algorithm_command = shell_command(
+    "create-algorithm", "mkalgorithm", "Create algorithm.", "name")
+create_task_command = shell_command(
+    "create-task", "mktask", "Create task.", "name")
+create_data_command = shell_command(
+    "create-data", "mkdata", "Create data.", "name")
+create_data_list_command = shell_command(
+    "create-data-list", "mkdatalist", "Create data list.", "name")
+mkdir_command = shell_command("mkdir", "mkdir", "Create directory.", "name")
 
-@click.command(name="create-algorithm")
-@click.argument("name", type=str)
-def create_algorithm_command(name):
-    """Create algorithm."""
-    try:
-        from CelebiChrono.interface.shell import mkalgorithm
-        result = mkalgorithm(name)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
 
-@click.command(name="create-task")
-@click.argument("name", type=str)
-def create_task_command(name):
-    """Create task."""
-    try:
-        from CelebiChrono.interface.shell import mktask
-        result = mktask(name)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-@click.command(name="create-data")
-@click.argument("name", type=str)
-def create_data_command(name):
-    """Create data."""
-    try:
-        from CelebiChrono.interface.shell import mkdata
-        result = mkdata(name)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-@click.command(name="create-data-list")
-@click.argument("name", type=str)
-def create_data_list_command(name):
-    """Create data list."""
-    try:
-        from CelebiChrono.interface.shell import mkdatalist
-        result = mkdatalist(name)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-@click.command(name="mkdir")
-@click.argument("name", type=str)
-def mkdir_command(name):
-    """Create directory."""
-    try:
-        from CelebiChrono.interface.shell import mkdir
-        result = mkdir(name)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="use-data")
-@click.argument("impression_uuid", type=str)
+@click.command(name="use-data", cls=CelebiCommand)
+@click.argument("impression_uuid")
 @click.option("--path", type=str, default=None, help="Optional task path override")
 def use_data_command(impression_uuid, path):
     """Adopt a Yuki impression as a rawdata task in the current project."""
-    try:
-        from CelebiChrono.interface.shell import use_data
-        result = use_data(impression_uuid, path or "")
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
+    _handle_result(shell.use_data(impression_uuid, path or ""))
@@ -1,153 +1,49 @@
 """Utility commands for Celebi CLI."""
-import sys
-from typing import Optional, Any
-import click
-from CelebiChrono.celebi_cli.utils import format_output
-
-
-def _handle_result(result: Optional[Any]) -> None:
-    """Handle result from shell function."""
-    output = format_output(result)
-    if output:
-        print(output)
-
-
-def _handle_error(error: str) -> None:
-    """Handle error from shell function."""
-    print(f"Error: {error}", file=sys.stderr)
-    sys.exit(1)
-
-
-@click.command(name="watermark")
-def watermark_command() -> None:
-    """Show watermark of current object."""
-    try:
-        from CelebiChrono.interface.shell import watermark
-        result = watermark()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="doctor")
-def doctor_command() -> None:
-    """Run diagnostics on current object."""
-    try:
-        from CelebiChrono.interface.shell import doctor
-        result = doctor()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="bookkeep")
-def bookkeep_command() -> None:
-    """Perform project-wide impression bookkeeping."""
-    try:
-        from CelebiChrono.interface.shell import bookkeep
-        result = bookkeep()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
+from __future__ import annotations
 
-
-@click.command(name="bookkeep-url")
-def bookkeep_url_command() -> None:
-    """Get the bookkeeping URL."""
-    try:
-        from CelebiChrono.interface.shell import bookkeep_url
-        result = bookkeep_url()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="successors")
-def successors_command() -> None:
-    """List successors of current object."""
-    try:
-        from CelebiChrono.interface.shell import successors
-        result = successors()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="predecessors")
-def predecessors_command() -> None:
-    """List predecessors of current object."""
-    try:
-        from CelebiChrono.interface.shell import predecessors
-        result = predecessors()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="gc-impressions")
+import click
+from CelebiChrono.celebi_cli.commands import (
+    CelebiCommand, handle_result as _handle_result, shell, shell_command,
+)
+
+
+# Commands that only forward their positional arguments to interface.shell:
+# shell_command(command name, shell function, help text, *argument names)
+watermark_command = shell_command(
+    "watermark", "watermark", "Show watermark of current object.")
+doctor_command = shell_command(
+    "doctor", "doctor", "Run diagnostics on current object.")
+bookkeep_command = shell_command(
+    "bookkeep", "bookkeep", "Perform project-wide impression bookkeeping.")
+bookkeep_url_command = shell_command(
+    "bookkeep-url", "bookkeep_url", "Get the bookkeeping URL.")
+successors_command = shell_command(
+    "successors", "successors", "List successors of current object.")
+predecessors_command = shell_command(
+    "predecessors", "predecessors", "List predecessors of current object.")
+stats_impressions_command = shell_command(
+    "stats-impressions", "stats_impressions",
+    "Show impression storage stats and dedup indicators.")
+
+
+@click.command(name="gc-impressions", cls=CelebiCommand)
 @click.option("--grace-days", type=int, default=14, show_default=True)
 @click.option("--dry-run/--execute", default=True, show_default=True)
 def gc_impressions_command(grace_days: int, dry_run: bool) -> None:
     """Garbage collect unreachable CAS impression objects."""
-    try:
-        from CelebiChrono.interface.shell import gc_impressions
-        result = gc_impressions(grace_days=grace_days, dry_run=dry_run)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
+    _handle_result(shell.gc_impressions(grace_days=grace_days, dry_run=dry_run))
 
 
-@click.command(name="pack-impressions")
+@click.command(name="pack-impressions", cls=CelebiCommand)
 @click.option("--force/--no-force", default=False, show_default=True)
 def pack_impressions_command(force: bool) -> None:
     """Evaluate packing thresholds for CAS impression objects."""
-    try:
-        from CelebiChrono.interface.shell import pack_impressions
-        result = pack_impressions(force=force)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
+    _handle_result(shell.pack_impressions(force=force))
 
 
-@click.command(name="migrate-impressions")
+@click.command(name="migrate-impressions", cls=CelebiCommand)
 @click.option("--dry-run/--execute", default=False, show_default=True)
 @click.option("--prune-legacy/--keep-legacy", default=False, show_default=True)
 def migrate_impressions_command(dry_run: bool, prune_legacy: bool) -> None:
     """Migrate legacy impressions into CAS-backed refs."""
-    try:
-        from CelebiChrono.interface.shell import migrate_impressions
-        result = migrate_impressions(dry_run=dry_run, prune_legacy=prune_legacy)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="stats-impressions")
-def stats_impressions_command() -> None:
-    """Show impression storage stats and dedup indicators."""
-    try:
-        from CelebiChrono.interface.shell import stats_impressions
-        result = stats_impressions()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
+    _handle_result(shell.migrate_impressions(dry_run=dry_run, prune_legacy=prune_legacy))
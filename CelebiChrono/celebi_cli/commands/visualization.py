@@ -1,26 +1,14 @@
 """Visualization commands for Celebi CLI."""
 
-import sys
 import click
 
-from CelebiChrono.celebi_cli.utils import format_output
-
-
-def _handle_result(result):
-    """Handle result from shell function."""
-    output = format_output(result)
-    if output:
-        print(output)
-
-
-def _handle_error(error):
-    """Handle error from shell function."""
-    print(f"Error: {error}", file=sys.stderr)
-    sys.exit(1)
+from CelebiChrono.celebi_cli.commands import (
+    CelebiCommand, handle_result as _handle_result, shell,
+)
 
 
-@click.command(name="view")
-@click.argument("browser", type=str, required=False, default="open")
+@click.command(name="view", cls=CelebiCommand)
+@click.argument("browser", required=False, default="open")
 def view_command(browser):
     """View impressions for current task in browser.
 
@@ -36,17 +24,10 @@ def view_command(browser):
         view firefox   # Open impressions in Firefox
         view chrome    # Open impressions in Chrome
     """
-    try:
-        from CelebiChrono.interface.shell import view
-        result = view(browser)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
+    _handle_result(shell.view(browser))
 
 
-@click.command(name="viewurl")
+@click.command(name="viewurl", cls=CelebiCommand)
 def viewurl_command():
     """Get the impression URL for current task.
 
@@ -57,18 +38,11 @@ def viewurl_command():
     Returns:
         URL for viewing task impressions, or empty string if not available.
     """
-    try:
-        from CelebiChrono.interface.shell import viewurl
-        result = viewurl()
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="imgcat")
-@click.argument("filename", type=str, required=False)
+    _handle_result(shell.viewurl())
+
+
+@click.command(name="imgcat", cls=CelebiCommand)
+@click.argument("filename", required=False)
 def imgcat_command(filename):
     """Display image file inline in terminal from dite.
 
@@ -92,18 +66,11 @@ def imgcat_command(filename):
         - Terminal must support imgcat escape sequences
         - Supports PNG, JPG, GIF, BMP, WebP formats
     """
-    try:
-        from CelebiChrono.interface.shell import imgcat
-        result = imgcat(filename)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
-
-
-@click.command(name="draw-dag")
-@click.argument("output_file", type=str, required=False, default="dag.pdf")
+    _handle_result(shell.imgcat(filename))
+
+
+@click.command(name="draw-dag", cls=CelebiCommand)
+@click.argument("output_file", required=False, default="dag.pdf")
 @click.option(
     "--exclude-algorithms", "-x",
     is_flag=True,
@@ -132,11 +99,4 @@ def draw_dag_command(output_file, exclude_algorithms):
         - Output is always saved to ~/Downloads/
         - Large graphs may take time to render
     """
-    try:
-        from CelebiChrono.interface.shell import draw_dag_graphviz
-        result = draw_dag_graphviz(output_file, exclude_algorithms)
-        _handle_result(result)
-    except ImportError as e:
-        _handle_error(f"Failed to import shell function: {e}")
-    except Exception as e:
-        _handle_error(f"Command failed: {e}")
+    _handle_result(shell.draw_dag_graphviz(output_file, exclude_algorithms))
@@ -1,8 +1,90 @@
 """Module for utils."""
+import importlib
+
+from CelebiChrono.celebi_cli._result import handle_result, handle_error
+
+_SHELL = None
+
+
+def shell_module():
+    """Import ``CelebiChrono.interface.shell`` once and reuse the handle."""
+    global _SHELL  # pylint: disable=global-statement
+    if _SHELL is None:
+        _SHELL = importlib.import_module("CelebiChrono.interface.shell")
+    return _SHELL
+
+
+class _ShellProxy:
+    """Stand-in for ``CelebiChrono.interface.shell`` that imports it on use.
+
+    Command modules import ``shell`` at top level and call ``shell.ls(...)``;
+    the real module is only loaded by the first attribute access.
+    """
+
+    def __getattr__(self, name):
+        return getattr(shell_module(), name)
+
+    def __repr__(self):
+        return "<lazy module 'CelebiChrono.interface.shell'>"
+
+
+shell = _ShellProxy()
+
+
+# Result type -> whether it provides a colored() renderer
+_HAS_COLORED = {}
+
+
 def format_output(result):
     """Format shell function output for CLI display."""
-    if result is not None:
-        if hasattr(result, 'colored'):
-            return result.colored()
-        return str(result)
-    return ""
+    if result is None:
+        return ""
+    result_type = type(result)
+    has_colored = _HAS_COLORED.get(result_type)
+    if has_colored is None:
+        has_colored = _HAS_COLORED[result_type] = hasattr(result_type, 'colored')
+    if has_colored:
+        return result.colored()
+    return str(result)
+
+
+def format_chunks(result):
+    """Return the CLI output of ``result`` as an iterable of strings.
+
+    Results that can render themselves piece by piece (``colored_iter``)
+    are streamed; anything else is a single ``format_output`` string.
+    """
+    colored_iter = getattr(result, "colored_iter", None)
+    if colored_iter is not None:
+        return colored_iter()
+    return (format_output(result),)
+
+
+def call_shell(fn_name, args):
+    """Call ``interface.shell.<fn_name>(*args)`` and report the outcome."""
+    try:
+        handle_result(getattr(shell, fn_name)(*args))
+    except ImportError as e:
+        handle_error(f"Failed to import shell function: {e}")
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        handle_error(f"Command failed: {e}")
+
+
+def shell_command(name, fn_name, doc, *arguments):
+    """Build a command forwarding positional arguments to the shell.
+
+    ``celebi-cli <name> ARG...`` calls ``interface.shell.<fn_name>(ARG...)``;
+    ``doc`` is the command's help text. Each argument is either a name, for a
+    required string, or a ``click.Argument`` when it needs a type or default.
+    """
+    import click
+
+    params = [
+        argument if isinstance(argument, click.Argument) else click.Argument([argument])
+        for argument in arguments
+    ]
+    param_names = [param.name for param in params]
+
+    def callback(**kwargs):
+        call_shell(fn_name, [kwargs[param_name] for param_name in param_names])
+    return click.Command(name, params=params, callback=callback, help=doc)
@@ -0,0 +1,27 @@
+"""Shared error reporting for chern_shell command handlers."""
+# pylint: disable=broad-exception-caught
+import functools
+
+
+def reports_errors(action, missing=None):
+    """Print errors raised by a ``do_*`` handler instead of propagating them.
+
+    ``action`` completes "Error <action>: ..." for unexpected failures. If
+    ``missing`` is given, IndexError/ValueError (typically from parsing an
+    empty argument) are reported as "Error: Please provide <missing>. ...".
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, arg):
+            try:
+                return method(self, arg)
+            except (IndexError, ValueError) as e:
+                if missing is None:
+                    print(f"Error {action}: {e}")
+                else:
+                    print(f"Error: Please provide {missing}. {e}")
+            except Exception as e:
+                print(f"Error {action}: {e}")
+            return None
+        return wrapper
+    return decorator
@@ -0,0 +1,19 @@
+"""Factory for chern_shell handlers that forward one word to interface.shell."""
+from ...interface import shell
+from ._errors import reports_errors
+
+
+def first_arg_command(fn_name, doc, action, missing):
+    """Build a ``do_*`` method that calls ``shell.<fn_name>(first word)``.
+
+    The method prints the returned messages, if any, and reports errors
+    through ``reports_errors(action, missing)``. The shell function is
+    looked up on every call, so it can still be patched or reloaded.
+    """
+    def method(self, arg):  # pylint: disable=unused-argument
+        result = getattr(shell, fn_name)(arg.split(None, 1)[0])
+        if result.messages:
+            print(result.colored())
+    method.__name__ = method.__qualname__ = f"do_{fn_name}"
+    method.__doc__ = doc
+    return reports_errors(action, missing)(method)
@@ -10,6 +10,9 @@ import os
 from ...utils import csys
 from ...utils.metadata import YamlFile
 
+# Prompt shown inside a project: project name, object path within the project
+PROMPT_TEMPLATE = "[Celebi][%s][%s]\n>>>> "
+
 
 class ChernShellBase(cmd.Cmd):
     """Base class for Chern Shell with core functionality."""
@@ -18,11 +21,31 @@ class ChernShellBase(cmd.Cmd):
     prompt = '[Celebi]'
     file = None
     readline_file = None
+    # Filled in per shell class by __init_subclass__
+    _attribute_names = ()
+    _command_names = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Record the attribute and command names of the assembled shell.
+
+        cmd.Cmd rescans dir() of the class for every completion and help
+        listing; the mixins are fixed once the class exists, so do it once.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._attribute_names = tuple(dir(cls))
+        cls._command_names = tuple(
+            name[3:].replace('_', '-')
+            for name in cls._attribute_names if name.startswith("do_")
+        )
 
     def __init__(self):
         """Initialize the shell and set custom completer delimiters."""
         super().__init__()
 
+    def get_names(self):
+        """Return the class attribute names (cached per shell class)."""
+        return list(self._attribute_names) or super().get_names()
+
     def init(self, manager) -> None:
         """Initialize the shell with current project context."""
         current_project_name = manager.get_current_project()
@@ -64,7 +87,7 @@ class ChernShellBase(cmd.Cmd):
         current_path = os.path.relpath(
             manager.c.path, csys.project_path(manager.c.path)
         )
-        self.prompt = f"[Celebi][{current_project_name}][{current_path}]\n>>>> "
+        self.prompt = PROMPT_TEMPLATE % (current_project_name, current_path)
 
     def cmdloop(self, intro=None):
         """Keep tab completion and catch Ctrl-C during input"""
@@ -95,17 +118,8 @@ class ChernShellBase(cmd.Cmd):
 
     def completenames(self, text, *ignored):
         """Complete command names based on user input."""
-        matches = []
-
-        # Get all method names that start with 'do_'
-        for name in self.get_names():
-            if name.startswith("do_"):
-                # Convert do_create_task to create-task
-                command_name = name[3:].replace('_', '-')
-                if command_name.startswith(text):
-                    matches.append(command_name)
-
-        return matches
+        # Command names are do_* methods with '_' shown as '-'
+        return [name for name in self._command_names if name.startswith(text)]
 
     # pylint: disable=arguments-differ,too-many-nested-blocks
     def completedefault(self, text, _line, _begidx, endidx):
@@ -4,18 +4,16 @@ Advanced Developer Tools Command Handlers for Chern Shell.
 This module contains command handlers for advanced operations,
 debugging, and system integration.
 """
-# pylint: disable=broad-exception-caught
 import os
+import subprocess
 from ...interface import shell
-from ...interface.ChernManager import get_manager
-
-
-MANAGER = get_manager()
+from ._errors import reports_errors
 
 
 class AdvancedCommands:
     """Mixin class providing advanced and developer command handlers."""
 
+    @reports_errors("sending", "a path to send")
     def do_send(self, arg: str) -> None:
         """
         Send a file or path.
@@ -25,25 +23,20 @@ class AdvancedCommands:
         arg : str
             Path to the file or directory to send.
         """
-        try:
-            obj = arg.split()[0]
-            result = shell.send(obj)
-            if result.messages:
-                print(result.colored())
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide a path to send. {e}")
-        except Exception as e:
-            print(f"Error sending: {e}")
+        obj = arg.split(None, 1)[0]
+        result = shell.send(obj)
+        output = result.colored()
+        if output:
+            print(output)
 
+    @reports_errors("accessing DITE")
     def do_dite(self, _: str) -> None:
         """
         Show DITE information.
         """
-        try:
-            print(shell.dite().colored())
-        except Exception as e:
-            print(f"Error accessing DITE: {e}")
+        shell.dite().write_colored()
 
+    @reports_errors("setting DITE URL", "a DITE URL")
     def do_set_dite(self, arg: str) -> None:
         """
         Set DITE url.
@@ -53,16 +46,13 @@ class AdvancedCommands:
         arg : str
             The DITE URL to set.
         """
-        try:
-            url = arg.split()[0]
-            result = shell.set_dite(url)
-            if result.messages:
-                print(result.colored())
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide a DITE URL. {e}")
-        except Exception as e:
-            print(f"Error setting DITE URL: {e}")
+        url = arg.split(None, 1)[0]
+        result = shell.set_dite(url)
+        output = result.colored()
+        if output:
+            print(output)
 
+    @reports_errors("executing command", "a command to execute")
     def do_danger_call(self, arg: str) -> None:
         """
         Dangerous call to execute a command directly.
@@ -72,16 +62,13 @@ class AdvancedCommands:
         arg : str
             The command to execute.
         """
-        try:
-            cmd = arg
-            result = shell.danger_call(cmd)
-            if result.messages:
-                print(result.colored())
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide a command to execute. {e}")
-        except Exception as e:
-            print(f"Error executing command: {e}")
+        cmd = arg
+        result = shell.danger_call(cmd)
+        output = result.colored()
+        if output:
+            print(output)
 
+    @reports_errors("executing command", "a command to execute")
     def do_workaround(self, arg):
         """
         Workaround to test/debug the task.
@@ -91,36 +78,37 @@ class AdvancedCommands:
         arg : str
             Optional argument. If 'docker', runs task in Docker container.
         """
+        result = shell.workaround_preshell()
+        if not result.success:
+            print(result.colored())
+            return
+        info = result.data["path"]
+        # Remember the current path
+        path = os.getcwd()
+        # use docker if arg is docker
+        if arg.strip() == "docker":
+            command = [
+                "docker", "run", "-it", "rootproject/root:6.36.00-ubuntu25.04", "bash"
+            ]
+        else:
+            command = [os.environ.get("SHELL", "/bin/bash")]
+        # Switch to the ~, and always come back even if the command fails
+        os.chdir(info)
         try:
-            result = shell.workaround_preshell()
-            if not result.success:
-                print(result.colored())
-                return
-            info = result.data["path"]
-            # Remember the current path
-            path = os.getcwd()
-            # Switch to the ~
-            os.chdir(info)
-            # use docker if arg is docker
-            if arg.strip() == "docker":
-                os.system(
-                    "docker run -it rootproject/root:6.36.00-ubuntu25.04 bash"
-                )
-            else:
-                os.system(os.environ.get("SHELL", "/bin/bash"))
-            print("Before postshell")
+            subprocess.call(command)
+        except OSError as e:
+            print(f"Error: unable to start {command[0]}: {e}")
+        finally:
             os.chdir(path)
-            # Ask whether to run postshell
-            # Apply the changes made to the code? (y/n):
-            answer = input("Apply the changes made to the code? (y/n): ").strip().lower()
-            if answer == "y":
-                shell.workaround_postshell(info)
-            # Switch back to the original path
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide a command to execute. {e}")
-        except Exception as e:
-            print(f"Error executing command: {e}")
-
+        print("Before postshell")
+        # Ask whether to run postshell
+        # Apply the changes made to the code? (y/n):
+        answer = input("Apply the changes made to the code? (y/n): ").strip()
+        if answer in ("y", "Y"):
+            shell.workaround_postshell(info)
+        # Switch back to the original path
+
+    @reports_errors("tracing execution")
     def do_trace(self, arg):
         """
         Trace the execution of the current task.
@@ -130,71 +118,54 @@ class AdvancedCommands:
         arg : str
             Optional object name to trace.
         """
-        try:
-            obj = arg.split()[0] if arg else None
-            result = shell.trace(obj)
-            if result.messages:
-                print(result.colored())
-        except Exception as e:
-            print(f"Error tracing execution: {e}")
+        obj = arg.split(None, 1)[0] if arg else None
+        result = shell.trace(obj)
+        output = result.colored()
+        if output:
+            print(output)
 
+    @reports_errors("printing history")
     def do_history(self, _arg):
         """
         Print the history of the current object.
         """
-        try:
-            print(shell.history().colored())
-        except Exception as e:
-            print(f"Error printing history: {e}")
+        shell.history().write_colored()
 
+    @reports_errors("printing changes")
     def do_changes(self, _arg):
         """
         Print the changes.
         """
-        try:
-            print(shell.changes().colored())
-        except Exception as e:
-            print(f"Error printing changes: {e}")
+        shell.changes().write_colored()
 
+    @reports_errors("handling watermark")
     def do_watermark(self, _arg):
         """
         Set the watermark.
         """
-        try:
-            print(shell.watermark().colored())
-        except Exception as e:
-            print(f"Error handling watermark: {e}")
+        shell.watermark().write_colored()
 
+    @reports_errors("entering system shell")
     def do_system_shell(self, _arg):
         """
         Enter a system shell (bash). Type 'exit' or Ctrl-D to return.
         """
         print("Entering system shell. Type 'exit' to return.\n")
-
-        try:
-            os.system(os.environ.get("SHELL", "/bin/bash"))
-        finally:
-            pass
-
+        subprocess.call([os.environ.get("SHELL", "/bin/bash")])
         print("\nReturned to Chern Shell.")
 
+    @reports_errors("running diagnostics")
     def do_doctor(self, _arg):
         """
         Run system diagnostics.
         """
-        try:
-            print(shell.doctor().colored())
-        except Exception as e:
-            print(f"Error running diagnostics: {e}")
+        shell.doctor().write_colored()
 
+    @reports_errors("adding source", "a source path")
     def do_add_source(self, arg: str) -> None:
         """Add a source file or directory to current object."""
-        try:
-            path = arg.split()[0]
-            result = shell.add_source(path)
-            if result.messages:
-                print(result.colored())
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide a source path. {e}")
-        except Exception as e:
-            print(f"Error adding source: {e}")
+        path = arg.split(None, 1)[0]
+        result = shell.add_source(path)
+        output = result.colored()
+        if output:
+            print(output)
@@ -25,7 +25,7 @@ class BasicCommands:
     def do_status(self, _: str) -> None:
         """Show status of current object."""
         try:
-            print(shell.status().colored())
+            shell.status().write_colored()
         except Exception as e:
             print(f"Error showing status: {e}")
 
@@ -67,7 +67,7 @@ class BasicCommands:
     def do_display(self, arg: str) -> None:
         """Display a file from current object."""
         try:
-            filename = arg.split()[0]
+            filename = arg.split(None, 1)[0]
             MANAGER.current_object().display(filename)
         except (IndexError, ValueError) as e:
             print(f"Error: Please provide a filename. {e}")
@@ -93,7 +93,7 @@ class BasicCommands:
 
     def do_tree(self, _arg: str) ->None:
         """Display directory tree structure."""
-        print(shell.tree().colored())
+        shell.tree().write_colored()
 
     def do_short_ls(self, _: str) -> None:
         """Show short listing of current object."""
@@ -116,7 +116,7 @@ class BasicCommands:
     def do_log(self, arg: str) -> None:
         """Show log for current object."""
         try:
-            index = int(arg.split()[0]) if arg.strip() else 0
+            index = int(arg.split(None, 1)[0]) if arg.strip() else 0
             result = shell.error_log(index)
             if result.messages:
                 print(result.colored())
@@ -35,7 +35,7 @@ class DocumentationCommands:
     def do_edit_script(self, arg: str) -> None:
         """Edit a script file."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.get_script_path(obj)  # Validate script existence
             config_path = os.path.join(os.environ["HOME"], ".celebi", "config.yaml")
             if not result.success:
@@ -53,7 +53,7 @@ class DocumentationCommands:
     def do_helpme(self, arg: str) -> None:
         """Get help for current object."""
         try:
-            print(MANAGER.current_object().helpme(arg).colored())
+            MANAGER.current_object().helpme(arg).write_colored()
         except Exception as e:
             print(f"Error getting help: {e}")
 
@@ -77,7 +77,7 @@ class DocumentationCommands:
     def do_search_impression(self, arg: str) -> None:
         """Search impressions."""
         try:
-            print(shell.search_impression(arg).colored())
+            shell.search_impression(arg).write_colored()
         except Exception as e:
             print(f"Error searching impressions: {e}")
 
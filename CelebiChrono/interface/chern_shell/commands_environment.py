@@ -7,6 +7,8 @@ and job execution management.
 # pylint: disable=broad-exception-caught
 from ...interface import shell
 from ...interface.ChernManager import get_manager
+from ._errors import reports_errors
+from ._forward import first_arg_command
 
 
 MANAGER = get_manager()
@@ -15,165 +17,107 @@ MANAGER = get_manager()
 class EnvironmentCommands:
     """Mixin class providing environment and execution command handlers."""
 
-    def do_set_environment(self, arg: str) -> None:
-        """Set environment for current object."""
-        try:
-            environment = arg.split()[0]
-            result = shell.set_environment(environment)
-            if result.messages:
-                print(result.colored())
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide an environment name. {e}")
-        except Exception as e:
-            print(f"Error setting environment: {e}")
+    # Handlers that pass the first word of their argument to interface.shell:
+    # first_arg_command(shell function, help text, error action, missing arg)
+    do_set_environment = first_arg_command(
+        "set_environment", "Set environment for current object.",
+        "setting environment", "an environment name")
+    do_set_memory_limit = first_arg_command(
+        "set_memory_limit", "Set memory limit for current object.",
+        "setting memory limit", "a memory limit")
+    do_set_descriptor = first_arg_command(
+        "set_descriptor", "Set descriptor for current task or algorithm.",
+        "setting descriptor", "a descriptor")
+    do_request_runner = first_arg_command(
+        "request_runner", "Request a runner for current object.",
+        "requesting runner", "a runner name")
+    do_remove_runner = first_arg_command(
+        "remove_runner", "Remove a runner.",
+        "removing runner", "a runner name")
 
     def do_setenv(self, arg: str) -> None:
         """Set environment for current object (alias for set-environment)."""
-        try:
-            environment = arg.split()[0]
-            result = shell.set_environment(environment)
-            if result.messages:
-                print(result.colored())
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide an environment name. {e}")
-        except Exception as e:
-            print(f"Error setting environment: {e}")
-
-    def do_set_memory_limit(self, arg: str) -> None:
-        """Set memory limit for current object."""
-        try:
-            memory_limit = arg.split()[0]
-            result = shell.set_memory_limit(memory_limit)
-            if result.messages:
-                print(result.colored())
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide a memory limit. {e}")
-        except Exception as e:
-            print(f"Error setting memory limit: {e}")
-
-    def do_set_descriptor(self, arg: str) -> None:
-        """Set descriptor for current task or algorithm."""
-        try:
-            descriptor = arg.split()[0]
-            result = shell.set_descriptor(descriptor)
-            if result.messages:
-                print(result.colored())
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide a descriptor. {e}")
-        except Exception as e:
-            print(f"Error setting descriptor: {e}")
+        self.do_set_environment(arg)
 
     def do_setdescriptor(self, arg: str) -> None:
         """Set descriptor for current task or algorithm (alias for set-descriptor)."""
         self.do_set_descriptor(arg)
 
+    @reports_errors("setting auto download", "'on' or 'off'")
     def do_auto_download(self, arg: str) -> None:
         """Enable or disable auto download."""
-        try:
-            auto_download = arg.split()[0]
-            if auto_download == "on":
-                MANAGER.current_object().set_auto_download(True)
-            elif auto_download == "off":
-                MANAGER.current_object().set_auto_download(False)
-            else:
-                print("please input on or off")
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide 'on' or 'off'. {e}")
-        except Exception as e:
-            print(f"Error setting auto download: {e}")
-
+        auto_download = arg.split(None, 1)[0]
+        if auto_download == "on":
+            MANAGER.current_object().set_auto_download(True)
+        elif auto_download == "off":
+            MANAGER.current_object().set_auto_download(False)
+        else:
+            print("please input on or off")
+
+    @reports_errors("setting EOS usage", "'on' or 'off'")
     def do_use_eos(self,  arg: str) -> None:
         """Enable or disable EOS usage."""
-        try:
-            use_eos = arg.split()[0]
-            if use_eos == "on":
-                MANAGER.current_object().set_use_eos(True)
-            elif use_eos == "off":
-                MANAGER.current_object().set_use_eos(False)
-            else:
-                print("please input on or off")
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide 'on' or 'off'. {e}")
-        except Exception as e:
-            print(f"Error setting EOS usage: {e}")
-
-    def do_request_runner(self, arg: str) -> None:
-        """Request a runner for current object."""
-        try:
-            runner = arg.split()[0]
-            result = shell.request_runner(runner)
-            if result.messages:
-                print(result.colored())
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide a runner name. {e}")
-        except Exception as e:
-            print(f"Error requesting runner: {e}")
-
+        use_eos = arg.split(None, 1)[0]
+        if use_eos == "on":
+            MANAGER.current_object().set_use_eos(True)
+        elif use_eos == "off":
+            MANAGER.current_object().set_use_eos(False)
+        else:
+            print("please input on or off")
+
+    @reports_errors("accessing config")
     def do_config(self, _: str) -> None:
         """Edit configuration."""
-        try:
-            result = shell.config()
-            if result.messages:
-                print(result.colored())
-        except Exception as e:
-            print(f"Error accessing config: {e}")
+        result = shell.config()
+        if result.messages:
+            print(result.colored())
 
+    @reports_errors("submitting")
     def do_submit(self, arg: str) -> None:
         """Submit current object."""
-        try:
-            if not arg:
-                result = shell.submit()
-            else:
-                obj = arg.split()[0]
-                result = shell.submit(obj)
-            if result.messages:
-                print(result.colored())
-        except Exception as e:
-            print(f"Error submitting: {e}")
-
+        if not arg:
+            result = shell.submit()
+        else:
+            obj = arg.split(None, 1)[0]
+            result = shell.submit(obj)
+        if result.messages:
+            print(result.colored())
+
+    @reports_errors("purge")
     def do_purge_impressions(self, _: str) -> None:
         """Purge impressions current object."""
-        try:
-            # Ask for confirmation
-            answer = input("Are you sure you want to purge impressions? This action cannot be undone. (N/y): ") # pylint: disable=line-too-long
-            if answer.lower() != 'y':
-                print("Purge impressions cancelled.")
-                return
-            result = shell.purge()
-            if result.messages:
-                print(result.colored())
-        except Exception as e:
-            print(f"Error purge: {e}")
-
+        # Ask for confirmation
+        answer = input("Are you sure you want to purge impressions? This action cannot be undone. (N/y): ") # pylint: disable=line-too-long
+        if answer not in ('y', 'Y'):
+            print("Purge impressions cancelled.")
+            return
+        result = shell.purge()
+        if result.messages:
+            print(result.colored())
+
+    @reports_errors("purging old impressions")
     def do_purge_old_impressions(self, _: str) -> None:
         """Purge old impressions of current object."""
-        try:
-            # Ask for confirmation
-            answer = input("Are you sure you want to purge old impressions? This action cannot be undone. (N/y): ") # pylint: disable=line-too-long
-            if answer.lower() != 'y':
-                print("Purge old impressions cancelled.")
-                return
-            result = shell.purge_old_impressions()
-            if result.messages:
-                print(result.colored())
-        except Exception as e:
-            print(f"Error purging old impressions: {e}")
+        # Ask for confirmation
+        answer = input("Are you sure you want to purge old impressions? This action cannot be undone. (N/y): ") # pylint: disable=line-too-long
+        if answer not in ('y', 'Y'):
+            print("Purge old impressions cancelled.")
+            return
+        result = shell.purge_old_impressions()
+        if result.messages:
+            print(result.colored())
 
 
 
+    @reports_errors("killing process")
     def do_kill(self, _: str) -> None:
         """Kill current object process."""
-        try:
-            MANAGER.current_object().kill()
-        except Exception as e:
-            print(f"Error killing process: {e}")
+        MANAGER.current_object().kill()
 
+    @reports_errors("showing runners")
     def do_runners(self, _: str) -> None:
         """Show available runners."""
-        try:
-            print(shell.runners().colored())
-        except Exception as e:
-            print(f"Error showing runners: {e}")
+        shell.runners().write_colored()
 
     def do_register_runner(self, _: str) -> None:
         """Register a runner with default values if input is empty."""
@@ -206,117 +150,93 @@ class EnvironmentCommands:
         except Exception as e:
             print(f"Error: {e}")
 
-    def do_remove_runner(self, arg: str) -> None:
-        """Remove a runner."""
-        try:
-            obj = arg.split()[0]
-            result = shell.remove_runner(obj)
-            if result.messages:
-                print(result.colored())
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide a runner name. {e}")
-        except Exception as e:
-            print(f"Error removing runner: {e}")
-
+    @reports_errors("checking booking server")
     def do_booking_server(self, arg: str) -> None:
         """Check the registered booking server URL and status.
 
         Usage: booking-server
         """
-        try:
-            result = shell.check_booking_server()
-            if result.messages:
-                print(result.colored())
-        except Exception as e:
-            print(f"Error checking booking server: {e}")
+        result = shell.check_booking_server()
+        if result.messages:
+            print(result.colored())
 
+    @reports_errors("registering booking server")
     def do_register_booking_server(self, arg: str) -> None:
         """Register REANA server and token with Yuki.
 
         Usage: register-booking-server [--server URL] [--token TOKEN]
         """
-        try:
-            args = arg.split() if arg else []
-            server_url = ""
-            access_token = ""
-            i = 0
-            while i < len(args):
-                if args[i] == "--server" and i + 1 < len(args):
-                    server_url = args[i + 1]
-                    i += 2
-                elif args[i] == "--token" and i + 1 < len(args):
-                    access_token = args[i + 1]
-                    i += 2
-                else:
-                    i += 1
-            result = shell.register_booking_server(server_url, access_token)
-            if result.messages:
-                print(result.colored())
-        except Exception as e:
-            print(f"Error registering booking server: {e}")
+        args = arg.split() if arg else []
+        server_url = ""
+        access_token = ""
+        i = 0
+        while i < len(args):
+            if args[i] == "--server" and i + 1 < len(args):
+                server_url = args[i + 1]
+                i += 2
+            elif args[i] == "--token" and i + 1 < len(args):
+                access_token = args[i + 1]
+                i += 2
+            else:
+                i += 1
+        result = shell.register_booking_server(server_url, access_token)
+        if result.messages:
+            print(result.colored())
 
+    @reports_errors("booking to REANA")
     def do_book_reana(self, arg: str) -> None:
         """Book current project to REANA.
 
         Usage: book-reana [--server URL] [--token TOKEN] [--insecure] [--stageout] [--no-stream]
         """
-        try:
-            args = arg.split() if arg else []
-            server_url = ""
-            access_token = ""
-            verify_ssl = True
-            stageout = False
-            stream = True
-            i = 0
-            while i < len(args):
-                if args[i] == "--server" and i + 1 < len(args):
-                    server_url = args[i + 1]
-                    i += 2
-                elif args[i] == "--token" and i + 1 < len(args):
-                    access_token = args[i + 1]
-                    i += 2
-                elif args[i] == "--insecure":
-                    verify_ssl = False
-                    i += 1
-                elif args[i] == "--stageout":
-                    stageout = True
-                    i += 1
-                elif args[i] == "--no-stream":
-                    stream = False
-                    i += 1
-                else:
-                    i += 1
-            result = shell.book_reana(
-                server_url, access_token, verify_ssl,
-                stageout=stageout, stream=stream
-            )
-            # In streaming mode, messages were already printed live.
-            if stream:
-                pass
-            elif result.messages:
-                print(result.colored())
-        except Exception as e:
-            print(f"Error booking to REANA: {e}")
-
+        args = arg.split() if arg else []
+        server_url = ""
+        access_token = ""
+        verify_ssl = True
+        stageout = False
+        stream = True
+        i = 0
+        while i < len(args):
+            if args[i] == "--server" and i + 1 < len(args):
+                server_url = args[i + 1]
+                i += 2
+            elif args[i] == "--token" and i + 1 < len(args):
+                access_token = args[i + 1]
+                i += 2
+            elif args[i] == "--insecure":
+                verify_ssl = False
+                i += 1
+            elif args[i] == "--stageout":
+                stageout = True
+                i += 1
+            elif args[i] == "--no-stream":
+                stream = False
+                i += 1
+            else:
+                i += 1
+        result = shell.book_reana(
+            server_url, access_token, verify_ssl,
+            stageout=stageout, stream=stream
+        )
+        # In streaming mode, messages were already printed live.
+        if stream:
+            pass
+        elif result.messages:
+            print(result.colored())
+
+    @reports_errors("adding host", "a host name and URL")
     def do_add_host(self, arg: str) -> None:
         """Add a host to the communicator."""
-        try:
-            args = arg.split()
-            host = args[0]
-            url = args[1]
-            result = shell.add_host(host, url)
-            if result.messages:
-                print(result.colored())
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide a host name and URL. {e}")
-        except Exception as e:
-            print(f"Error adding host: {e}")
-
+        args = arg.split()
+        host = args[0]
+        url = args[1]
+        result = shell.add_host(host, url)
+        if result.messages:
+            print(result.colored())
+
+    @reports_errors("listing hosts")
     def do_hosts(self, _: str) -> None:
         """List all hosts and their status."""
-        try:
-            result = shell.hosts()
-            if result.messages:
-                print(result.colored())
-        except Exception as e:
-            print(f"Error listing hosts: {e}")
+        result = shell.hosts()
+        if result.messages:
+            print(result.colored())
@@ -3,23 +3,20 @@ from ..shell_modules.execution_management import test, engine_logs
 
 class CommandsExecution:
     """Execution commands for Chern shell."""
-    def do_test(self, arg):
+
+    def do_test(self, _arg):
         """
         Execute a test workflow.
 
-        Usage:
-            test <docker_image> <command>
+        Runs the current task in a Docker container, using the task's own
+        environment and commands.
 
-        Examples:
-            test ubuntu:latest ls -l
+        Usage:
+            test
         """
-        args = arg.split(maxsplit=1)
-        if len(args) < 2:
-            print("Error: Missing arguments. Usage: test <docker_image> <command>")
-            return
-
-        _docker_image, _command = args
-        test()
+        result = test()
+        if result.messages:
+            print(result.colored())
 
     def do_engine_logs(self, _arg):
         """
@@ -19,7 +19,7 @@ class FileCommands:
     def do_mkdir(self, arg: str) -> None:
         """Create a new directory."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.mkdir(obj)
             if result.messages:
                 print(result.colored())
@@ -86,7 +86,7 @@ class FileCommands:
     def do_rm(self, arg: str) -> None:
         """Remove an object."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.rm(obj)
             if result.messages:
                 print(result.colored())
@@ -98,7 +98,7 @@ class FileCommands:
     def do_import(self, arg: str) -> None:
         """Import a file into current object."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.import_file(obj)
             if result.messages:
                 print(result.colored())
@@ -110,7 +110,7 @@ class FileCommands:
     def do_import_file(self, arg: str) -> None:
         """Import a file into current object."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.import_file(obj)
             if result.messages:
                 print(result.colored())
@@ -3,75 +3,72 @@ Navigation Command Handlers for Chern Shell.
 
 This module contains command handlers for navigation operations.
 """
-# pylint: disable=broad-exception-caught,import-outside-toplevel
+# pylint: disable=import-outside-toplevel
 import os
 from ...interface import shell
 from ...interface.ChernManager import get_manager
+from ..shell_modules import _manager
+from ._errors import reports_errors
+from .base import PROMPT_TEMPLATE
 
 
 MANAGER = get_manager()
 
 
+def _path_in_project(path):
+    """Return ``path`` relative to its project root, for the prompt.
+
+    The root comes from the shell modules' project_path cache, which cd_project
+    clears when the project changes.
+    """
+    return os.path.relpath(path, _manager.project_path(path))
+
+
 class NavigationCommands:
     """Mixin class providing navigation command handlers."""
 
     def do_cd_project(self, arg: str) -> None:
         """Switch project."""
         try:
-            project = arg.split()[0]
+            project = arg.split(None, 1)[0]
             result = shell.cd_project(project)
             if result.messages:
                 print(result.colored())
         except (IndexError, ValueError) as e:
             print(f"Error: Please provide a project name. {e}")
 
+    @reports_errors("changing directory", "a directory or object name")
     def do_cd(self, arg: str) -> None:
         """Switch directory or object."""
-        try:
-            from ...utils import csys
-            myobject = arg.split()[0]
-            result = shell.cd(myobject)
-            if not result.success:
-                print(result.colored())
-                return
-            current_project_name = MANAGER.get_current_project()
-            current_path = os.path.relpath(
-                MANAGER.c.path, csys.project_path(MANAGER.c.path)
-            )
-            # pylint: disable=attribute-defined-outside-init
-            self.prompt = (
-                f"[Celebi][{current_project_name}][{current_path}]\n>>>> "
-            )
-        except (IndexError, ValueError) as e:
-            print(f"Error: Please provide a directory or object name. {e}")
-        except Exception as e:
-            print(f"Error changing directory: {e}")
+        myobject = arg.split(None, 1)[0]
+        result = shell.cd(myobject)
+        if not result.success:
+            print(result.colored())
+            return
+        current_project_name = MANAGER.get_current_project()
+        current_path = _path_in_project(MANAGER.c.path)
+        # pylint: disable=attribute-defined-outside-init
+        self.prompt = PROMPT_TEMPLATE % (current_project_name, current_path)
 
+    @reports_errors("listing projects")
     def do_ls_projects(self, _: str) -> None:
         """List all projects."""
-        try:
-            MANAGER.ls_projects()
-        except Exception as e:
-            print(f"Error listing projects: {e}")
+        MANAGER.ls_projects()
 
+    @reports_errors("navigating")
     def do_navigate(self, _: str) -> None:
         """Print the path of the current project."""
-        try:
-            result = shell.navigate()
-            if result.messages:
-                print(result.colored())
-        except Exception as e:
-            print(f"Error navigating: {e}")
+        result = shell.navigate()
+        if result.messages:
+            print(result.colored())
 
+    @reports_errors("getting project UUID")
     def do_project_uuid(self, _: str) -> None:
         """Print the UUID of the current project."""
-        try:
-            from ...kernel.vproject import VProject
-            project_path = MANAGER.c.project_path() if MANAGER.c else ""
-            if not project_path:
-                print("Error: Not inside a Celebi project.")
-                return
-            uuid = VProject(project_path).project_uuid()
-            print(uuid)
-        except Exception as e:
-            print(f"Error getting project UUID: {e}")
+        from ...kernel.vproject import VProject
+        project_path = MANAGER.c.project_path() if MANAGER.c else ""
+        if not project_path:
+            print("Error: Not inside a Celebi project.")
+            return
+        uuid = VProject(project_path).project_uuid()
+        print(uuid)
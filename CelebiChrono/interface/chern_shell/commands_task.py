@@ -19,7 +19,7 @@ class TaskCommands:
     def do_create_task(self, arg: str) -> None:
         """Create a new task."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.mktask(obj)
             if result.messages:
                 print(result.colored())
@@ -61,7 +61,7 @@ class TaskCommands:
     def do_create_algorithm(self, arg: str) -> None:
         """Create a new algorithm."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.mkalgorithm(obj)
             if result.messages:
                 print(result.colored())
@@ -73,7 +73,7 @@ class TaskCommands:
     def do_create_data(self, arg: str) -> None:
         """Create a new data object."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.mkdata(obj)
             if result.messages:
                 print(result.colored())
@@ -112,7 +112,7 @@ class TaskCommands:
     def do_create_data_list(self, arg: str) -> None:
         """Create a new data list object."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.mkdatalist(obj)
             if result.messages:
                 print(result.colored())
@@ -128,7 +128,7 @@ class TaskCommands:
     def do_add_algorithm(self, arg: str) -> None:
         """Add an algorithm to current task."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.add_algorithm(obj)
             if result.messages:
                 print(result.colored())
@@ -140,7 +140,7 @@ class TaskCommands:
     def do_input(self, arg: str) -> None:
         """Add input to current object."""
         try:
-            input_path = arg.split()[0]
+            input_path = arg.split(None, 1)[0]
             MANAGER.current_object().input(input_path)
         except (IndexError, ValueError) as e:
             print(f"Error: Please provide an input path. {e}")
@@ -222,7 +222,7 @@ class TaskCommands:
     def do_remove_input(self, arg: str) -> None:
         """Remove an input from current object."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.remove_input(obj)
             if result.messages:
                 print(result.colored())
@@ -248,7 +248,7 @@ class TaskCommands:
     def do_remove_parameter(self, arg: str) -> None:
         """Remove a parameter from current task."""
         try:
-            obj = arg.split()[0]
+            obj = arg.split(None, 1)[0]
             result = shell.rm_parameter(obj)
             if result.messages:
                 print(result.colored())
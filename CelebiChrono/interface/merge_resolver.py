@@ -3,16 +3,106 @@
 This module provides user-friendly interfaces for resolving
 merge conflicts with clear prompts and visualizations.
 """
-import sys
+import functools
+import io
+import itertools
 import os
-from typing import Dict, List, Any
+import subprocess
+import sys
+import types
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 from enum import Enum
 from logging import getLogger
 
+import networkx as nx
+
+from ..kernel import vobj_arc_merge
 from ..utils.dag_visualizer import DAGVisualizer
 
 logger = getLogger("ChernLogger")
 
+# Rules above and below section headings, newline included
+_RULE = "=" * 80 + "\n"
+_SEP = "-" * 80 + "\n"
+
+# ANSI sequences wrapping an option's "(warning)" tail on colour terminals
+_WARNING_OPEN = " \033[93m("
+_WARNING_CLOSE = ")\033[0m"
+
+# Conflict types listed first in the summary
+_CRITICAL_TYPES = frozenset(('cycle_creation', 'uuid_conflict', 'dag_conflict'))
+
+# DAG conflict types offered the local/remote/both dependency menu
+_EDGE_CONFLICT_TYPES = frozenset(('additive_edge', 'subtractive_edge', 'contradictory_edge'))
+
+# Result of resolving an empty conflict list, shared between calls
+_NO_CONFLICTS_RESULT = types.MappingProxyType({
+    'success': True,
+    'resolved': 0,
+    'skipped': 0,
+    'remaining': 0,
+    'actions': (),
+})
+
+# Longest conflict description shown in the resolution summary
+_SUMMARY_DESC_WIDTH = 50
+
+# Number of merge previews kept per resolver
+_PREVIEW_CACHE_SIZE = 16
+
+# Broader category of the conflict types the merge coordinator emits
+_TYPE_TO_CATEGORY = {
+    'cycle_creation': 'dag',
+    'additive_edge': 'dag',
+    'subtractive_edge': 'dag',
+    'modified_edge': 'dag',
+    'contradictory_edge': 'dag',
+    'dag_conflict': 'dag',
+    'config_conflict': 'config',
+    'yaml_conflict': 'config',
+    'json_conflict': 'config',
+    'uuid_conflict': 'uuid',
+    'alias_conflict': 'alias',
+    'missing_node': 'other',
+    'dependency_conflict': 'other',
+    'value_conflict': 'other',
+    'structure_conflict': 'other',
+    'conflict_marker': 'other',
+}
+
+
+def _category_from_type_name(conflict_type: str) -> str:
+    """Map a conflict type missing from _TYPE_TO_CATEGORY by its name."""
+    if 'dag' in conflict_type or 'cycle' in conflict_type or 'edge' in conflict_type:
+        return 'dag'
+    if 'config' in conflict_type or 'yaml' in conflict_type or 'json' in conflict_type:
+        return 'config'
+    if 'uuid' in conflict_type:
+        return 'uuid'
+    if 'alias' in conflict_type:
+        return 'alias'
+    return 'other'
+
+
+@functools.lru_cache(maxsize=8)
+def _is_terminal(stream) -> bool:
+    """Return whether ``stream`` is a terminal, asking once per stream."""
+    return stream.isatty()
+
+
+def _path_tail(node) -> str:
+    """Return the last component of the node's invariant path."""
+    return node.invariant_path().rsplit('/', 1)[-1]
+
+
+@functools.lru_cache(maxsize=32)
+def _node_name_accessor(node_type):
+    """Return the function naming nodes of ``node_type`` in merge previews."""
+    if hasattr(node_type, 'invariant_path'):
+        return _path_tail
+    return str
+
 
 class ResolutionAction(Enum):
     """Actions that can be taken to resolve conflicts."""
@@ -24,17 +114,89 @@ class ResolutionAction(Enum):
     ABORT = "abort"
 
 
+class ResolutionOption(NamedTuple):
+    """One entry of a conflict resolution menu."""
+    action: ResolutionAction
+    description: str
+    key: str
+    warning: Optional[str] = None
+
+
+_SKIP_AND_ABORT = (
+    ResolutionOption(ResolutionAction.SKIP, 'Skip this conflict (leave unresolved)', 's'),
+    ResolutionOption(ResolutionAction.ABORT, 'Abort entire merge', 'a'),
+)
+
+# Menus for DAG conflicts: merges creating a cycle, edge conflicts, the rest
+_CYCLE_OPTIONS = (
+    ResolutionOption(ResolutionAction.KEEP_LOCAL, 'Break cycle by removing remote edges', '1'),
+    ResolutionOption(ResolutionAction.KEEP_REMOTE, 'Break cycle by removing local edges', '2'),
+    ResolutionOption(ResolutionAction.MANUAL_EDIT,
+                     'Manually edit dependencies to break cycle', '3'),
+) + _SKIP_AND_ABORT
+_EDGE_OPTIONS = (
+    ResolutionOption(ResolutionAction.KEEP_LOCAL, 'Use local branch dependencies', '1'),
+    ResolutionOption(ResolutionAction.KEEP_REMOTE, 'Use remote branch dependencies', '2'),
+    ResolutionOption(ResolutionAction.KEEP_BOTH, 'Merge dependencies from both branches', '3'),
+) + _SKIP_AND_ABORT
+_DAG_OPTIONS = (
+    ResolutionOption(ResolutionAction.KEEP_LOCAL, 'Keep local version', '1'),
+    ResolutionOption(ResolutionAction.KEEP_REMOTE, 'Keep remote version', '2'),
+) + _SKIP_AND_ABORT
+
+# Menus for config conflicts: UUID clashes and the rest
+_UUID_WARNING = 'Warning: Changing UUIDs may break dependencies'
+_UUID_OPTIONS = (
+    ResolutionOption(ResolutionAction.KEEP_LOCAL, 'Keep local UUID (may break references)',
+                     '1', _UUID_WARNING),
+    ResolutionOption(ResolutionAction.KEEP_REMOTE, 'Keep remote UUID (may break references)',
+                     '2', _UUID_WARNING),
+    ResolutionOption(ResolutionAction.MANUAL_EDIT, 'Edit file to resolve UUID conflict', '3'),
+) + _SKIP_AND_ABORT
+_CONFIG_OPTIONS = (
+    ResolutionOption(ResolutionAction.KEEP_LOCAL, 'Keep local version of file', '1'),
+    ResolutionOption(ResolutionAction.KEEP_REMOTE, 'Keep remote version of file', '2'),
+    ResolutionOption(ResolutionAction.KEEP_BOTH, 'Merge contents from both versions', '3'),
+    ResolutionOption(ResolutionAction.MANUAL_EDIT,
+                     'Edit file manually to resolve conflict', '4'),
+) + _SKIP_AND_ABORT
+
+# Menu for conflicts of any other type
+_GENERIC_OPTIONS = (
+    ResolutionOption(ResolutionAction.KEEP_LOCAL, 'Keep local version', '1'),
+    ResolutionOption(ResolutionAction.KEEP_REMOTE, 'Keep remote version', '2'),
+    ResolutionOption(ResolutionAction.SKIP, 'Skip this conflict', 's'),
+    ResolutionOption(ResolutionAction.ABORT, 'Abort merge', 'a'),
+)
+
+
 class MergeResolver:
     """Interactive resolver for merge conflicts."""
 
     def __init__(self, use_color: bool = True):
-        self.use_color = use_color and sys.stdout.isatty()
+        self.use_color = use_color and _is_terminal(sys.stdout)
         self.visualizer = DAGVisualizer(use_unicode=True)
         self.resolved_conflicts = []
         self.pending_conflicts = []
+        # Interactive output is collected here and written out in one go
+        # before each prompt, instead of one stdout write per line.
+        self._out = io.StringIO()
+        # Rendered previews keyed by the node and edge sets of their DAGs
+        self._preview_cache = OrderedDict()
+
+    def _emit(self, text: str) -> None:
+        """Queue text for the terminal; it is written on the next flush."""
+        self._out.write(text)
+
+    def _flush(self) -> None:
+        """Write the queued output to stdout and flush it."""
+        sys.stdout.write(self._out.getvalue())
+        self._out.seek(0)
+        self._out.truncate()
+        sys.stdout.flush()
 
     def resolve_conflicts_interactively(self, conflicts: List[Dict],
-                                        context: Dict[str, Any] = None) -> Dict[str, Any]:
+                                        context: Dict[str, Any] = None) -> Mapping[str, Any]:
         """
         Resolve conflicts interactively with user guidance.
 
@@ -43,20 +205,13 @@ class MergeResolver:
             context: Additional context for resolution
 
         Returns:
-            Dictionary with resolution results
+            Dictionary with resolution results; with no conflicts this is a
+            shared read-only mapping, which must not be modified
         """
         if not conflicts:
-            return {
-                'success': True,
-                'resolved': 0,
-                'skipped': 0,
-                'remaining': 0,
-                'actions': []
-            }
-
-        print("\n" + "=" * 80)
-        print("CELEBI MERGE CONFLICT RESOLUTION")
-        print("=" * 80)
+            return _NO_CONFLICTS_RESULT
+
+        self._emit(f"\n{_RULE}CELEBI MERGE CONFLICT RESOLUTION\n{_RULE}")
 
         # Show summary
         self._show_conflict_summary(conflicts)
@@ -75,9 +230,7 @@ class MergeResolver:
 
         # Resolve DAG conflicts first (most critical)
         if 'dag' in grouped_conflicts:
-            print("\n" + "-" * 80)
-            print("RESOLVING DEPENDENCY GRAPH CONFLICTS")
-            print("-" * 80)
+            self._emit(f"\n{_SEP}RESOLVING DEPENDENCY GRAPH CONFLICTS\n{_SEP}")
             dag_results = self._resolve_dag_conflicts(grouped_conflicts['dag'], context)
             results['resolved'] += dag_results['resolved']
             results['skipped'] += dag_results['skipped']
@@ -85,9 +238,7 @@ class MergeResolver:
 
         # Resolve config conflicts
         if 'config' in grouped_conflicts:
-            print("\n" + "-" * 80)
-            print("RESOLVING CONFIGURATION FILE CONFLICTS")
-            print("-" * 80)
+            self._emit(f"\n{_SEP}RESOLVING CONFIGURATION FILE CONFLICTS\n{_SEP}")
             config_results = self._resolve_config_conflicts(grouped_conflicts['config'], context)
             results['resolved'] += config_results['resolved']
             results['skipped'] += config_results['skipped']
@@ -98,9 +249,7 @@ class MergeResolver:
             t for t in grouped_conflicts if t not in ['dag', 'config']
         ]
         for conflict_type in other_types:
-            print("\n" + "-" * 80)
-            print(f"RESOLVING {conflict_type.upper()} CONFLICTS")
-            print("-" * 80)
+            self._emit(f"\n{_SEP}RESOLVING {conflict_type.upper()} CONFLICTS\n{_SEP}")
             type_results = self._resolve_generic_conflicts(
                 grouped_conflicts[conflict_type],
                 context,
@@ -115,57 +264,43 @@ class MergeResolver:
 
         # Show final summary
         self._show_resolution_summary(results)
+        self._flush()
 
         return results
 
     def _show_conflict_summary(self, conflicts: List[Dict]):
         """Show summary of all conflicts."""
-        print(f"\nFound {len(conflicts)} conflict(s):")
+        self._emit(f"\nFound {len(conflicts)} conflict(s):\n")
 
         # Count by type
-        type_counts = {}
-        for conflict in conflicts:
-            conflict_type = conflict.get('type', 'unknown')
-            type_counts[conflict_type] = type_counts.get(conflict_type, 0) + 1
-
+        type_counts = Counter(conflict.get('type', 'unknown') for conflict in conflicts)
         for conflict_type, count in type_counts.items():
-            print(f"  {conflict_type}: {count}")
-
-        # Show most critical conflicts first
-        critical_types = ['cycle_creation', 'uuid_conflict', 'dag_conflict']
-        critical_conflicts = [c for c in conflicts if c.get('type') in critical_types]
-
-        if critical_conflicts:
-            print("\nCRITICAL CONFLICTS (require immediate attention):")
-            for conflict in critical_conflicts[:3]:  # Show first 3
-                print(f"  • {conflict.get('description', 'Unknown')}")
-            if len(critical_conflicts) > 3:
-                print(f"  ... and {len(critical_conflicts) - 3} more")
+            self._emit(f"  {conflict_type}: {count}\n")
+
+        # Show most critical conflicts first; the counts give their total, so
+        # only the first few are looked up
+        critical_count = sum(type_counts[t] for t in _CRITICAL_TYPES)
+        if critical_count:
+            self._emit("\nCRITICAL CONFLICTS (require immediate attention):\n")
+            critical_conflicts = (
+                c for c in conflicts if c.get('type', 'unknown') in _CRITICAL_TYPES
+            )
+            for conflict in itertools.islice(critical_conflicts, 3):  # Show first 3
+                self._emit(f"  • {conflict.get('description', 'Unknown')}\n")
+            if critical_count > 3:
+                self._emit(f"  ... and {critical_count - 3} more\n")
 
     def _group_conflicts_by_type(self, conflicts: List[Dict]) -> Dict[str, List[Dict]]:
         """Group conflicts by their type."""
-        groups = {}
+        groups = defaultdict(list)
 
         for conflict in conflicts:
             conflict_type = conflict.get('type', 'unknown')
-
-            # Map to broader categories
-            if 'dag' in conflict_type or 'cycle' in conflict_type or 'edge' in conflict_type:
-                category = 'dag'
-            elif 'config' in conflict_type or 'yaml' in conflict_type or 'json' in conflict_type:
-                category = 'config'
-            elif 'uuid' in conflict_type:
-                category = 'uuid'
-            elif 'alias' in conflict_type:
-                category = 'alias'
-            else:
-                category = 'other'
-
-            if category not in groups:
-                groups[category] = []
+            category = (_TYPE_TO_CATEGORY.get(conflict_type)
+                        or _category_from_type_name(conflict_type))
             groups[category].append(conflict)
 
-        return groups
+        return dict(groups)
 
     def _resolve_dag_conflicts(
         self,
@@ -180,8 +315,8 @@ class MergeResolver:
         }
 
         for i, conflict in enumerate(conflicts, 1):
-            print(f"\nDAG Conflict {i}/{len(conflicts)}:")
-            print(f"  {conflict.get('description', 'Unknown conflict')}")
+            self._emit(f"\nDAG Conflict {i}/{len(conflicts)}:\n")
+            self._emit(f"  {conflict.get('description', 'Unknown conflict')}\n")
 
             # Show visualization if available
             if 'local' in conflict and 'remote' in conflict:
@@ -194,7 +329,7 @@ class MergeResolver:
             choice = self._present_resolution_options(options, conflict)
 
             if choice == ResolutionAction.SKIP:
-                print("  Skipping conflict (will remain unresolved)")
+                self._emit("  Skipping conflict (will remain unresolved)\n")
                 results['skipped'] += 1
                 results['actions'].append({
                     'conflict': conflict.get('description'),
@@ -202,7 +337,8 @@ class MergeResolver:
                     'reason': 'user_choice'
                 })
             elif choice == ResolutionAction.ABORT:
-                print("  Merge aborted by user")
+                self._emit("  Merge aborted by user\n")
+                self._flush()
                 return results  # Early exit
             else:
                 # Apply resolution
@@ -214,7 +350,7 @@ class MergeResolver:
                         'action': choice.value,
                         'details': action_result.get('details')
                     })
-                    print(f"  Conflict resolved ({choice.value})")
+                    self._emit(f"  Conflict resolved ({choice.value})\n")
                 else:
                     results['skipped'] += 1
                     results['actions'].append({
@@ -222,103 +358,47 @@ class MergeResolver:
                         'action': 'failed',
                         'error': action_result.get('error')
                     })
-                    print(f"  Failed to resolve: {action_result.get('error')}")
+                    self._emit(f"  Failed to resolve: {action_result.get('error')}\n")
 
+        self._flush()
         return results
 
     def _show_dag_diff(self, local_data: Any, remote_data: Any):
         """Show DAG difference visualization."""
         # This would use the DAGVisualizer to show differences
         # For now, show simple text representation
-        print("\n  Differences:")
+        self._emit("\n  Differences:\n")
         if isinstance(local_data, list) and isinstance(remote_data, list):
-            local_only = set(local_data) - set(remote_data)
-            remote_only = set(remote_data) - set(local_data)
+            local_set = set(local_data)
+            remote_set = set(remote_data)
+            local_only = local_set.difference(remote_set)
+            remote_only = remote_set.difference(local_set)
 
             if local_only:
-                print("    Local only:", ', '.join(str(x) for x in local_only))
+                self._emit("    Local only: " + ', '.join(map(str, local_only)) + "\n")
             if remote_only:
-                print("    Remote only:", ', '.join(str(x) for x in remote_only))
+                self._emit("    Remote only: " + ', '.join(map(str, remote_only)) + "\n")
         elif isinstance(local_data, dict) and isinstance(remote_data, dict):
-            all_keys = set(local_data.keys()) | set(remote_data.keys())
-            for key in all_keys:
-                local_val = local_data.get(key)
+            for key, local_val in local_data.items():
                 remote_val = remote_data.get(key)
                 if local_val != remote_val:
-                    print(f"    {key}: local={local_val}, remote={remote_val}")
-
-    def _get_dag_resolution_options(self, conflict: Dict) -> List[Dict]:
+                    self._emit(f"    {key}: local={local_val}, remote={remote_val}\n")
+            # Keys missing locally read as None, as they do in the loop above
+            for key, remote_val in remote_data.items():
+                if key not in local_data and remote_val is not None:
+                    self._emit(f"    {key}: local=None, remote={remote_val}\n")
+
+    def _get_dag_resolution_options(
+        self, conflict: Dict,
+    ) -> Tuple[ResolutionOption, ...]:
         """Get resolution options for a DAG conflict."""
         conflict_type = conflict.get('type')
 
-        options = []
-
         if conflict_type == 'cycle_creation':
-            options.extend([
-                {
-                    'action': ResolutionAction.KEEP_LOCAL,
-                    'description': 'Break cycle by removing remote edges',
-                    'key': '1'
-                },
-                {
-                    'action': ResolutionAction.KEEP_REMOTE,
-                    'description': 'Break cycle by removing local edges',
-                    'key': '2'
-                },
-                {
-                    'action': ResolutionAction.MANUAL_EDIT,
-                    'description': 'Manually edit dependencies to break cycle',
-                    'key': '3'
-                }
-            ])
-        elif conflict_type in ['additive_edge', 'subtractive_edge', 'contradictory_edge']:
-            options.extend([
-                {
-                    'action': ResolutionAction.KEEP_LOCAL,
-                    'description': 'Use local branch dependencies',
-                    'key': '1'
-                },
-                {
-                    'action': ResolutionAction.KEEP_REMOTE,
-                    'description': 'Use remote branch dependencies',
-                    'key': '2'
-                },
-                {
-                    'action': ResolutionAction.KEEP_BOTH,
-                    'description': 'Merge dependencies from both branches',
-                    'key': '3'
-                }
-            ])
-        else:
-            # Generic options
-            options.extend([
-                {
-                    'action': ResolutionAction.KEEP_LOCAL,
-                    'description': 'Keep local version',
-                    'key': '1'
-                },
-                {
-                    'action': ResolutionAction.KEEP_REMOTE,
-                    'description': 'Keep remote version',
-                    'key': '2'
-                }
-            ])
-
-        # Always include skip and abort options
-        options.extend([
-            {
-                'action': ResolutionAction.SKIP,
-                'description': 'Skip this conflict (leave unresolved)',
-                'key': 's'
-            },
-            {
-                'action': ResolutionAction.ABORT,
-                'description': 'Abort entire merge',
-                'key': 'a'
-            }
-        ])
-
-        return options
+            return _CYCLE_OPTIONS
+        if conflict_type in _EDGE_CONFLICT_TYPES:
+            return _EDGE_OPTIONS
+        return _DAG_OPTIONS
 
     def _resolve_config_conflicts(
         self,
@@ -333,12 +413,12 @@ class MergeResolver:
         }
 
         for i, conflict in enumerate(conflicts, 1):
-            print(f"\nConfig Conflict {i}/{len(conflicts)}:")
-            print(f"  {conflict.get('description', 'Unknown conflict')}")
+            self._emit(f"\nConfig Conflict {i}/{len(conflicts)}:\n")
+            self._emit(f"  {conflict.get('description', 'Unknown conflict')}\n")
 
             # Show file content diff if available
             if 'file' in conflict:
-                print(f"  File: {conflict['file']}")
+                self._emit(f"  File: {conflict['file']}\n")
 
             # Get resolution options
             options = self._get_config_resolution_options(conflict)
@@ -347,7 +427,7 @@ class MergeResolver:
             choice = self._present_resolution_options(options, conflict)
 
             if choice == ResolutionAction.SKIP:
-                print("  Skipping conflict (will remain unresolved)")
+                self._emit("  Skipping conflict (will remain unresolved)\n")
                 results['skipped'] += 1
                 results['actions'].append({
                     'conflict': conflict.get('description'),
@@ -355,7 +435,8 @@ class MergeResolver:
                     'reason': 'user_choice'
                 })
             elif choice == ResolutionAction.ABORT:
-                print("  Merge aborted by user")
+                self._emit("  Merge aborted by user\n")
+                self._flush()
                 return results  # Early exit
             elif choice == ResolutionAction.MANUAL_EDIT:
                 # Launch editor for manual resolution
@@ -368,7 +449,7 @@ class MergeResolver:
                             'action': 'manual_edit',
                             'file': conflict['file']
                         })
-                        print("  File edited manually")
+                        self._emit("  File edited manually\n")
                     else:
                         results['skipped'] += 1
                         results['actions'].append({
@@ -376,7 +457,7 @@ class MergeResolver:
                             'action': 'edit_failed',
                             'file': conflict['file']
                         })
-                        print("  Manual edit failed or cancelled")
+                        self._emit("  Manual edit failed or cancelled\n")
             else:
                 # Apply automatic resolution
                 action_result = self._apply_config_resolution(conflict, choice)
@@ -387,7 +468,7 @@ class MergeResolver:
                         'action': choice.value,
                         'details': action_result.get('details')
                     })
-                    print(f"  Conflict resolved ({choice.value})")
+                    self._emit(f"  Conflict resolved ({choice.value})\n")
                 else:
                     results['skipped'] += 1
                     results['actions'].append({
@@ -395,76 +476,18 @@ class MergeResolver:
                         'action': 'failed',
                         'error': action_result.get('error')
                     })
-                    print(f"  Failed to resolve: {action_result.get('error')}")
+                    self._emit(f"  Failed to resolve: {action_result.get('error')}\n")
 
+        self._flush()
         return results
 
-    def _get_config_resolution_options(self, conflict: Dict) -> List[Dict]:
+    def _get_config_resolution_options(
+        self, conflict: Dict,
+    ) -> Tuple[ResolutionOption, ...]:
         """Get resolution options for a config conflict."""
-        conflict_type = conflict.get('type')
-
-        options = []
-
-        if conflict_type == 'uuid_conflict':
-            options.extend([
-                {
-                    'action': ResolutionAction.KEEP_LOCAL,
-                    'description': 'Keep local UUID (may break references)',
-                    'key': '1',
-                    'warning': 'Warning: Changing UUIDs may break dependencies'
-                },
-                {
-                    'action': ResolutionAction.KEEP_REMOTE,
-                    'description': 'Keep remote UUID (may break references)',
-                    'key': '2',
-                    'warning': 'Warning: Changing UUIDs may break dependencies'
-                },
-                {
-                    'action': ResolutionAction.MANUAL_EDIT,
-                    'description': 'Edit file to resolve UUID conflict',
-                    'key': '3'
-                }
-            ])
-        else:
-            # Generic config options
-            options.extend([
-                {
-                    'action': ResolutionAction.KEEP_LOCAL,
-                    'description': 'Keep local version of file',
-                    'key': '1'
-                },
-                {
-                    'action': ResolutionAction.KEEP_REMOTE,
-                    'description': 'Keep remote version of file',
-                    'key': '2'
-                },
-                {
-                    'action': ResolutionAction.KEEP_BOTH,
-                    'description': 'Merge contents from both versions',
-                    'key': '3'
-                },
-                {
-                    'action': ResolutionAction.MANUAL_EDIT,
-                    'description': 'Edit file manually to resolve conflict',
-                    'key': '4'
-                }
-            ])
-
-        # Always include skip and abort options
-        options.extend([
-            {
-                'action': ResolutionAction.SKIP,
-                'description': 'Skip this conflict (leave unresolved)',
-                'key': 's'
-            },
-            {
-                'action': ResolutionAction.ABORT,
-                'description': 'Abort entire merge',
-                'key': 'a'
-            }
-        ])
-
-        return options
+        if conflict.get('type') == 'uuid_conflict':
+            return _UUID_OPTIONS
+        return _CONFIG_OPTIONS
 
     def _resolve_generic_conflicts(
         self,
@@ -479,45 +502,22 @@ class MergeResolver:
         }
 
         for i, conflict in enumerate(conflicts, 1):
-            print(f"\nConflict {i}/{len(conflicts)}:")
-            print(f"  Type: {conflict.get('type', 'unknown')}")
-            print(f"  {conflict.get('description', 'Unknown conflict')}")
-
-            # Generic resolution options
-            options = [
-                {
-                    'action': ResolutionAction.KEEP_LOCAL,
-                    'description': 'Keep local version',
-                    'key': '1'
-                },
-                {
-                    'action': ResolutionAction.KEEP_REMOTE,
-                    'description': 'Keep remote version',
-                    'key': '2'
-                },
-                {
-                    'action': ResolutionAction.SKIP,
-                    'description': 'Skip this conflict',
-                    'key': 's'
-                },
-                {
-                    'action': ResolutionAction.ABORT,
-                    'description': 'Abort merge',
-                    'key': 'a'
-                }
-            ]
+            self._emit(f"\nConflict {i}/{len(conflicts)}:\n")
+            self._emit(f"  Type: {conflict.get('type', 'unknown')}\n")
+            self._emit(f"  {conflict.get('description', 'Unknown conflict')}\n")
 
-            choice = self._present_resolution_options(options, conflict)
+            choice = self._present_resolution_options(_GENERIC_OPTIONS, conflict)
 
             if choice == ResolutionAction.SKIP:
-                print("  Skipping conflict")
+                self._emit("  Skipping conflict\n")
                 results['skipped'] += 1
                 results['actions'].append({
                     'conflict': conflict.get('description'),
                     'action': 'skipped'
                 })
             elif choice == ResolutionAction.ABORT:
-                print("  Merge aborted")
+                self._emit("  Merge aborted\n")
+                self._flush()
                 return results
             else:
                 # Apply resolution
@@ -526,40 +526,41 @@ class MergeResolver:
                     'conflict': conflict.get('description'),
                     'action': choice.value
                 })
-                print(f"  Conflict resolved ({choice.value})")
+                self._emit(f"  Conflict resolved ({choice.value})\n")
 
+        self._flush()
         return results
 
     def _present_resolution_options(
         self,
-        options: List[Dict],
+        options: Sequence[ResolutionOption],
         _conflict: Dict,
     ) -> ResolutionAction:
         """Present resolution options to user and get their choice."""
-        print("\n  Resolution options:")
+        self._emit("\n  Resolution options:\n")
 
         for option in options:
-            key = option.get('key', '?')
-            description = option.get('description', 'No description')
-            warning = option.get('warning')
-
-            if warning and self.use_color:
-                print(f"    [{key}] {description} \033[93m({warning})\033[0m")
+            if option.warning and self.use_color:
+                self._emit(f"    [{option.key}] {option.description}"
+                           f"{_WARNING_OPEN}{option.warning}{_WARNING_CLOSE}\n")
             else:
-                print(f"    [{key}] {description}")
+                self._emit(f"    [{option.key}] {option.description}\n")
+
+        keymap = {option.key: option.action for option in options}
+        valid_keys = "/".join(keymap)
 
         while True:
             try:
+                self._flush()
                 choice = input("\n  Choose option: ").strip().lower()
 
-                # Find matching option
-                for option in options:
-                    if option.get('key') == choice:
-                        return option['action']
+                action = keymap.get(choice)
+                if action is not None:
+                    return action
 
-                print(f"  Invalid choice: {choice}")
+                self._emit(f"  Invalid choice: {choice} (expected {valid_keys})\n")
             except (EOFError, KeyboardInterrupt):
-                print("\n  Input interrupted, aborting merge")
+                self._emit("\n  Input interrupted, aborting merge\n")
                 return ResolutionAction.ABORT
 
     def _apply_dag_resolution(
@@ -592,48 +593,45 @@ class MergeResolver:
         """Launch editor for manual file editing."""
         editor = os.environ.get('EDITOR', 'vim')
 
-        print(f"  Opening {file_path} in {editor}...")
-        print("  Edit the file to resolve conflicts, then save and exit.")
+        self._emit(f"  Opening {file_path} in {editor}...\n")
+        self._emit("  Edit the file to resolve conflicts, then save and exit.\n")
 
+        self._flush()
         try:
-            import subprocess
-            result = subprocess.run([editor, file_path], check=False)
-            return not result.returncode
+            return not subprocess.run([editor, file_path], check=False).returncode
         except Exception as e:
-            print(f"  Failed to open editor: {e}")
+            self._emit(f"  Failed to open editor: {e}\n")
             return False
 
     def _show_resolution_summary(self, results: Dict[str, Any]):
         """Show summary of resolution results."""
-        print("\n" + "=" * 80)
-        print("RESOLUTION SUMMARY")
-        print("=" * 80)
+        self._emit(f"\n{_RULE}RESOLUTION SUMMARY\n{_RULE}")
 
         total = results['resolved'] + results['skipped'] + results['remaining']
 
-        print(f"\nTotal conflicts: {total}")
-        print(f"Resolved: {results['resolved']}")
-        print(f"Skipped: {results['skipped']}")
-        print(f"Remaining: {results['remaining']}")
+        self._emit(f"\nTotal conflicts: {total}\n")
+        self._emit(f"Resolved: {results['resolved']}\n")
+        self._emit(f"Skipped: {results['skipped']}\n")
+        self._emit(f"Remaining: {results['remaining']}\n")
 
         if results['success']:
-            print("\n✓ All conflicts resolved successfully!")
+            self._emit("\n✓ All conflicts resolved successfully!\n")
         else:
-            print(f"\n⚠ {results['remaining']} conflict(s) remain unresolved")
+            self._emit(f"\n⚠ {results['remaining']} conflict(s) remain unresolved\n")
 
         # Show actions taken
         if results['actions']:
-            print("\nActions taken:")
-            for action in results['actions'][:10]:  # Show first 10
+            self._emit("\nActions taken:\n")
+            for action in itertools.islice(results['actions'], 10):  # Show first 10
                 conflict_desc = action.get('conflict', 'Unknown')
-                if len(conflict_desc) > 50:
-                    conflict_desc = conflict_desc[:47] + "..."
-                print(f"  • {conflict_desc}: {action.get('action', 'unknown')}")
+                if len(conflict_desc) > _SUMMARY_DESC_WIDTH:
+                    conflict_desc = conflict_desc[:_SUMMARY_DESC_WIDTH - 3] + "..."
+                self._emit(f"  • {conflict_desc}: {action.get('action', 'unknown')}\n")
 
             if len(results['actions']) > 10:
-                print(f"  ... and {len(results['actions']) - 10} more actions")
+                self._emit(f"  ... and {len(results['actions']) - 10} more actions\n")
 
-    def preview_merge(  # pylint: disable=too-many-locals
+    def preview_merge(
         self,
         local_dag,
         remote_dag,
@@ -642,6 +640,9 @@ class MergeResolver:
         """
         Generate a preview of merge results.
 
+        Previews are cached by the node and edge sets of the three DAGs, so
+        asking again for unchanged branches does not redo the merge.
+
         Args:
             local_dag: Local branch DAG
             remote_dag: Remote branch DAG
@@ -650,76 +651,97 @@ class MergeResolver:
         Returns:
             Preview text
         """
-        from ..kernel.vobj_arc_merge import DAGMerger
-
-        merger = DAGMerger()
+        try:
+            key = tuple(
+                (frozenset(dag.nodes), frozenset(dag.edges))
+                for dag in (local_dag, remote_dag, base_dag)
+            )
+        except TypeError:
+            # Not a networkx graph; render it without caching
+            key = None
+        if key in self._preview_cache:
+            self._preview_cache.move_to_end(key)
+            return self._preview_cache[key]
+
+        preview = self._render_preview(local_dag, remote_dag, base_dag)
+        if key is not None:
+            self._preview_cache[key] = preview
+            if len(self._preview_cache) > _PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+        return preview
+
+    def _render_preview(  # pylint: disable=too-many-locals
+        self,
+        local_dag,
+        remote_dag,
+        base_dag,
+    ) -> str:
+        """Merge the DAGs and render the preview text for preview_merge."""
+        merger = vobj_arc_merge.DAGMerger()
         merged_dag = merger.merge_dags(local_dag, remote_dag, base_dag)
         conflicts = merger.get_conflicts()
 
-        output = []
-        output.append("MERGE PREVIEW")
-        output.append("=" * 80)
+        buf = io.StringIO()
+        write = buf.write
+        write("MERGE PREVIEW\n")
+        write(_RULE)
 
         # Show DAG statistics
-        output.append("\nDAG Statistics:")
-        output.append(f"  Local nodes: {local_dag.number_of_nodes()}")
-        output.append(f"  Local edges: {local_dag.number_of_edges()}")
-        output.append(f"  Remote nodes: {remote_dag.number_of_nodes()}")
-        output.append(f"  Remote edges: {remote_dag.number_of_edges()}")
-        output.append(f"  Merged nodes: {merged_dag.number_of_nodes()}")
-        output.append(f"  Merged edges: {merged_dag.number_of_edges()}")
+        write("\nDAG Statistics:\n")
+        write(f"  Local nodes: {local_dag.number_of_nodes()}\n")
+        write(f"  Local edges: {local_dag.number_of_edges()}\n")
+        write(f"  Remote nodes: {remote_dag.number_of_nodes()}\n")
+        write(f"  Remote edges: {remote_dag.number_of_edges()}\n")
+        write(f"  Merged nodes: {merged_dag.number_of_nodes()}\n")
+        write(f"  Merged edges: {merged_dag.number_of_edges()}\n")
 
         # Show conflicts
         if conflicts:
-            output.append(f"\nPotential conflicts: {len(conflicts)}")
+            write(f"\nPotential conflicts: {len(conflicts)}\n")
             for i, conflict in enumerate(conflicts[:5], 1):  # Show first 5
-                output.append(f"  {i}. {conflict.description}")
+                write(f"  {i}. {conflict.description}\n")
             if len(conflicts) > 5:
-                output.append(f"  ... and {len(conflicts) - 5} more")
+                write(f"  ... and {len(conflicts) - 5} more\n")
         else:
-            output.append("\nNo conflicts detected")
+            write("\nNo conflicts detected\n")
 
         # Show visualization
-        output.append("\nMerged DAG structure:")
+        write("\nMerged DAG structure:\n")
         try:
             # Try to show topological layers
-            import networkx as nx
             topo_order = list(nx.topological_sort(merged_dag))
             layers = self._assign_layers(merged_dag, topo_order)
 
             for layer_idx, layer_nodes in enumerate(layers):
-                node_names = [self._get_node_name(n) for n in layer_nodes]
-                output.append(f"  Layer {layer_idx + 1}: {', '.join(node_names)}")
+                node_names = map(self._get_node_name, layer_nodes)
+                write(f"  Layer {layer_idx + 1}: {', '.join(node_names)}\n")
 
         except Exception:
-            output.append("  (Could not generate topological layout)")
+            write("  (Could not generate topological layout)\n")
 
-        return '\n'.join(output)
+        # Drop the newline after the last line, as '\n'.join did
+        return buf.getvalue()[:-1]
 
     def _assign_layers(self, graph, topological_order):
         """Assign nodes to layers based on longest path."""
-        # Simplified version from DAGVisualizer
-        longest_path = {}
-        for node in topological_order:
-            preds = list(graph.predecessors(node))
-            if not preds:
-                longest_path[node] = 0
-            else:
-                longest_path[node] = max(longest_path[p] for p in preds) + 1
-
-        max_layer = max(longest_path.values()) if longest_path else 0
+        # Simplified version from DAGVisualizer; longest paths are kept in a
+        # list indexed by topological position
+        index = {node: i for i, node in enumerate(topological_order)}
+        longest_path = [0] * len(topological_order)
+        for i, node in enumerate(topological_order):
+            depth = 0
+            for pred in graph.predecessors(node):
+                depth = max(depth, longest_path[index[pred]] + 1)
+            longest_path[i] = depth
+
+        max_layer = max(longest_path) if longest_path else 0
         layers = [[] for _ in range(max_layer + 1)]
 
-        for node, layer in longest_path.items():
+        for node, layer in zip(topological_order, longest_path):
             layers[layer].append(node)
 
         return layers
 
     def _get_node_name(self, node):
         """Get readable name for a node."""
-        if hasattr(node, 'invariant_path'):
-            path = node.invariant_path()
-            if '/' in path:
-                return path.split('/')[-1]
-            return path
-        return str(node)
+        return _node_name_accessor(type(node))(node)
@@ -1,5 +1,29 @@
-"""Shared manager instance for shell modules."""
+"""Shared manager instance and project path lookup for shell modules."""
+import os
 
 from ...interface.ChernManager import get_manager
+from ...utils import csys
 
 MANAGER = get_manager()
+
+# Project root of each working directory seen so far. Finding the root walks
+# up the tree with case-sensitive existence checks; only hits are kept, so a
+# project created later in the process is still found.
+_PROJECT_PATHS = {}
+
+
+def project_path(cwd: str = None) -> str:
+    """Return the project root of ``cwd`` (default: the working directory)."""
+    if cwd is None:
+        cwd = os.getcwd()
+    path = _PROJECT_PATHS.get(cwd)
+    if path is None:
+        path = csys.project_path(cwd)
+        if path:
+            _PROJECT_PATHS[cwd] = path
+    return path
+
+
+def forget_project_paths() -> None:
+    """Drop the remembered project roots, e.g. after switching projects."""
+    _PROJECT_PATHS.clear()
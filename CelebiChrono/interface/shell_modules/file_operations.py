@@ -4,6 +4,7 @@ File operations functions for shell interface.
 Functions for moving, copying, listing, removing files and directories.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from tqdm import tqdm
 
@@ -12,12 +13,13 @@ from ...utils.message import Message
 from ...kernel.vobject import VObject
 from ...kernel.vobj_file import LsParameters
 from ...interface.ChernManager import create_object_instance
-from ._manager import MANAGER
+from ._manager import MANAGER, project_path
 
 __all__ = [
     '_normalize_paths',
     '_validate_copy_operation',
     '_adjust_destination_path',
+    '_validate_and_adjust',
     'mv',
     'cp',
     'ls',
@@ -32,50 +34,68 @@ __all__ = [
     'send'
 ]
 
+# Entries of a task or algorithm that rm_file("*") leaves in place
+_PROTECTED_FILES = frozenset((".celebi", "celebi.yaml"))
+
+# Copies run by import_file("<dir>/*") at once; they are I/O bound
+_IMPORT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 def _normalize_paths(source: str, destination: str) -> tuple[str, str]:
     """Normalize source and destination paths."""
+    cwd = os.getcwd()
     if source.startswith("@/") or source == "@":
-        source = os.path.normpath(csys.project_path() + source.strip("@"))
+        source = os.path.normpath(project_path(cwd) + source.strip("@"))
     else:
-        source = os.path.abspath(source)
+        source = os.path.normpath(os.path.join(cwd, source))
 
     if destination.startswith("@/") or destination == "@":
-        destination = os.path.join(csys.project_path(), destination.strip("@"))
+        destination = os.path.normpath(project_path(cwd) + destination.strip("@"))
     else:
-        destination = os.path.abspath(destination)
+        destination = os.path.normpath(os.path.join(cwd, destination))
 
     return source, destination
 
 
+def _is_within(path: str, root: str) -> bool:
+    """Whether normalized ``path`` is ``root`` or lies below it."""
+    return bool(root) and (path == root or path.startswith(root.rstrip(os.sep) + os.sep))
+
+
+def _path_error(source: str, destination: str) -> str:
+    """Return why ``destination`` cannot receive ``source`` by path alone, or ''."""
+    # Skip the case that the source is the same as the destination
+    if source == destination:
+        return "Source is the same as destination"
+    # Skip the case that the destination is a subdirectory of the source
+    if _is_within(destination, source):
+        return "Destination is a subdirectory of source"
+    return ""
+
+
+def _existing_error(object_type: str) -> str:
+    """Return why an existing destination of ``object_type`` cannot be overwritten, or ''."""
+    if object_type in ("task", "algorithm"):
+        return "Destination is a task or algorithm"
+    if not object_type:
+        return "Illegal to copy"
+    return ""
+
+
 def _validate_copy_operation(source: str, destination: str) -> Message:
     """Validate if copy operation is allowed. Returns Message with errors if invalid."""
     message = Message()
     # Skip if the destination is outside the project
-    if os.path.relpath(destination, csys.project_path()).startswith(".."):
+    if not _is_within(destination, project_path()):
         message.add("Destination is outside the project", "error")
         return message
 
-    # Skip the case that the source is the same as the destination
-    if source == destination:
-        message.add("Source is the same as destination", "error")
-        return message
-
-    # Skip the case that the destination is a subdirectory of the source
-    if not os.path.relpath(destination, source).startswith(".."):
-        message.add("Destination is a subdirectory of source", "error")
-        return message
-
+    error = _path_error(source, destination)
     # Skip the case that the destination already exists and is restricted
-    if csys.exists(destination):
-        dest_obj = VObject(destination)
-        if dest_obj.is_task_or_algorithm():
-            message.add("Destination is a task or algorithm", "error")
-            return message
-        if dest_obj.is_zombie():
-            message.add("Illegal to copy", "error")
-            return message
-
+    if not error and csys.exists(destination):
+        error = _existing_error(VObject(destination).object_type())
+    if error:
+        message.add(error, "error")
     return message
 
 
@@ -88,6 +108,37 @@ def _adjust_destination_path(source: str, destination: str) -> str:
     return destination
 
 
+def _validate_and_adjust(source: str, destination: str) -> tuple[str, Message]:
+    """Validate a copy or move and resolve its final destination.
+
+    Does the work of _validate_copy_operation and _adjust_destination_path in
+    one pass, reading the destination's object type only once. An existing
+    directory destination becomes ``destination/basename(source)``, which
+    lies in the project as well and so only needs the remaining checks.
+
+    Returns:
+        The final destination, and a Message with errors if invalid.
+    """
+    message = Message()
+    if not _is_within(destination, project_path()):
+        message.add("Destination is outside the project", "error")
+        return destination, message
+
+    error = _path_error(source, destination)
+    if not error and csys.exists(destination):
+        # Every check below goes by the type in the object's config, so read it once
+        object_type = VObject(destination).object_type()
+        error = _existing_error(object_type)
+        if not error and object_type in ("directory", "project"):
+            destination = os.path.join(destination, os.path.basename(source))
+            error = _path_error(source, destination)
+            if not error and csys.exists(destination):
+                error = _existing_error(VObject(destination).object_type())
+    if error:
+        message.add(error, "error")
+    return destination, message
+
+
 def mv(source: str, destination: str) -> Message:
     """Move or rename objects within the current project.
 
@@ -118,16 +169,8 @@ def mv(source: str, destination: str) -> Message:
     """
     message = Message()
     source, destination = _normalize_paths(source, destination)
-    # Initial validation
-    validation = _validate_copy_operation(source, destination)
-    if not validation.success:
-        return validation
-
-    # Adjust destination if it's an existing directory
-    destination = _adjust_destination_path(source, destination)
-
-    # Validate again after path adjustment
-    validation = _validate_copy_operation(source, destination)
+    # Validate, descending into the destination if it is an existing directory
+    destination, validation = _validate_and_adjust(source, destination)
     if not validation.success:
         return validation
 
@@ -166,23 +209,16 @@ def cp(source: str, destination: str) -> Message:
     """
     message = Message()
     # Within a task or algorithm, use object-specific copy
-    if MANAGER.current_object().object_type() in ("task", "algorithm"):
-        MANAGER.current_object().cp(source, destination)
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() in ("task", "algorithm"):
+        current_obj.cp(source, destination)
         return message
 
     # Normalize paths
     source, destination = _normalize_paths(source, destination)
 
-    # Initial validation
-    validation = _validate_copy_operation(source, destination)
-    if not validation.success:
-        return validation
-
-    # Adjust destination if it's an existing directory
-    destination = _adjust_destination_path(source, destination)
-
-    # Validate again after path adjustment
-    validation = _validate_copy_operation(source, destination)
+    # Validate, descending into the destination if it is an existing directory
+    destination, validation = _validate_and_adjust(source, destination)
     if not validation.success:
         return validation
 
@@ -227,14 +263,16 @@ def ls(*args) -> Message:  # pylint: disable=too-many-return-statements
         path = args[0]
         # Resolve and validate the path
         path = csys.special_path_string(path)
+        cwd = os.getcwd()
+        project = project_path(cwd)
         if path.startswith("@/") or path == "@":
-            path = os.path.normpath(csys.project_path() + path.strip("@"))
+            path = os.path.normpath(project + path.strip("@"))
         else:
-            path = os.path.abspath(path)
+            path = os.path.normpath(os.path.join(cwd, path))
 
         # Check if path is within current project
         try:
-            if os.path.relpath(path, csys.project_path()).startswith(".."):
+            if os.path.relpath(path, project).startswith(".."):
                 msg = Message()
                 msg.add("[ERROR] Unable to list object outside the current project.", "error")
                 return msg
@@ -377,12 +415,14 @@ def rm(line: str) -> Message:
         - Returns Message with errors instead of raising exceptions
     """
     message = Message()
-    line = os.path.abspath(line)
+    cwd = os.getcwd()
+    project = project_path(cwd)
+    line = os.path.normpath(os.path.join(cwd, line))
     # Deal with the illegal operation
-    if line == csys.project_path():
+    if line == project:
         message.add("Unable to remove project", "error")
         return message
-    if os.path.relpath(line, csys.project_path()).startswith(".."):
+    if os.path.relpath(line, project).startswith(".."):
         message.add("Unable to remove directory outside the project", "error")
         return message
     if not csys.exists(line):
@@ -418,21 +458,21 @@ def rm_file(file_name: str) -> Message:
         - Returns Message with errors for failed operations
     """
     message = Message()
-    if MANAGER.current_object().object_type() not in ("task", "algorithm"):
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() not in ("task", "algorithm"):
         message.add("Unable to call rm_file if you are not in a task or algorithm.", "error")
         return message
     # Deal with * case
     if file_name == "*":
-        path = MANAGER.current_object().path
-        for current_file in os.listdir(path):
+        for current_file in os.listdir(current_obj.path):
             # protect .celebi and celebi.yaml
-            if current_file in (".celebi", "celebi.yaml"):
+            if current_file in _PROTECTED_FILES:
                 continue
-            result = MANAGER.current_object().rm_file(current_file)
+            result = current_obj.rm_file(current_file)
             if result.messages:
                 message.append(result)
         return message
-    result = MANAGER.current_object().rm_file(file_name)
+    result = current_obj.rm_file(file_name)
     if result.messages:
         message.append(result)
     return message
@@ -463,15 +503,30 @@ def mv_file(file_name: str, dest_file: str) -> Message:
         - Uses object-specific move_file() method
     """
     message = Message()
-    if MANAGER.current_object().object_type() not in ("task", "algorithm"):
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() not in ("task", "algorithm"):
         message.add("Unable to call mv_file if you are not in a task or algorithm.", "error")
         return message
-    result = MANAGER.current_object().move_file(file_name, dest_file)
+    result = current_obj.move_file(file_name, dest_file)
     if result.messages:
         message.append(result)
     return message
 
 
+def _entry_is_dir(entry: os.DirEntry):
+    """Whether a listed ``entry`` is a directory, or None if that is unknown.
+
+    The listing shows that files and directories exist, so import_file need
+    not check them again. Anything else, such as a dangling symlink, is left
+    to its own existence check.
+    """
+    if entry.is_dir():
+        return True
+    if entry.is_file():
+        return False
+    return None
+
+
 def import_file(filename: str) -> Message:
     """Import a file into current task or algorithm.
 
@@ -497,7 +552,8 @@ def import_file(filename: str) -> Message:
         - Shows import progress messages for each file
     """
     message = Message()
-    if MANAGER.current_object().object_type() not in ("task", "algorithm"):
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() not in ("task", "algorithm"):
         message.add("Unable to call importfile if you are not in a task or algorithm.", "error")
         return message
 
@@ -507,14 +563,21 @@ def import_file(filename: str) -> Message:
         if not os.path.isdir(filename):
             message.add("The path is not a directory", "error")
             return message
-        for file in os.listdir(filename):
-            message.add(f"Importing: from {os.path.join(filename, file)}\n", "info")
-            message.add(f"Importing: to {MANAGER.current_object().path}\n", "info")
-            result = MANAGER.current_object().import_file(os.path.join(filename, file))
-            if result.messages:
-                message.append(result)
+        with os.scandir(filename) as entries:
+            entries = list(entries)
+        # Each import is an independent copy, so run them side by side and
+        # report the results in directory order
+        with ThreadPoolExecutor(max_workers=_IMPORT_WORKERS) as executor:
+            results = executor.map(
+                lambda entry: current_obj.import_file(entry.path, _entry_is_dir(entry)),
+                entries)
+            for entry, result in zip(entries, results):
+                message.add(f"Importing: from {entry.path}\n", "info")
+                message.add(f"Importing: to {current_obj.path}\n", "info")
+                if result.messages:
+                    message.append(result)
         return message
-    result = MANAGER.current_object().import_file(filename)
+    result = current_obj.import_file(filename)
     if result.messages:
         message.append(result)
     return message
@@ -7,7 +7,7 @@ import os
 
 from ...utils import csys
 from ...utils.message import Message
-from ._manager import MANAGER
+from ._manager import MANAGER, forget_project_paths, project_path
 
 __all__ = [
     'cd_project',
@@ -42,6 +42,7 @@ def cd_project(line: str) -> Message:
     """
     message = Message()
     MANAGER.switch_project(line)
+    forget_project_paths()
     os.chdir(MANAGER.current_object().path)
     message.add(f"Switched to project: {line}", "success")
     return message
@@ -105,26 +106,25 @@ def cd(line: str) -> Message:
 
 def _cd_by_index(index: int) -> Message:
     """Change directory by numeric index."""
-    message = Message()
-    sub_objects = MANAGER.current_object().sub_objects()
-    successors_list = MANAGER.current_object().successors()
-    predecessors = MANAGER.current_object().predecessors()
-    total = len(sub_objects)
-
-    if index < total:
-        sub_objects.sort(key=lambda x: (x.object_type(), x.path))
-        return cd(MANAGER.current_object().relative_path(sub_objects[index].path))
-
-    index -= total
-    total = len(predecessors)
-    if index < total:
-        return cd(MANAGER.current_object().relative_path(predecessors[index].path))
-
-    index -= total
-    total = len(successors_list)
-    if index < total:
-        return cd(MANAGER.current_object().relative_path(successors_list[index].path))
+    # Indices run over sub-objects, then predecessors, then successors; each
+    # list is only fetched once the index is known to lie beyond the previous
+    current_obj = MANAGER.current_object()
+    sub_objects = current_obj.sub_objects()
+    if index < len(sub_objects):
+        paths = sorted((x.object_type(), x.path) for x in sub_objects)
+        return cd(current_obj.relative_path(paths[index][1]))
+
+    index -= len(sub_objects)
+    predecessors = current_obj.predecessors()
+    if index < len(predecessors):
+        return cd(current_obj.relative_path(predecessors[index].path))
+
+    index -= len(predecessors)
+    successors_list = current_obj.successors()
+    if index < len(successors_list):
+        return cd(current_obj.relative_path(successors_list[index].path))
 
+    message = Message()
     message.add("Out of index", "warning")
     return message
 
@@ -134,13 +134,15 @@ def _cd_by_path(line: str) -> Message:
     message = Message()
     # cd can be used to change directory using absolute path
     line = csys.special_path_string(line)
+    cwd = os.getcwd()
+    project = project_path(cwd)
     if line.startswith("@/") or line == "@":
-        line = csys.project_path() + line.strip("@")
+        line = project + line.strip("@")
     else:
-        line = os.path.abspath(line)
+        line = os.path.normpath(os.path.join(cwd, line))
 
     # Check available
-    if os.path.relpath(line, csys.project_path()).startswith(".."):
+    if os.path.relpath(line, project).startswith(".."):
         message.add("[ERROR] Unable to navigate to a location "
                     "that is not within the project.", "error")
         return message
@@ -18,6 +18,19 @@ from ...kernel.vdirectory import create_directory
 from ...kernel.chern_communicator import ChernCommunicator
 from ._manager import MANAGER
 
+# Object types that new objects may be created in
+_CONTAINER_TYPES = frozenset(("directory", "project"))
+
+
+def _refine_in_container(line: str) -> tuple[str, bool]:
+    """Refine ``line`` against the current object.
+
+    Returns the refined path and whether its parent is a directory or project.
+    """
+    line = csys.refine_path(line, MANAGER.current_object().path)
+    parent_path = os.path.dirname(os.path.abspath(line))
+    return line, VObject(parent_path).object_type() in _CONTAINER_TYPES
+
 
 def mkalgorithm(line: str, use_template: bool = False) -> Message:
     """Create a new algorithm object.
@@ -44,11 +57,9 @@ def mkalgorithm(line: str, use_template: bool = False) -> Message:
         Algorithms can only be created within directories or projects,
         not within other object types like tasks or data objects.
     """
-    line = csys.refine_path(line, MANAGER.current_object().path)
+    line, allowed = _refine_in_container(line)
     message = Message()
-    parent_path = os.path.abspath(line+"/..")
-    object_type = VObject(parent_path).object_type()
-    if object_type not in ("directory", "project"):
+    if not allowed:
         message.add("Not allowed to create algorithm here", "warning")
         return message
     create_algorithm(line, use_template)
@@ -79,11 +90,9 @@ def mktask(line: str) -> Message:
         Tasks can only be created within directories or projects,
         not within other object types like algorithms or data objects.
     """
-    line = csys.refine_path(line, MANAGER.current_object().path)
+    line, allowed = _refine_in_container(line)
     message = Message()
-    parent_path = os.path.abspath(line+"/..")
-    object_type = VObject(parent_path).object_type()
-    if object_type not in ("directory", "project"):
+    if not allowed:
         message.add("Not allowed to create task here", "warning")
         return message
     create_task(line)
@@ -115,11 +124,9 @@ def mkdata(line: str) -> Message:
         Data objects can only be created within directories or projects,
         not within other object types like tasks or algorithms.
     """
-    line = csys.refine_path(line, MANAGER.current_object().path)
+    line, allowed = _refine_in_container(line)
     message = Message()
-    parent_path = os.path.abspath(line+"/..")
-    object_type = VObject(parent_path).object_type()
-    if object_type not in ("directory", "project"):
+    if not allowed:
         message.add("Not allowed to create data here", "warning")
         return message
     create_data(line)
@@ -151,11 +158,9 @@ def mkdatalist(line: str) -> Message:
         not within other object types like tasks or algorithms.
         The datalist field in celebi.yaml stores the list of file paths.
     """
-    line = csys.refine_path(line, MANAGER.current_object().path)
+    line, allowed = _refine_in_container(line)
     message = Message()
-    parent_path = os.path.abspath(line+"/..")
-    object_type = VObject(parent_path).object_type()
-    if object_type not in ("directory", "project"):
+    if not allowed:
         message.add("Not allowed to create data list here", "warning")
         return message
     create_data_list(line)
@@ -185,11 +190,9 @@ def mkdir(line: str) -> Message:
         Directories can only be created within existing directories or
         projects, not within other object types like tasks or algorithms.
     """
-    line = csys.refine_path(line, MANAGER.current_object().path)
+    line, allowed = _refine_in_container(line)
     message = Message()
-    parent_path = os.path.abspath(line+"/..")
-    object_type = VObject(parent_path).object_type()
-    if object_type not in ("directory", "project"):
+    if not allowed:
         message.add("Not allowed to create directory here", "warning")
         return message
     create_directory(line)
@@ -267,9 +270,8 @@ def use_data(impression_uuid: str, path_override: str = "") -> Message:
         full_path = os.path.join(current_obj.path, task_path)
 
         if not os.path.exists(full_path):
-            parent_path = os.path.abspath(full_path + "/..")
-            object_type = VObject(parent_path).object_type()
-            if object_type not in ("directory", "project"):
+            parent_path = os.path.dirname(os.path.abspath(full_path))
+            if VObject(parent_path).object_type() not in _CONTAINER_TYPES:
                 message.add("Not allowed to create data task here", "warning")
                 return message
             create_rawdata_task(full_path, descriptor, data_md5)
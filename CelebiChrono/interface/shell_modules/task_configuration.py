@@ -3,15 +3,41 @@ Task configuration functions for shell interface.
 
 Functions for configuring tasks and algorithms: inputs, parameters, environment, etc.
 """
+import operator
 import os
 import subprocess
 
 from ...kernel.vobject import VObject
+from ...kernel.vtask import VTask
 from ...utils import metadata
 from ...utils.message import Message
 from ._manager import MANAGER
 
 
+def _by_index(objects):
+    """Return (index, ending, object) triples sorted by the _<index> path ending.
+
+    Returns None if some object's path does not end with _<index>.
+    """
+    indexed = []
+    for obj in objects:
+        ending = obj.path.rsplit("_", 1)[-1]
+        if not ending.isdigit():
+            return None
+        indexed.append((int(ending), ending, obj))
+    indexed.sort(key=operator.itemgetter(0))
+    return indexed
+
+
+def _task_children(current_obj):
+    """Yield the task sub-objects of ``current_obj`` as VTask instances."""
+    # The type is known from the filter, so build the VTask directly rather
+    # than through MANAGER.sub_object, which would read the config again
+    for obj in current_obj.sub_objects():
+        if obj.object_type() == "task":
+            yield VTask(obj.path)
+
+
 def jobs(_: str) -> Message:
     """Display job information for current algorithm or task.
 
@@ -37,20 +63,21 @@ def jobs(_: str) -> Message:
         - Use this command to monitor execution progress
     """
     message = Message()
-    object_type = MANAGER.current_object().object_type()
+    current_obj = MANAGER.current_object()
+    object_type = current_obj.object_type()
     if object_type in ("directory", "project"):
-        sub_objects = MANAGER.current_object().sub_objects()
+        sub_objects = current_obj.sub_objects()
         for obj in sub_objects:
             if obj.object_type() not in ("algorithm", "task"):
                 continue
-            obj_path = MANAGER.current_object().relative_path(obj.path)
+            obj_path = current_obj.relative_path(obj.path)
             task = MANAGER.sub_object(obj_path)
             task.jobs()
         return message
     if object_type not in ("algorithm", "task"):
         message.add("Not able to found job", "error")
         return message
-    MANAGER.current_object().jobs()
+    current_obj.jobs()
     return message
 
 
@@ -78,7 +105,7 @@ def status() -> Message:
     return MANAGER.current_object().printed_status()
 
 
-def add_input(path: str, alias: str) -> Message:  # pylint: disable=too-many-branches, too-many-return-statements
+def add_input(path: str, alias: str) -> Message:  # pylint: disable=too-many-return-statements, too-many-locals
     """Add an input to the current task or algorithm.
 
     Links an existing object (data, task output, or algorithm) as an input
@@ -102,53 +129,45 @@ def add_input(path: str, alias: str) -> Message:  # pylint: disable=too-many-bra
         - Aliases must be unique within the task/algorithm
     """
     message = Message()
-    if MANAGER.current_object().object_type() == "directory":
-        destination_path = MANAGER.current_object().relative_path(path)
-        dest_obj = VObject(os.path.join(MANAGER.current_object().path, destination_path))
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() == "directory":
+        destination_path = current_obj.relative_path(path)
+        dest_obj = VObject(os.path.join(current_obj.path, destination_path))
         if dest_obj.object_type() == "task":
-            sub_objects = MANAGER.current_object().sub_objects()
-            for obj in sub_objects:
-                if obj.object_type() != "task":
-                    continue
-                obj_path = MANAGER.current_object().relative_path(obj.path)
-                task = MANAGER.sub_object(obj_path)
+            for task in _task_children(current_obj):
                 task.add_input(path, alias)
         elif dest_obj.object_type() == "directory":
             dest_sub_objects = dest_obj.sub_objects()
-            sub_objects = MANAGER.current_object().sub_objects()
+            sub_objects = current_obj.sub_objects()
             if len(dest_sub_objects) != len(sub_objects):
                 message.add("The number of sub-objects does not match.", "error")
                 return message
             # Check whether the sub-objects name ends with _<index>
             # By getting the _<index> and check whether <index> is a digit
-            for obj in sub_objects:
-                ending = obj.path.split("_")[-1]
-                if not ending.isdigit():
-                    message.add("The sub-objects are not in indexed format.", "error")
-                    return message
-            for dest_obj in sub_objects:
-                ending = dest_obj.path.split("_")[-1]
-                if not ending.isdigit():
-                    message.add("The dest-sub-objects are not in indexed format.", "error")
-                    return message
-            # Sort both lists by the index
-            sub_objects.sort(key=lambda x: int(x.path.split("_")[-1]))
-            dest_sub_objects.sort(key=lambda x: int(x.path.split("_")[-1]))
+            indexed = _by_index(sub_objects)
+            if indexed is None:
+                message.add("The sub-objects are not in indexed format.", "error")
+                return message
+            dest_indexed = _by_index(dest_sub_objects)
+            if dest_indexed is None:
+                message.add("The dest-sub-objects are not in indexed format.", "error")
+                return message
             length = len(sub_objects)
-            for obj, dest_obj in zip(sub_objects, dest_sub_objects):
-                if obj.path.split("_")[-1] != dest_obj.path.split("_")[-1]:
+            step = length // 10 if length > 100 else 0
+            for (_, ending, obj), (index, dest_ending, dest_obj) in zip(indexed, dest_indexed):
+                if ending != dest_ending:
                     message.add("The sub-objects are not aligned.", "error")
                     return message
-                obj_path = MANAGER.current_object().relative_path(obj.path)
+                obj_path = current_obj.relative_path(obj.path)
                 task = MANAGER.sub_object(obj_path)
                 task.add_input(dest_obj.path, alias)
-                if length > 100 and not int(dest_obj.path.split("_")[-1]) % (length // 10):
-                    message.add(f"Progress: {int(dest_obj.path.split('_')[-1])}/{length}\n", "info")
+                if step and not index % step:
+                    message.add(f"Progress: {index}/{length}\n", "info")
         return message
-    if MANAGER.current_object().object_type() not in ("task", "algorithm"):
+    if current_obj.object_type() not in ("task", "algorithm"):
         message.add("Unable to call add_input if you are not in a task or algorithm.", "error")
         return message
-    MANAGER.current_object().add_input(path, alias)
+    current_obj.add_input(path, alias)
     return message
 
 
@@ -176,19 +195,15 @@ def add_algorithm(path: str) -> Message:
         - Algorithms are referenced by their object path within the task
     """
     message = Message()
-    if MANAGER.current_object().object_type() == "directory":
-        sub_objects = MANAGER.current_object().sub_objects()
-        for obj in sub_objects:
-            if obj.object_type() != "task":
-                continue
-            obj_path = MANAGER.current_object().relative_path(obj.path)
-            task = MANAGER.sub_object(obj_path)
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() == "directory":
+        for task in _task_children(current_obj):
             task.add_algorithm(path)
         return message
-    if MANAGER.current_object().object_type() != "task":
+    if current_obj.object_type() != "task":
         message.add("Unable to call add_algorithm if you are not in a task.", "error")
         return message
-    MANAGER.current_object().add_algorithm(path)
+    current_obj.add_algorithm(path)
     return message
 
 
@@ -220,19 +235,15 @@ def add_parameter(par: str, value: str) -> Message:
         - Use set_environment for environment variables instead
     """
     message = Message()
-    if MANAGER.current_object().object_type() == "directory":
-        sub_objects = MANAGER.current_object().sub_objects()
-        for obj in sub_objects:
-            if obj.object_type() != "task":
-                continue
-            obj_path = MANAGER.current_object().relative_path(obj.path)
-            task = MANAGER.sub_object(obj_path)
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() == "directory":
+        for task in _task_children(current_obj):
             task.add_parameter(par, value)
         return message
-    if MANAGER.current_object().object_type() != "task":
+    if current_obj.object_type() != "task":
         message.add("Unable to call add_input if you are not in a task.", "error")
         return message
-    MANAGER.current_object().add_parameter(par, value)
+    current_obj.add_parameter(par, value)
     return message
 
 
@@ -300,19 +311,15 @@ def set_environment(env: str) -> Message:
         - Use add_parameter for task-specific parameters instead
     """
     message = Message()
-    if MANAGER.current_object().object_type() == "directory":
-        sub_objects = MANAGER.current_object().sub_objects()
-        for obj in sub_objects:
-            if obj.object_type() != "task":
-                continue
-            obj_path = MANAGER.current_object().relative_path(obj.path)
-            task = MANAGER.sub_object(obj_path)
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() == "directory":
+        for task in _task_children(current_obj):
             task.set_environment(env)
         return message
-    if MANAGER.current_object().object_type() != "task":
+    if current_obj.object_type() != "task":
         message.add("Unable to call set_environment if you are not in a task.", "error")
         return message
-    MANAGER.current_object().set_environment(env)
+    current_obj.set_environment(env)
     return message
 
 
@@ -342,19 +349,15 @@ def set_memory_limit(limit: str) -> Message:
         - Default limits may be configured at project or system level
     """
     message = Message()
-    if MANAGER.current_object().object_type() == "directory":
-        sub_objects = MANAGER.current_object().sub_objects()
-        for obj in sub_objects:
-            if obj.object_type() != "task":
-                continue
-            obj_path = MANAGER.current_object().relative_path(obj.path)
-            task = MANAGER.sub_object(obj_path)
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() == "directory":
+        for task in _task_children(current_obj):
             task.set_memory_limit(limit)
         return message
-    if MANAGER.current_object().object_type() != "task":
+    if current_obj.object_type() != "task":
         message.add("Unable to call set_memory_limit if you are not in a task.", "error")
         return message
-    MANAGER.current_object().set_memory_limit(limit)
+    current_obj.set_memory_limit(limit)
     return message
 
 
@@ -381,22 +384,23 @@ def set_descriptor(descriptor: str) -> Message:
         - Used for display and identification purposes
     """
     message = Message()
-    if MANAGER.current_object().object_type() in ("directory", "project"):
-        sub_objects = MANAGER.current_object().sub_objects()
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() in ("directory", "project"):
+        sub_objects = current_obj.sub_objects()
         for obj in sub_objects:
             if not obj.is_task_or_algorithm():
                 continue
-            obj_path = MANAGER.current_object().relative_path(obj.path)
+            obj_path = current_obj.relative_path(obj.path)
             sub_obj = MANAGER.sub_object(obj_path)
             sub_obj.set_descriptor(descriptor)
         return message
-    if not MANAGER.current_object().is_task_or_algorithm():
+    if not current_obj.is_task_or_algorithm():
         message.add(
             "Unable to call set_descriptor if you are not in a task or algorithm.",
             "error"
         )
         return message
-    MANAGER.current_object().set_descriptor(descriptor)
+    current_obj.set_descriptor(descriptor)
     return message
 
 
@@ -425,19 +429,15 @@ def rm_parameter(par: str) -> Message:
         - Parameter removal affects future executions, not running jobs
     """
     message = Message()
-    if MANAGER.current_object().object_type() in ("directory", "project"):
-        sub_objects = MANAGER.current_object().sub_objects()
-        for obj in sub_objects:
-            if obj.object_type() != "task":
-                continue
-            obj_path = MANAGER.current_object().relative_path(obj.path)
-            task = MANAGER.sub_object(obj_path)
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() in ("directory", "project"):
+        for task in _task_children(current_obj):
             task.remove_parameter(par)
         return message
-    if MANAGER.current_object().object_type() != "task":
+    if current_obj.object_type() != "task":
         message.add("Unable to call remove_parameter if you are not in a task.", "error")
         return message
-    MANAGER.current_object().remove_parameter(par)
+    current_obj.remove_parameter(par)
     return message
 
 
@@ -467,19 +467,15 @@ def remove_input(alias: str) -> Message:
         - The underlying data object is not deleted, only the reference
     """
     message = Message()
-    if MANAGER.current_object().object_type() == "directory":
-        sub_objects = MANAGER.current_object().sub_objects()
-        for obj in sub_objects:
-            if obj.object_type() != "task":
-                continue
-            obj_path = MANAGER.current_object().relative_path(obj.path)
-            task = MANAGER.sub_object(obj_path)
+    current_obj = MANAGER.current_object()
+    if current_obj.object_type() == "directory":
+        for task in _task_children(current_obj):
             task.remove_input(alias)
         return message
-    if not MANAGER.current_object().is_task_or_algorithm():
+    if not current_obj.is_task_or_algorithm():
         message.add("Unable to call remove_input if you are not in a task.", "error")
         return message
-    MANAGER.current_object().remove_input(alias)
+    current_obj.remove_input(alias)
     return message
 
 
@@ -509,27 +505,28 @@ def get_script_path(filename: str) -> Message:
         - Useful for script execution or file operations
     """
     message = Message()
-    if not MANAGER.current_object().is_task_or_algorithm():
+    current_obj = MANAGER.current_object()
+    if not current_obj.is_task_or_algorithm():
         message.add("Not able to get script path if you are not in a task or algorithm.", "error")
         return message
-    if MANAGER.current_object().object_type() == "task":
+    if current_obj.object_type() == "task":
         if filename.startswith("code/"):
-            algorithm = MANAGER.current_object().algorithm()
+            algorithm = current_obj.algorithm()
             path = f"{algorithm.path}/{filename[5:]}"
             message.add(path, "normal")
             message.data["path"] = path
             return message
         if filename.startswith("code:"):
-            algorithm = MANAGER.current_object().algorithm()
+            algorithm = current_obj.algorithm()
             path = f"{algorithm.path}/{filename[5:]}"
             message.add(path, "normal")
             message.data["path"] = path
             return message
-        path = f"{MANAGER.current_object().path}/{filename}"
+        path = f"{current_obj.path}/{filename}"
         message.add(path, "normal")
         message.data["path"] = path
         return message
-    path = f"{MANAGER.current_object().path}/{filename}"
+    path = f"{current_obj.path}/{filename}"
     message.add(path, "normal")
     message.data["path"] = path
     return message
@@ -558,16 +555,17 @@ def config() -> Message:
         - Configuration changes affect object behavior and execution
     """
     message = Message()
-    if not MANAGER.current_object().is_task_or_algorithm():
+    current_obj = MANAGER.current_object()
+    if not current_obj.is_task_or_algorithm():
         message.add("Not able to config", "error")
         return message
     path = os.path.join(os.environ["HOME"], ".celebi", "config.yaml")
     yaml_file = metadata.YamlFile(path)
     editor = yaml_file.read_variable("editor", "vi")
     # Generate a template file if the config file does not exist
-    if not os.path.exists(f"{MANAGER.current_object().path}/celebi.yaml"):
-        with open(f"{MANAGER.current_object().path}/celebi.yaml", "w", encoding="utf-8") as f:
-            if MANAGER.current_object().object_type() == "task":
+    if not os.path.exists(f"{current_obj.path}/celebi.yaml"):
+        with open(f"{current_obj.path}/celebi.yaml", "w", encoding="utf-8") as f:
+            if current_obj.object_type() == "task":
                 f.write("""environment: chern
 memory_limit: 256Mi
 alias:
@@ -577,5 +575,5 @@ parameters: {{}}""")
                 f.write("""environment: script
 commands:
   - echo 'Hello, world!'""")
-    subprocess.call([editor, f"{MANAGER.current_object().path}/celebi.yaml"])
+    subprocess.call([editor, f"{current_obj.path}/celebi.yaml"])
     return message
@@ -31,10 +31,11 @@ def workaround_preshell() -> Message:
         - Useful for environment preparation or data staging
     """
     message = Message()
-    if not MANAGER.current_object().is_task():
+    current_obj = MANAGER.current_object()
+    if not current_obj.is_task():
         message.add("Not able to call workaround if you are not in a task.", "error")
         return message
-    status, path = MANAGER.current_object().workaround_preshell()
+    status, path = current_obj.workaround_preshell()
     if not status:
         message.add(path, "error")
         return message
@@ -68,10 +69,11 @@ def workaround_postshell(path: str) -> Message:
         - Useful for result processing or cleanup operations
     """
     message = Message()
-    if not MANAGER.current_object().is_task():
+    current_obj = MANAGER.current_object()
+    if not current_obj.is_task():
         message.add("Not able to call workaround if you are not in a task.", "error")
         return message
-    MANAGER.current_object().workaround_postshell(path)
+    current_obj.workaround_postshell(path)
     message.add("Post-shell workaround completed", "success")
     return message
 
@@ -3,12 +3,73 @@ Visualization functions for shell interface.
 
 Functions for viewing, creating, and tracing impressions.
 """
+import functools
+import itertools
 import os
-from collections import defaultdict
+from colorsys import hls_to_rgb, rgb_to_hls
+
+import networkx as nx
 
 from ...utils.message import Message
 from ._manager import MANAGER
 
+# Graphviz DAG styling, tuned for massive DAGs
+_DAG_BASE_COLORS = (
+    '#FF4500', '#4169E1', '#3CB371', '#FFD700', '#8A2BE2', '#FF69B4'
+)
+_DAG_EDGE_PENWIDTH = '1.2'
+_DAG_GRAPH_ATTR = {
+    'rankdir': 'LR',
+    'splines': 'true',
+    'overlap': 'false',
+    'bgcolor': 'white',
+    'nodesep': '0.5',
+    'ranksep': '0.9',
+    'dpi': '150',
+}
+_DAG_NODE_ATTR = {
+    'shape': 'box',
+    'style': 'filled',
+    'fontname': 'Helvetica',
+    'fontsize': '10',
+    'margin': '0.15',
+}
+_DAG_EDGE_ATTR = {
+    'fontname': 'Helvetica',
+    'fontsize': '8',
+    'penwidth': _DAG_EDGE_PENWIDTH,
+    'color': '#555555',
+}
+
+
+class _ColorMap(dict):
+    """Map DAG groups to base colors, handing out the next color on first use."""
+
+    __slots__ = ('_colors',)
+
+    def __init__(self, colors):
+        super().__init__()
+        self._colors = itertools.cycle(colors)
+
+    def __missing__(self, key):
+        color = self[key] = next(self._colors)
+        return color
+
+
+@functools.lru_cache(maxsize=64)
+def _lighten_color(hex_color, depth_step):
+    """Adjust the lightness of ``hex_color`` by ``depth_step`` (0-6) steps.
+
+    DAG nodes only combine a few base colors with seven depth steps, so
+    the color conversions are cached instead of redone for every node.
+    """
+    h = hex_color.lstrip('#')
+    rgb = tuple(int(h[i:i+2], 16) / 255.0 for i in (0, 2, 4))
+    hls = rgb_to_hls(*rgb)
+    new_l = max(0.30, min(0.80, hls[1] + 0.10 * depth_step))
+    r, g, b = hls_to_rgb(hls[0], new_l, hls[2])
+    return f'#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}'
+
 
 def view(browser: str = "open") -> Message:
     """View impressions for current task.
@@ -37,11 +98,12 @@ def view(browser: str = "open") -> Message:
     """
     import subprocess
     message = Message()
-    is_task = MANAGER.current_object().is_task()
+    current_obj = MANAGER.current_object()
+    is_task = current_obj.is_task()
     if not is_task:
         message.add("Not able to view", "error")
         return message
-    url = MANAGER.current_object().impview()
+    url = current_obj.impview()
     subprocess.call([browser, url])
     message.add("Opened view in browser", "success")
     return message
@@ -71,11 +133,12 @@ def viewurl() -> Message:
         - Empty return indicates no impressions available
     """
     message = Message()
-    is_task = MANAGER.current_object().is_task()
+    current_obj = MANAGER.current_object()
+    is_task = current_obj.is_task()
     if not is_task:
         message.add("Not able to get view url", "error")
         return message
-    url = MANAGER.current_object().impview()
+    url = current_obj.impview()
     message.add(url, "normal")
     message.data["url"] = url
     return message
@@ -249,40 +312,21 @@ def draw_dag_graphviz(output_file: str = "dag.pdf", exclude_algorithms: bool = F
         - Output is always saved to ~/Downloads/
     """
     # pylint: disable=import-outside-toplevel,too-many-locals,too-many-statements
-    import networkx as nx
+    # graphviz is only needed here; networkx is already loaded by the kernel
     import graphviz
-    from colorsys import hls_to_rgb, rgb_to_hls
 
     message = Message()
 
-    # Helper: Color Lighter based on Depth
-    def lighten_color(hex_color, depth_factor):
-        """Adjusts the lightness component of a color based on depth."""
-        h = hex_color.lstrip('#')
-        rgb = tuple(int(h[i:i+2], 16) / 255.0 for i in (0, 2, 4))
-        hls = rgb_to_hls(*rgb)
-        new_l = max(0.30, min(0.80, hls[1] + 0.10 * (depth_factor % 7)))
-        r, g, b = hls_to_rgb(hls[0], new_l, hls[2])
-        return f'#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}'
-
-    # Constants tuned for massive DAGs
-    base_colors = [
-        '#FF4500', '#4169E1', '#3CB371', '#FFD700', '#8A2BE2', '#FF69B4'
-    ]
-    node_shape = 'box'
-    node_font_size = '10'
-    edge_penwidth = '1.2'
-    graph_dpi = '150'
-
     # Output Setup
     output_file = os.path.join(
         os.environ.get("HOME", "."), "Downloads", output_file
     )
-    output_format = output_file.split('.')[-1].lower()
+    output_base, output_ext = os.path.splitext(output_file)
+    output_format = output_ext[1:].lower()
 
     if output_format not in ['svg', 'png', 'pdf']:
         output_format = 'pdf'
-        output_file = os.path.splitext(output_file)[0] + ".pdf"
+        output_file = output_base + ".pdf"
 
     # Build graph
     try:
@@ -300,15 +344,14 @@ def draw_dag_graphviz(output_file: str = "dag.pdf", exclude_algorithms: bool = F
 
     # Node identity, depth, color, and Grouping
     node_map = {}
-    node_depth = {}
-    top_color_map = {}
-    color_idx = 0
-    layers = defaultdict(list)
-
-    for n in graph.nodes():
-        if graph.nodes[n].get('node_type') == 'aggregate':
-            sid = str(graph.nodes[n]['label'])
-            path = graph.nodes[n].get('aggregated_path', sid)
+    top_color_map = _ColorMap(_DAG_BASE_COLORS)
+
+    nodes = graph.nodes
+    for n in nodes:
+        attrs = nodes[n]
+        if attrs.get('node_type') == 'aggregate':
+            sid = str(attrs['label'])
+            path = attrs.get('aggregated_path', sid)
         else:
             v = getattr(n, 'invariant_path', str(n))
             sid = str(v() if callable(v) else v)
@@ -316,92 +359,59 @@ def draw_dag_graphviz(output_file: str = "dag.pdf", exclude_algorithms: bool = F
 
         node_map[n] = sid
 
-        parts = str(path).replace("AGGREGATE:", "").strip("/").split('/')
-        top = parts[0] if parts and parts[0] else "default"
-        depth = max(0, len(parts) - 1)
-
-        node_depth[n] = depth
-        layers[depth].append(sid)
-
-        if top not in top_color_map:
-            top_color_map[top] = base_colors[
-                color_idx % len(base_colors)
-            ]
-            color_idx += 1
-
-        graph.nodes[n]['color_fill'] = lighten_color(
-            top_color_map[top], depth
-        )
-        graph.nodes[n]['label'] = sid
-
-    # Transitive Reduction
-    dependency_graph = nx.DiGraph(
-        (u, v, data) for u, v, data in graph.edges(data=True)
+        # Only the top-level directory and the nesting depth are needed
+        path = str(path).replace("AGGREGATE:", "").strip("/")
+        top = path.split('/', 1)[0] or "default"
+        depth = path.count('/')
+
+        attrs['color_fill'] = _lighten_color(top_color_map[top], depth % 7)
+        attrs['label'] = sid
+
+    # Transitive Reduction, on integer ids: they hash cheaply and avoid
+    # copying the graph to relabel it and back
+    node_list = list(nodes)
+    node_id = {n: i for i, n in enumerate(node_list)}
+    dependency_graph = nx.DiGraph()
+    dependency_graph.add_nodes_from(range(len(node_list)))
+    dependency_graph.add_edges_from(
+        (node_id[u], node_id[v]) for u, v, data in graph.edges(data=True)
         if data.get('type') == 'dependency'
     )
-    dependency_graph.add_nodes_from(graph.nodes(data=True))
 
     try:
-        relabeled_graph = nx.relabel_nodes(dependency_graph, node_map)
-        reduced_graph = nx.transitive_reduction(relabeled_graph)
-        inv = {v: k for k, v in node_map.items()}
-        reduced_dependency_edges = [
-            (inv[u], inv[v]) for u, v in reduced_graph.edges()
-        ]
+        reduced_graph = nx.transitive_reduction(dependency_graph)
     except Exception:
-        reduced_dependency_edges = [
-            (u, v) for u, v, data in dependency_graph.edges(data=True)
-        ]
+        reduced_graph = dependency_graph
+    reduced_dependency_edges = [
+        (node_list[u], node_list[v]) for u, v in reduced_graph.edges()
+    ]
 
     # GRAPHVIZ RENDERING SETUP
     dot = graphviz.Digraph(
         comment=f"Dependency DAG: {current_obj.invariant_path()}",
-        graph_attr={
-            'rankdir': 'LR',
-            'splines': 'true',
-            'overlap': 'false',
-            'bgcolor': 'white',
-            'nodesep': '0.5',
-            'ranksep': '0.9',
-            'dpi': graph_dpi,
-        },
-        node_attr={
-            'shape': node_shape,
-            'style': 'filled',
-            'fontname': 'Helvetica',
-            'fontsize': node_font_size,
-            'margin': '0.15',
-        },
-        edge_attr={
-            'fontname': 'Helvetica',
-            'fontsize': '8',
-            'penwidth': edge_penwidth,
-            'color': '#555555',
-        }
+        graph_attr=_DAG_GRAPH_ATTR,
+        node_attr=_DAG_NODE_ATTR,
+        edge_attr=_DAG_EDGE_ATTR,
     )
 
     # Add Nodes
-    for n in graph.nodes():
+    fill_colors = {n: attrs['color_fill'] for n, attrs in nodes.items()}
+    for n, attrs in nodes.items():
         dot.node(
             node_map[n],
-            label=graph.nodes[n]['label'],
-            fillcolor=graph.nodes[n]['color_fill'],
+            label=attrs['label'],
+            fillcolor=fill_colors[n],
             color='#333333',
             fontcolor='#111111'
         )
 
-    # Add Filtered Dependency Edges
+    # Add Filtered Dependency Edges, colored like their source node
     for u, v in reduced_dependency_edges:
-        u_id = node_map[u]
-        v_id = node_map[v]
-
-        source_color = graph.nodes[u]['color_fill']
-
         dot.edge(
-            u_id, v_id,
-            color=source_color,
+            node_map[u], node_map[v],
+            color=fill_colors[u],
             arrowhead='normal',
-            penwidth=edge_penwidth
+            penwidth=_DAG_EDGE_PENWIDTH
         )
 
     # Save
@@ -411,7 +421,7 @@ def draw_dag_graphviz(output_file: str = "dag.pdf", exclude_algorithms: bool = F
     )
     try:
         dot.render(
-            os.path.splitext(output_file)[0],
+            output_base,
             format=output_format,
             cleanup=True
         )
@@ -662,7 +662,6 @@ class ChernCommunicator():
 
         response.raise_for_status()
         result = response.json()
-        print(result)
         msg = Message()
         if result.get("status") == "success":
             msg.add(result.get("message", "Bookkeeping completed"), "success")
@@ -65,7 +65,7 @@ def create_directory(path):
     """ Create a directory
     """
     path = csys.strip_path_string(path)
-    parent_path = os.path.abspath(path+"/..")
+    parent_path = os.path.dirname(os.path.abspath(path))
     object_type = VObject(parent_path).object_type()
     if object_type not in ("project", "directory"):
         raise Exception("create directory only under project or directory")
@@ -151,7 +151,7 @@ class Core(ABC):
         """ Abstract method for future implementation"""
 
     @abstractmethod
-    def import_file(self, path: str) -> None:
+    def import_file(self, path: str, is_dir: Optional[bool] = None) -> None:
         """ Abstract method for future implementation"""
 
     # Abstract methods, for file operations
@@ -5,7 +5,7 @@ import shutil
 import difflib
 from os.path import join, normpath
 from logging import getLogger
-from typing import TYPE_CHECKING, Tuple, List
+from typing import TYPE_CHECKING, Tuple, List, Optional
 
 from ..utils import csys
 from ..utils.message import Message
@@ -297,9 +297,12 @@ class FileManagementOperations(Core):
 
         return Message()  # Empty message for success
 
-    def import_file(self, path: str) -> Message:
+    def import_file(self, path: str, is_dir: Optional[bool] = None) -> Message:
         """
         Import the file to this task directory
+
+        Callers that took ``path`` from a directory listing may pass
+        ``is_dir``; the path is then known to exist and is not checked again.
         """
         message = Message()
 
@@ -307,16 +310,18 @@ class FileManagementOperations(Core):
             message.add("This function is only available for task or algorithm.", "warning")
             return message
 
-        if not csys.exists(path):
-            message.add("File does not exist.", "warning")
-            return message
+        if is_dir is None:
+            if not csys.exists(path):
+                message.add("File does not exist.", "warning")
+                return message
+            is_dir = os.path.isdir(path)
 
         filename = os.path.basename(path)
         if csys.exists(self.path + "/" + filename):
             message.add("File already exists.", "warning")
             return message
 
-        if os.path.isdir(path):
+        if is_dir:
             csys.copy_tree(path, self.path + "/" + filename)
         else:
             csys.copy(path, self.path + "/" + filename)
@@ -246,7 +246,7 @@ def create_rawdata_task(path: str, descriptor: str, data_md5: str) -> None:
     impression created by `yuki-create-data`.
     """
     path = csys.strip_path_string(path)
-    parent_path = os.path.abspath(path + "/..")
+    parent_path = os.path.dirname(os.path.abspath(path))
     object_type = VObject(parent_path).object_type()
     if object_type not in ("project", "directory"):
         raise ValueError(f"Cannot create task under {parent_path}: not a project or directory")
@@ -268,7 +268,7 @@ def create_data(path):
     """ Create a data
     """
     path = csys.strip_path_string(path)
-    parent_path = os.path.abspath(path+"/..")
+    parent_path = os.path.dirname(os.path.abspath(path))
     object_type = VObject(parent_path).object_type()
     if object_type not in ("project", "directory"):
         return
@@ -290,7 +290,7 @@ def create_data_list(path):
     """ Create a data list
     """
     path = csys.strip_path_string(path)
-    parent_path = os.path.abspath(path+"/..")
+    parent_path = os.path.dirname(os.path.abspath(path))
     object_type = VObject(parent_path).object_type()
     if object_type not in ("project", "directory"):
         return
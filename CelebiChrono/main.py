@@ -29,10 +29,11 @@ from logging import getLogger
 import click
 
 from .kernel import vproject
-from .interface.shell_modules.reana_booking import book_reana
 from .utils import csys
 from .utils import metadata
 from .interface.ChernShell import ChernShell
+from .celebi_cli.commands import booking
+from .celebi_cli.commands.navigation import project_uuid_command
 from .celebi_cli.commands.object_creation import use_data_command
 
 
@@ -230,17 +231,6 @@ def remove(project):
     except Exception:
         print("Fail to remove the project")
 
-@cli.command(name="project-uuid")
-def project_uuid_command():
-    """Print the current project's UUID."""
-    project_path = csys.project_path(os.getcwd())
-    if not project_path:
-        print("Error: Not inside a Celebi project.")
-        return
-    uuid = vproject.VProject(project_path).project_uuid()
-    print(uuid)
-
-
 @cli.command()
 def prologue():
     """ A prologue from the author """
@@ -555,82 +545,10 @@ def git_config(key, value):
         print(f"Error setting configuration: {e}")
 
 cli.add_command(use_data_command)
-
-
-@cli.command(name="booking-server")
-def booking_server_command():
-    """Check the registered booking server URL and status."""
-    try:
-        from .interface.shell_modules.reana_booking import check_booking_server
-
-        result = check_booking_server()
-        if result.messages:
-            print(result.colored())
-    except Exception as e:
-        print(f"Error: {e}")
-
-
-@cli.command(name="register-booking-server")
-@click.option("--server", "server_url", default="",
-              help="REANA server URL (or set REANA_SERVER_URL env var)")
-@click.option("--token", "access_token", default="",
-              help="REANA access token (or set REANA_ACCESS_TOKEN env var)")
-def register_booking_server_command(server_url, access_token):
-    """Register REANA server and token with Yuki for booking.
-
-    Stores the credentials in Yuki's config so that 'book-reana'
-    can be run without specifying --server and --token.
-    """
-    try:
-        from .interface.shell_modules.reana_booking import register_booking_server
-
-        result = register_booking_server(
-            server_url=server_url,
-            access_token=access_token,
-        )
-        if result.messages:
-            print(result.colored())
-    except Exception as e:
-        print(f"Error: {e}")
-
-
-@cli.command(name="book-reana")
-@click.option("--server", "server_url", default="",
-              help="REANA server URL (overrides stored credentials)")
-@click.option("--token", "access_token", default="",
-              help="REANA access token (overrides stored credentials)")
-@click.option("--path", "project_path", default="",
-              help="Path to Celebi project (default: current directory)")
-@click.option("--insecure", is_flag=True, default=False,
-              help="Disable SSL certificate verification")
-@click.option("--stageout", is_flag=True, default=False,
-              help="Also upload stageout files from Yuki storage")
-@click.option("--no-stream", is_flag=True, default=False,
-              help="Disable live streaming; wait for all output before printing")
-def book_reana_command(server_url, access_token, project_path, insecure, stageout, no_stream):
-    """Book the current project to REANA as a file catalog via Yuki.
-
-    If --server and --token are not provided, Yuki will use credentials
-    previously registered via 'register-booking-server'.
-    """
-    try:
-        result = book_reana(
-            server_url=server_url,
-            access_token=access_token,
-            verify_ssl=not insecure,
-            project_path=project_path,
-            stageout=stageout,
-            stream=not no_stream,
-        )
-        # In streaming mode, messages were already printed live.
-        # Only print any remaining messages that weren't emitted.
-        if not no_stream:
-            # Messages already printed during streaming; nothing more to do
-            pass
-        elif result.messages:
-            print(result.colored())
-    except Exception as e:
-        print(f"Error: {e}")
+cli.add_command(project_uuid_command)
+cli.add_command(booking.booking_server_command)
+cli.add_command(booking.register_booking_server_command)
+cli.add_command(booking.book_reana_command)
 
 
 def main():
@@ -3,7 +3,8 @@ Created by Mingrui Zhao @ 2025
 define the messages class
 """
 
-from typing import List, Tuple
+import sys
+from typing import Iterator, List, Optional, TextIO, Tuple
 from .pretty import colorize
 
 class Message:
@@ -39,6 +40,24 @@ class Message:
             raise TypeError("Expected a Message instance")
 
     def colored(self) -> str:
-        """ Return colored messages
+        """ Return colored messages, or an empty string if there are none
         """
-        return "".join(colorize(text, msg_type) for text, msg_type in self.messages)
+        if not self.messages:
+            return ""
+        return "".join(self.colored_iter())
+
+    def colored_iter(self) -> Iterator[str]:
+        """ Yield the colored text of each message in order
+        """
+        for text, msg_type in self.messages:
+            yield colorize(text, msg_type)
+
+    def write_colored(self, stream: Optional[TextIO] = None) -> None:
+        """ Write the colored messages and a newline to stream (stdout by
+        default), one message at a time instead of joining them first
+        """
+        if stream is None:
+            stream = sys.stdout
+        for chunk in self.colored_iter():
+            stream.write(chunk)
+        stream.write("\n")
@@ -152,7 +152,7 @@ def project_path(path=None):
     while path != "/":
         if exists(path+"/.celebi/project.json"):
             return abspath(path)
-        path = abspath(path+"/..")
+        path = os.path.dirname(abspath(path))
     return ""
 
 
@@ -1,8 +1,12 @@
 """Unit tests for merge conflict resolution interface."""
+import io
 import unittest
 from unittest.mock import Mock, patch
 
-from CelebiChrono.interface.merge_resolver import MergeResolver, ResolutionAction
+from CelebiChrono.interface import merge_resolver
+from CelebiChrono.interface.merge_resolver import (
+    MergeResolver, ResolutionAction, ResolutionOption,
+)
 
 
 class TestMergeResolver(unittest.TestCase):
@@ -39,6 +43,23 @@ class TestMergeResolver(unittest.TestCase):
         self.assertEqual(len(grouped['alias']), 1)
         self.assertEqual(len(grouped['other']), 1)
 
+    def test_resolve_no_conflicts(self):
+        """Test that an empty conflict list resolves without prompting."""
+        results = self.resolver.resolve_conflicts_interactively([])
+
+        self.assertTrue(results['success'])
+        self.assertEqual(results['remaining'], 0)
+        self.assertFalse(results['actions'])
+        with self.assertRaises(TypeError):
+            results['resolved'] = 1
+
+    def test_type_table_matches_name_rules(self):
+        """Test that the category table agrees with the name-based fallback."""
+        for conflict_type, category in merge_resolver._TYPE_TO_CATEGORY.items():
+            self.assertEqual(
+                merge_resolver._category_from_type_name(conflict_type), category
+            )
+
     def test_get_dag_resolution_options(self):
         """Test getting DAG conflict resolution options."""
         # Test cycle creation conflict
@@ -47,7 +68,7 @@ class TestMergeResolver(unittest.TestCase):
 
         self.assertGreater(len(options), 0)
         # Should include cycle-specific options
-        option_actions = [opt['action'] for opt in options]
+        option_actions = [opt.action for opt in options]
         self.assertIn(ResolutionAction.KEEP_LOCAL, option_actions)
         self.assertIn(ResolutionAction.KEEP_REMOTE, option_actions)
         self.assertIn(ResolutionAction.MANUAL_EDIT, option_actions)
@@ -58,7 +79,7 @@ class TestMergeResolver(unittest.TestCase):
         edge_conflict = {'type': 'additive_edge', 'description': 'Edge conflict'}
         options = self.resolver._get_dag_resolution_options(edge_conflict)
 
-        option_actions = [opt['action'] for opt in options]
+        option_actions = [opt.action for opt in options]
         self.assertIn(ResolutionAction.KEEP_LOCAL, option_actions)
         self.assertIn(ResolutionAction.KEEP_REMOTE, option_actions)
         self.assertIn(ResolutionAction.KEEP_BOTH, option_actions)
@@ -70,22 +91,22 @@ class TestMergeResolver(unittest.TestCase):
         options = self.resolver._get_config_resolution_options(uuid_conflict)
 
         self.assertGreater(len(options), 0)
-        option_actions = [opt['action'] for opt in options]
+        option_actions = [opt.action for opt in options]
         self.assertIn(ResolutionAction.KEEP_LOCAL, option_actions)
         self.assertIn(ResolutionAction.KEEP_REMOTE, option_actions)
         self.assertIn(ResolutionAction.MANUAL_EDIT, option_actions)
 
         # Check for warning in UUID conflict options
-        uuid_options = [opt for opt in options if opt['action'] in
+        uuid_options = [opt for opt in options if opt.action in
                        [ResolutionAction.KEEP_LOCAL, ResolutionAction.KEEP_REMOTE]]
         for option in uuid_options:
-            self.assertIn('warning', option)
+            self.assertIsNotNone(option.warning)
 
         # Test generic config conflict
         config_conflict = {'type': 'config_conflict', 'description': 'Config mismatch'}
         options = self.resolver._get_config_resolution_options(config_conflict)
 
-        option_actions = [opt['action'] for opt in options]
+        option_actions = [opt.action for opt in options]
         self.assertIn(ResolutionAction.KEEP_LOCAL, option_actions)
         self.assertIn(ResolutionAction.KEEP_REMOTE, option_actions)
         self.assertIn(ResolutionAction.KEEP_BOTH, option_actions)
@@ -95,10 +116,10 @@ class TestMergeResolver(unittest.TestCase):
     def test_present_resolution_options(self, mock_input):
         """Test presenting resolution options to user."""
         options = [
-            {'action': ResolutionAction.KEEP_LOCAL, 'description': 'Keep local', 'key': '1'},
-            {'action': ResolutionAction.KEEP_REMOTE, 'description': 'Keep remote', 'key': '2'},
-            {'action': ResolutionAction.SKIP, 'description': 'Skip', 'key': 's'},
-            {'action': ResolutionAction.ABORT, 'description': 'Abort', 'key': 'a'}
+            ResolutionOption(ResolutionAction.KEEP_LOCAL, 'Keep local', '1'),
+            ResolutionOption(ResolutionAction.KEEP_REMOTE, 'Keep remote', '2'),
+            ResolutionOption(ResolutionAction.SKIP, 'Skip', 's'),
+            ResolutionOption(ResolutionAction.ABORT, 'Abort', 'a')
         ]
 
         conflict = {'description': 'Test conflict'}
@@ -122,8 +143,8 @@ class TestMergeResolver(unittest.TestCase):
     def test_present_resolution_options_invalid(self, mock_input):
         """Test handling invalid user input."""
         options = [
-            {'action': ResolutionAction.KEEP_LOCAL, 'description': 'Keep local', 'key': '1'},
-            {'action': ResolutionAction.SKIP, 'description': 'Skip', 'key': 's'}
+            ResolutionOption(ResolutionAction.KEEP_LOCAL, 'Keep local', '1'),
+            ResolutionOption(ResolutionAction.SKIP, 'Skip', 's')
         ]
 
         conflict = {'description': 'Test conflict'}
@@ -136,11 +157,28 @@ class TestMergeResolver(unittest.TestCase):
         self.assertEqual(result, ResolutionAction.KEEP_LOCAL)
         self.assertEqual(mock_input.call_count, 3)
 
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('builtins.input')
+    def test_present_resolution_options_flushes_before_prompt(self, mock_input, mock_stdout):
+        """Test that queued output reaches stdout before waiting for input."""
+        options = [
+            ResolutionOption(ResolutionAction.KEEP_LOCAL, 'Keep local', '1')
+        ]
+        seen = []
+        mock_input.side_effect = lambda prompt: seen.append(mock_stdout.getvalue()) or '1'
+
+        self.resolver._emit("Conflict header\n")
+        self.resolver._present_resolution_options(options, {})
+
+        self.assertEqual(
+            seen, ["Conflict header\n\n  Resolution options:\n    [1] Keep local\n"]
+        )
+
     @patch('builtins.input', side_effect=KeyboardInterrupt)
     def test_present_resolution_options_interrupt(self, mock_input):
         """Test handling keyboard interrupt."""
         options = [
-            {'action': ResolutionAction.KEEP_LOCAL, 'description': 'Keep local', 'key': '1'}
+            ResolutionOption(ResolutionAction.KEEP_LOCAL, 'Keep local', '1')
         ]
 
         conflict = {'description': 'Test conflict'}
@@ -272,6 +310,30 @@ class TestMergeResolver(unittest.TestCase):
         self.assertIsInstance(preview, str)
         self.assertIn('MERGE PREVIEW', preview)
 
+    @patch('CelebiChrono.kernel.vobj_arc_merge.DAGMerger')
+    def test_preview_merge_is_cached(self, mock_merger):
+        """Test that unchanged DAGs reuse the rendered preview."""
+        import networkx as nx
+        local_dag = nx.DiGraph([('a', 'b')])
+        remote_dag = nx.DiGraph([('a', 'c')])
+        base_dag = nx.DiGraph()
+        base_dag.add_node('a')
+
+        merger = mock_merger.return_value
+        merger.merge_dags.return_value = nx.DiGraph([('a', 'b'), ('a', 'c')])
+        merger.get_conflicts.return_value = []
+
+        first = self.resolver.preview_merge(local_dag, remote_dag, base_dag)
+        second = self.resolver.preview_merge(
+            nx.DiGraph([('a', 'b')]), remote_dag, base_dag
+        )
+        self.assertEqual(first, second)
+        self.assertEqual(merger.merge_dags.call_count, 1)
+
+        remote_dag.add_edge('c', 'd')
+        self.resolver.preview_merge(local_dag, remote_dag, base_dag)
+        self.assertEqual(merger.merge_dags.call_count, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
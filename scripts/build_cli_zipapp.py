@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Build a single-file zipapp for the celebi-cli entry point.
+
+The CelebiChrono package is staged into a temporary directory, compiled to
+bytecode placed next to each source file (the layout zipimport looks for),
+and packed into one archive. Running the archive opens a single file for
+the whole package instead of stat-ing and compiling each module on a cold
+start. Third-party dependencies (click, PyYAML, ...) are still imported
+from the interpreter's site-packages.
+
+Usage:
+    python scripts/build_cli_zipapp.py [-o celebi-cli.pyz] [-p "/usr/bin/env python3"]
+"""
+
+import argparse
+import compileall
+import os
+import shutil
+import sys
+import tempfile
+import zipapp
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "CelebiChrono"
+ENTRY_POINT = "CelebiChrono.celebi_cli.cli:main"
+
+
+def build(output: str, interpreter: str) -> None:
+    """Stage, byte-compile and archive the package into ``output``."""
+    with tempfile.TemporaryDirectory() as staging:
+        shutil.copytree(
+            os.path.join(REPO_ROOT, PACKAGE),
+            os.path.join(staging, PACKAGE),
+            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+        )
+        if not compileall.compile_dir(staging, quiet=1, legacy=True):
+            sys.exit("Byte-compilation failed")
+        zipapp.create_archive(
+            staging,
+            target=output,
+            interpreter=interpreter,
+            main=ENTRY_POINT,
+            compressed=False,
+        )
+    print(f"Wrote {output}")
+
+
+def main() -> None:
+    """Parse command-line options and build the archive."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-o", "--output", default="celebi-cli.pyz",
+                        help="Path of the archive to write")
+    parser.add_argument("-p", "--python", default="/usr/bin/env python3",
+                        help="Interpreter for the archive's shebang line")
+    args = parser.parse_args()
+    build(args.output, args.python)
+
+
+if __name__ == "__main__":
+    main()
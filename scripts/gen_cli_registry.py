@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Generate CelebiChrono/celebi_cli/_registry.py from the command modules.
+
+Every ``@click.command(name="...")`` and ``x = shell_command("...", ...)``
+in celebi_cli/commands/*.py is found by parsing the sources (nothing is
+imported) and written out as a plain dict literal mapping the command name
+to its module and attribute, plus the one-line summary shown by
+``celebi-cli --help``. The CLI group imports only
+that generated file at startup and loads a command module when the command
+is actually used.
+
+Run this after adding, renaming or removing a command:
+    python scripts/gen_cli_registry.py          # rewrite _registry.py
+    python scripts/gen_cli_registry.py --check  # exit 1 if it is stale
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI_DIR = os.path.join(REPO_ROOT, "CelebiChrono", "celebi_cli")
+COMMANDS_DIR = os.path.join(CLI_DIR, "commands")
+REGISTRY_PATH = os.path.join(CLI_DIR, "_registry.py")
+COMMANDS_PACKAGE = "CelebiChrono.celebi_cli.commands"
+
+HEADER = '''"""Celebi CLI command registry.
+
+Generated by scripts/gen_cli_registry.py -- do not edit by hand.
+"""
+# pylint: disable=line-too-long
+
+# Command name -> (command module, attribute name)
+COMMANDS = {
+'''
+
+
+def _command_name(decorator):
+    """Return the ``name=`` of a ``click.command(...)`` decorator, or None."""
+    if not (isinstance(decorator, ast.Call)
+            and isinstance(decorator.func, ast.Attribute)
+            and decorator.func.attr == "command"):
+        return None
+    for keyword in decorator.keywords:
+        if keyword.arg == "name" and isinstance(keyword.value, ast.Constant):
+            return keyword.value.value
+    return None
+
+
+def _shell_command_entry(node):
+    """Return the registry entry for ``x = shell_command("name", fn, doc, ...)``."""
+    call = node.value
+    if not (isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Name)
+            and call.func.id == "shell_command"
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)):
+        return None
+    name, _, doc = (ast.literal_eval(arg) for arg in call.args[:3])
+    return name, node.targets[0].id, _first_sentence(doc)
+
+
+def _short_help(node):
+    """Return the first sentence of a command's docstring.
+
+    Same text Click derives for the command list when it has room, so the
+    listing does not need the command modules to be imported.
+    """
+    return _first_sentence(ast.get_docstring(node) or "")
+
+
+def _first_sentence(doc):
+    """Return the first sentence of the first paragraph of ``doc``."""
+    words = doc.split("\f", 1)[0].split("\n\n", 1)[0].split()
+    if words and words[0] == "\b":
+        words = words[1:]
+    for i, word in enumerate(words):
+        if word.endswith("."):
+            return " ".join(words[:i + 1])
+    return " ".join(words)
+
+
+def collect_commands():
+    """Return ``[(module, [(command name, attribute, short help), ...]), ...]``."""
+    modules = []
+    for filename in sorted(os.listdir(COMMANDS_DIR)):
+        if not filename.endswith(".py") or filename.startswith("_"):
+            continue
+        with open(os.path.join(COMMANDS_DIR, filename), encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename)
+        entries = []
+        for node in tree.body:
+            if isinstance(node, ast.Assign):
+                entry = _shell_command_entry(node)
+                if entry is not None:
+                    entries.append(entry)
+                continue
+            if not isinstance(node, ast.FunctionDef):
+                continue
+            for decorator in node.decorator_list:
+                name = _command_name(decorator)
+                if name is not None:
+                    entries.append((name, node.name, _short_help(node)))
+        if entries:
+            modules.append((f"{COMMANDS_PACKAGE}.{filename[:-3]}", entries))
+    return modules
+
+
+def render(modules):
+    """Render the source of ``_registry.py``."""
+    lines = [HEADER]
+    short_help = ["\n# Command name -> summary shown in the command list\nSHORT_HELP = {\n"]
+    seen = set()
+    for module, entries in modules:
+        lines.append(f"    # {module.rsplit('.', 1)[1]}\n")
+        for name, attr, summary in entries:
+            if name in seen:
+                sys.exit(f"Duplicate command name: {name}")
+            seen.add(name)
+            lines.append(f'    "{name}": ("{module}", "{attr}"),\n')
+            short_help.append(f'    "{name}": {json.dumps(summary, ensure_ascii=False)},\n')
+    lines.append("}\n")
+    short_help.append("}\n")
+    return "".join(lines + short_help)
+
+
+def main() -> None:
+    """Write the registry, or compare it with the current file."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true",
+                        help="Only check that the registry is up to date")
+    args = parser.parse_args()
+    source = render(collect_commands())
+    if args.check:
+        with open(REGISTRY_PATH, encoding="utf-8") as f:
+            if f.read() != source:
+                sys.exit(f"{REGISTRY_PATH} is out of date; "
+                         "run scripts/gen_cli_registry.py")
+        return
+    with open(REGISTRY_PATH, "w", encoding="utf-8") as f:
+        f.write(source)
+    print(f"Wrote {REGISTRY_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Tests for the CelebiCommand error policy."""
+import click
+from click.testing import CliRunner
+
+from CelebiChrono.celebi_cli._command import CelebiCommand
+
+
+@click.command(name="explode", cls=CelebiCommand)
+@click.argument("what")
+def explode_command(what):
+    """Raise the requested error."""
+    if what == "import":
+        raise ImportError("missing")
+    if what == "usage":
+        raise click.UsageError("bad usage")
+    raise RuntimeError("boom")
+
+
+def test_callback_errors_are_reported():
+    result = CliRunner().invoke(explode_command, ["runtime"])
+    assert result.exit_code == 1
+    assert result.output == "Error: Command failed: boom\n"
+
+
+def test_import_errors_are_reported():
+    result = CliRunner().invoke(explode_command, ["import"])
+    assert result.exit_code == 1
+    assert result.output == "Error: Failed to import shell function: missing\n"
+
+
+def test_click_errors_pass_through():
+    result = CliRunner().invoke(explode_command, ["usage"])
+    assert result.exit_code == 2
+    assert "bad usage" in result.output
@@ -0,0 +1,109 @@
+"""Tests for the Click-free celebi-cli dispatch path."""
+import inspect
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from CelebiChrono.celebi_cli import _fastparse
+from CelebiChrono.celebi_cli.cli import cli
+
+
+@pytest.mark.parametrize("name", sorted(_fastparse.SPEC))
+def test_spec_matches_click_command(name):
+    command = cli.get_command(None, name)
+    _, argc = _fastparse.SPEC[name]
+    params = [param for param in command.params if param.param_type_name == "argument"]
+    if argc == _fastparse.VARIADIC:
+        assert len(params) == len(command.params) == 1
+        assert params[0].nargs == -1
+        return
+    assert len(params) == len(command.params) == argc
+    assert all(param.nargs == 1 for param in params)
+    assert all(param.required for param in params) or name in _fastparse.NO_ARGS
+
+
+@pytest.mark.parametrize("name", sorted(_fastparse.NO_ARGS))
+def test_no_args_match_click_defaults(name):
+    command = cli.get_command(None, name)
+    _, args = _fastparse.NO_ARGS[name]
+    assert all(not param.required for param in command.params)
+    assert tuple(param.default for param in command.params) in {args, ()}
+
+
+def test_spec_functions_exist_in_shell():
+    from CelebiChrono.interface import shell
+    for fn_name, argc in _fastparse.SPEC.values():
+        if argc == _fastparse.VARIADIC:
+            parameters = inspect.signature(getattr(shell, fn_name)).parameters.values()
+            assert any(p.kind is p.VAR_POSITIONAL for p in parameters)
+            continue
+        assert len(inspect.signature(getattr(shell, fn_name)).parameters) >= argc
+    for fn_name, args in _fastparse.NO_ARGS.values():
+        assert len(inspect.signature(getattr(shell, fn_name)).parameters) >= len(args)
+
+
+def test_dispatch_calls_shell_function(capsys):
+    shell = MagicMock()
+    shell.add_host.return_value = "added"
+    with patch("CelebiChrono.celebi_cli.utils.shell_module", return_value=shell):
+        assert _fastparse.dispatch(["add-host", "node1", "8080"])
+    shell.add_host.assert_called_once_with("node1", "8080")
+    assert capsys.readouterr().out == "added\n"
+
+
+def test_dispatch_fills_in_defaults_for_bare_commands():
+    shell = MagicMock()
+    shell.submit.return_value = None
+    with patch("CelebiChrono.celebi_cli.utils.shell_module", return_value=shell):
+        assert _fastparse.dispatch(["submit"])
+        assert _fastparse.dispatch(["submit", "remote"])
+    assert shell.submit.call_args_list == [(("local",),), (("remote",),)]
+
+
+def test_dispatch_passes_variadic_arguments_through():
+    shell = MagicMock()
+    shell.ls.return_value = None
+    with patch("CelebiChrono.celebi_cli.utils.shell_module", return_value=shell):
+        assert _fastparse.dispatch(["ls"])
+        assert _fastparse.dispatch(["ls", "a", "b"])
+    assert shell.ls.call_args_list == [((),), (("a", "b"),)]
+
+
+@pytest.mark.parametrize("argv", [
+    ["log", "3"],
+    [],
+    ["cd", "somewhere"],
+    ["add-host", "node1"],
+    ["rm", "--help"],
+    ["ls", "-a"],
+    ["--debug", "history"],
+])
+def test_dispatch_falls_back_to_click(argv):
+    with patch("CelebiChrono.celebi_cli.utils.shell_module") as shell_module:
+        assert not _fastparse.dispatch(argv)
+    shell_module.assert_not_called()
+
+
+def test_dispatch_reports_errors(capsys):
+    shell = MagicMock()
+    shell.trace.side_effect = RuntimeError("boom")
+    with patch("CelebiChrono.celebi_cli.utils.shell_module", return_value=shell):
+        with pytest.raises(SystemExit) as excinfo:
+            _fastparse.dispatch(["trace", "abc"])
+    assert excinfo.value.code == 1
+    assert capsys.readouterr().err == "Error: Command failed: boom\n"
+
+
+@pytest.mark.parametrize("name", sorted(_fastparse.NO_ARGS))
+def test_bare_commands_report_errors_like_click(name, capsys):
+    fn_name, _ = _fastparse.NO_ARGS[name]
+    shell = MagicMock()
+    getattr(shell, fn_name).side_effect = RuntimeError("boom")
+    with patch("CelebiChrono.celebi_cli.utils.shell_module", return_value=shell):
+        with pytest.raises(SystemExit) as excinfo:
+            _fastparse.dispatch([name])
+        fast_err = capsys.readouterr().err
+        result = CliRunner().invoke(cli, [name])
+    assert excinfo.value.code == result.exit_code == 1
+    assert fast_err == result.stderr == "Error: Command failed: boom\n"
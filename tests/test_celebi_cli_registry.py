@@ -0,0 +1,71 @@
+"""CLI command registry tests."""
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import click
+from click.testing import CliRunner
+
+from CelebiChrono.celebi_cli.cli import cli, COMMANDS, SHORT_HELP
+
+
+def test_registry_entries_resolve_to_named_commands():
+    for name in COMMANDS:
+        command = cli.commands[name]
+        assert isinstance(command, click.Command)
+        assert command.name == name
+
+
+def test_list_commands_matches_registry():
+    ctx = click.Context(cli)
+    assert cli.list_commands(ctx) == sorted(COMMANDS)
+
+
+def test_generated_registry_is_up_to_date():
+    script = os.path.join(os.path.dirname(__file__), os.pardir, "scripts",
+                          "gen_cli_registry.py")
+    result = subprocess.run([sys.executable, script, "--check"],
+                            capture_output=True, text=True, check=False)
+    assert result.returncode == 0, result.stderr
+
+
+def test_short_help_matches_command_docstrings():
+    assert set(SHORT_HELP) == set(COMMANDS)
+    for name, summary in SHORT_HELP.items():
+        assert cli.commands[name].get_short_help_str(limit=1000) == summary
+
+
+def test_help_lists_commands_without_importing_them():
+    code = ("import sys\n"
+            "from CelebiChrono.celebi_cli.cli import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print([m for m in sys.modules if '.celebi_cli.commands.' in m])\n")
+    result = subprocess.run([sys.executable, "-c", code],
+                            capture_output=True, text=True, check=True)
+    assert "  trace " in result.stdout
+    assert result.stdout.rstrip().endswith("[]")
+
+
+def test_shell_warmup_only_for_shell_backed_commands():
+    ctx = click.Context(cli)
+    with patch("CelebiChrono.celebi_cli.cli._warm_shell") as warm:
+        cli.resolve_command(ctx, ["history"])
+        assert warm.call_count == 1
+        cli.resolve_command(ctx, ["book-reana"])
+        assert warm.call_count == 1
+
+
+def test_shell_warmup_skipped_for_help():
+    from CelebiChrono.celebi_cli import cli as cli_module
+    with patch.object(cli_module, "_warm_shell") as warm:
+        CliRunner().invoke(cli, ["history", "--help"])
+        with patch("sys.argv", ["celebi-cli", "ls", "--help"]):
+            try:
+                cli_module.main()
+            except SystemExit:
+                pass
+    warm.assert_not_called()
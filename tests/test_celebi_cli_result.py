@@ -0,0 +1,55 @@
+"""Tests for the shared CLI result helpers."""
+from CelebiChrono.celebi_cli._result import handle_result
+
+
+def test_handle_result_keeps_order_with_print(capsys):
+    print("before")
+    handle_result("héllo")
+    print("after")
+    assert capsys.readouterr().out == "before\nhéllo\nafter\n"
+
+
+def test_handle_result_skips_empty_output(capsys):
+    handle_result(None)
+    handle_result("")
+    assert capsys.readouterr().out == ""
+
+
+def test_format_output_uses_colored_renderer():
+    from CelebiChrono.celebi_cli.utils import format_output
+    from CelebiChrono.utils.message import Message
+    message = Message()
+    message.add("done", "success")
+    assert format_output(message) == message.colored()
+    assert format_output(42) == "42"
+    assert format_output(None) == ""
+
+
+def test_handle_result_writes_to_text_only_streams(monkeypatch):
+    import io
+    stream = io.StringIO()
+    monkeypatch.setattr("sys.stdout", stream)
+    handle_result("plain")
+    assert stream.getvalue() == "plain\n"
+
+
+def test_handle_result_streams_message_chunks(capsys):
+    from CelebiChrono.utils.message import Message
+    message = Message()
+    message.add("first\n", "info")
+    message.add("second", "warning")
+    assert "".join(message.colored_iter()) == message.colored()
+    handle_result(message)
+    assert capsys.readouterr().out == message.colored() + "\n"
+    handle_result(Message())
+    assert capsys.readouterr().out == ""
+
+
+def test_write_colored_matches_print(capsys):
+    from CelebiChrono.utils.message import Message
+    message = Message()
+    message.add("first\n", "info")
+    message.add("second", "warning")
+    message.write_colored()
+    Message().write_colored()
+    assert capsys.readouterr().out == message.colored() + "\n" + "\n"
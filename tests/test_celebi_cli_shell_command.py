@@ -0,0 +1,50 @@
+"""Tests for the shell_command helper."""
+from unittest.mock import MagicMock, patch
+
+import click
+from click.testing import CliRunner
+
+from CelebiChrono.celebi_cli.utils import shell, shell_command
+
+
+pair_command = shell_command("pair", "pair", "Forward two arguments.", "first", "second")
+
+
+def test_shell_command_forwards_arguments_in_order():
+    fake_shell = MagicMock()
+    fake_shell.pair.return_value = "done"
+    with patch("CelebiChrono.celebi_cli.utils.shell_module", return_value=fake_shell):
+        result = CliRunner().invoke(pair_command, ["a", "b"])
+    fake_shell.pair.assert_called_once_with("a", "b")
+    assert result.exit_code == 0
+    assert result.output == "done\n"
+    assert "Forward two arguments." in CliRunner().invoke(pair_command, ["--help"]).output
+
+
+def test_shell_command_reports_failures():
+    fake_shell = MagicMock()
+    fake_shell.pair.side_effect = RuntimeError("boom")
+    with patch("CelebiChrono.celebi_cli.utils.shell_module", return_value=fake_shell):
+        result = CliRunner().invoke(pair_command, ["a", "b"])
+    assert result.exit_code == 1
+    assert "Error: Command failed: boom" in result.output
+
+
+def test_shell_command_accepts_click_arguments():
+    command = shell_command(
+        "log", "error_log", "Show a log.",
+        click.Argument(["index"], type=int, default=0, required=False))
+    fake_shell = MagicMock()
+    fake_shell.error_log.return_value = "log"
+    with patch("CelebiChrono.celebi_cli.utils.shell_module", return_value=fake_shell):
+        CliRunner().invoke(command, [])
+        CliRunner().invoke(command, ["3"])
+    assert [call.args for call in fake_shell.error_log.call_args_list] == [(0,), (3,)]
+
+
+def test_shell_proxy_resolves_attributes_on_access():
+    fake_shell = MagicMock()
+    with patch("CelebiChrono.celebi_cli.utils.shell_module",
+               return_value=fake_shell) as shell_module:
+        assert shell.ls is fake_shell.ls
+    shell_module.assert_called_once_with()
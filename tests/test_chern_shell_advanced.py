@@ -0,0 +1,34 @@
+"""Chern shell advanced command tests."""
+import os
+from unittest.mock import patch
+
+from CelebiChrono.interface.chern_shell import commands_advanced
+from CelebiChrono.interface.chern_shell.commands_advanced import AdvancedCommands
+from CelebiChrono.utils.message import Message
+
+
+def test_system_shell_survives_missing_shell(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SHELL", "/nonexistent/shell")
+    with patch.object(commands_advanced.subprocess, "call",
+                      side_effect=FileNotFoundError("no such file")):
+        AdvancedCommands().do_system_shell("")
+    assert os.getcwd() == str(tmp_path)
+    assert "Error entering system shell: no such file" in capsys.readouterr().out
+
+
+def test_workaround_returns_to_cwd_when_shell_fails(tmp_path, monkeypatch, capsys):
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    monkeypatch.chdir(tmp_path)
+    preshell = Message()
+    preshell.data["path"] = str(workspace)
+    with patch.object(commands_advanced.shell, "workaround_preshell", return_value=preshell), \
+         patch.object(commands_advanced.shell, "workaround_postshell") as postshell, \
+         patch.object(commands_advanced.subprocess, "call",
+                      side_effect=FileNotFoundError("no such file")), \
+         patch("builtins.input", return_value="n"):
+        AdvancedCommands().do_workaround("")
+    assert os.getcwd() == str(tmp_path)
+    assert "Error: unable to start" in capsys.readouterr().out
+    postshell.assert_not_called()
@@ -0,0 +1,31 @@
+"""Shell import_file tests."""
+import os
+
+from CelebiChrono.interface.shell_modules import file_operations
+from CelebiChrono.kernel.vobject import VObject
+from CelebiChrono.utils import metadata
+
+
+def _make_task(path):
+    os.makedirs(os.path.join(path, ".celebi"))
+    config = metadata.ConfigFile(os.path.join(path, ".celebi", "config.json"))
+    config.write_variable("object_type", "task")
+    return VObject(str(path))
+
+
+def test_import_directory_skips_broken_symlink(tmp_path, monkeypatch):
+    task = _make_task(tmp_path / "task")
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "a.txt").write_text("a", encoding="utf-8")
+    (source / "sub").mkdir()
+    (source / "sub" / "b.txt").write_text("b", encoding="utf-8")
+    os.symlink(source / "missing", source / "broken")
+    monkeypatch.setattr(file_operations.MANAGER, "current_object", lambda: task)
+
+    result = file_operations.import_file(f"{source}/*")
+
+    assert ("File does not exist.", "warning") in result.messages
+    assert (tmp_path / "task" / "a.txt").read_text(encoding="utf-8") == "a"
+    assert (tmp_path / "task" / "sub" / "b.txt").read_text(encoding="utf-8") == "b"
+    assert not os.path.lexists(tmp_path / "task" / "broken")